@@ -0,0 +1,234 @@
+"""
+API 응답 필드 선택
+저장하는 채널 정보와 켜져 있는 필터가 실제로 읽는 응답 경로만 적어 두고,
+그 경로에서 요청할 part와 fields(부분 응답) 파라미터를 만듭니다.
+읽는 필드가 바뀌면 아래 경로 목록만 고치면 되고, 필요 없는 part(예: brandingSettings)는 요청하지 않습니다.
+
+    selection = channel_selection(uploads=True)
+    youtube.channels().list(part=selection.part, fields=selection.fields, id=...)
+"""
+
+import json
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+
+# 저장용 채널 정보 필드 → channels.list 응답 항목의 경로 (build_channel_info가 읽는 값)
+CHANNEL_SOURCES = {
+    'channel_id': 'id',
+    'title': 'snippet/title',
+    'description': 'snippet/description',
+    'custom_url': 'snippet/customUrl',
+    'published_at': 'snippet/publishedAt',
+    'country': 'snippet/country',
+    'thumbnail': 'snippet/thumbnails/high/url',
+    'subscriber_count': 'statistics/subscriberCount',
+    'video_count': 'statistics/videoCount',
+    'view_count': 'statistics/viewCount',
+}
+
+# 통계 갱신(refresh)에 필요한 필드
+STATISTICS_SOURCES = ('subscriber_count', 'video_count', 'view_count')
+
+# 최근 업로드일 조회(활동 필터, 통계 갱신)에 필요한 uploads 플레이리스트 ID
+UPLOADS_PLAYLIST_PATH = 'contentDetails/relatedPlaylists/uploads'
+
+# 검색 결과에서 읽는 값 (채널 ID, 진행 상황 출력용 제목, 설명은 channels.list에서 다시 받음)
+SEARCH_PATHS = ('id/channelId', 'snippet/title')
+
+# 최근 업로드 영상에서 읽는 값
+UPLOAD_DATE_PATHS = ('snippet/publishedAt',)
+
+# 필드를 고르지 않았을 때의 요청 part (--debug-fields에서 줄어든 크기를 비교할 기준)
+REFERENCE_PARTS = {
+    'search': 'id,snippet',
+    'channels': 'snippet,statistics,contentDetails,brandingSettings',
+    'playlistItems': 'snippet',
+}
+
+ApiSelection = namedtuple('ApiSelection', ['part', 'fields'])
+
+
+def _field_tree(paths):
+    """'a/b/c' 경로 목록 → {'a': {'b': {'c': {}}}}"""
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('/'):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _render(tree):
+    """경로 트리 → fields 문법 ('a/b', 'a(b,c)')"""
+    rendered = []
+    for name, children in tree.items():
+        if not children:
+            rendered.append(name)
+        elif len(children) == 1:
+            rendered.append(f"{name}/{_render(children)}")
+        else:
+            rendered.append(f"{name}({_render(children)})")
+    return ','.join(rendered)
+
+
+def build_selection(item_paths, top_level=()):
+    """
+    응답 항목에서 읽는 경로로 part와 fields 만들기
+
+    Args:
+        item_paths (iterable): items 안의 경로 (예: 'snippet/title')
+        top_level (iterable): items 밖에서 읽는 필드 (예: 'nextPageToken', 'etag')
+
+    Returns:
+        ApiSelection: (part, fields)
+    """
+    item_paths = list(dict.fromkeys(item_paths))
+    # 항목의 id 값은 항상 오므로 part에 넣지 않음 (search 결과의 id/channelId는 id part 필요)
+    parts = dict.fromkeys(path.split('/')[0] for path in item_paths if path != 'id')
+    fields = list(top_level) + [f"items({_render(_field_tree(item_paths))})"]
+    return ApiSelection(','.join(parts), ','.join(fields))
+
+
+@lru_cache(maxsize=None)
+def channel_selection(uploads=True):
+    """
+    채널 상세 정보 요청 (channels.list)
+
+    Args:
+        uploads (bool): 최근 업로드일을 조회하는지 (활동 필터가 켜져 있을 때만 contentDetails 요청)
+
+    Returns:
+        ApiSelection: (part, fields)
+    """
+    paths = list(CHANNEL_SOURCES.values())
+    if uploads:
+        paths.append(UPLOADS_PLAYLIST_PATH)
+    return build_selection(paths)
+
+
+@lru_cache(maxsize=None)
+def statistics_selection():
+    """통계 갱신 요청 (channels.list, ETag로 바뀌었는지 확인하고 uploads 플레이리스트로 업로드일 조회)"""
+    paths = ([CHANNEL_SOURCES['channel_id']] + [CHANNEL_SOURCES[field] for field in STATISTICS_SOURCES] +
+             [UPLOADS_PLAYLIST_PATH])
+    return build_selection(paths, top_level=('etag',))
+
+
+@lru_cache(maxsize=None)
+def search_selection():
+    """채널 검색 요청 (search.list)"""
+    return build_selection(SEARCH_PATHS, top_level=('nextPageToken',))
+
+
+@lru_cache(maxsize=None)
+def upload_date_selection():
+    """최근 업로드 영상 요청 (playlistItems.list)"""
+    return build_selection(UPLOAD_DATE_PATHS)
+
+
+def reference_params(endpoint, params):
+    """
+    필드를 고르지 않은 같은 요청의 파라미터 (fields 없음, part는 REFERENCE_PARTS)
+
+    Args:
+        endpoint (str): API 엔드포인트 이름
+        params (dict): 실제 요청 파라미터
+
+    Returns:
+        dict: 비교용 요청 파라미터
+    """
+    reference = {name: value for name, value in params.items() if name != 'fields'}
+    reference['part'] = REFERENCE_PARTS.get(endpoint, reference.get('part'))
+    return reference
+
+
+def payload_size(response):
+    """응답 본문 크기 (JSON으로 직렬화한 바이트 수)"""
+    return len(json.dumps(response, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+class PayloadStats:
+    """
+    엔드포인트별 응답 크기와 필드 선택으로 줄어든 크기 (--debug-fields)
+    엔드포인트마다 한 번, 필드를 고르지 않은 같은 요청을 보내서 크기 비율을 재고 나머지 응답에 적용해 추정합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}  # {엔드포인트: 크기 통계}
+
+    def _stats_for(self, endpoint):
+        """엔드포인트 통계 (잠금을 잡은 상태에서 호출)"""
+        return self._endpoints.setdefault(endpoint, {
+            'requests': 0, 'bytes': 0, 'sampled': False, 'sample_bytes': 0, 'sample_full_bytes': 0,
+        })
+
+    def record(self, endpoint, response):
+        """
+        필드를 골라서 받은 응답 한 번 기록
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+            response (dict): API 응답
+        """
+        size = payload_size(response)
+        with self._lock:
+            stats = self._stats_for(endpoint)
+            stats['requests'] += 1
+            stats['bytes'] += size
+
+    def claim_sample(self, endpoint):
+        """
+        이 엔드포인트의 비교 요청을 보낼 차례인지 (엔드포인트마다 처음 한 번만 True)
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+
+        Returns:
+            bool: True면 비교 요청을 보내고 record_sample()로 기록
+        """
+        with self._lock:
+            stats = self._stats_for(endpoint)
+            if stats['sampled']:
+                return False
+            stats['sampled'] = True
+            return True
+
+    def record_sample(self, endpoint, response, reference):
+        """
+        같은 요청의 필드를 고른 응답과 고르지 않은 응답 크기 기록
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+            response (dict): 필드를 골라서 받은 응답
+            reference (dict): 필드를 고르지 않고 받은 응답
+        """
+        with self._lock:
+            stats = self._stats_for(endpoint)
+            stats['sample_bytes'] += payload_size(response)
+            stats['sample_full_bytes'] += payload_size(reference)
+
+    def summary(self):
+        """
+        엔드포인트별 응답 크기
+
+        Returns:
+            dict: {엔드포인트: {'requests', 'bytes', 'full_bytes', 'saved_bytes', 'saved_ratio'}}
+                  (full_bytes는 필드를 고르지 않았을 때의 추정 크기, 비교 요청이 없으면 None)
+        """
+        with self._lock:
+            result = {}
+            for endpoint, stats in sorted(self._endpoints.items()):
+                full_bytes = None
+                if stats['sample_bytes']:
+                    full_bytes = round(stats['bytes'] * stats['sample_full_bytes'] / stats['sample_bytes'])
+                result[endpoint] = {
+                    'requests': stats['requests'],
+                    'bytes': stats['bytes'],
+                    'full_bytes': full_bytes,
+                    'saved_bytes': None if full_bytes is None else full_bytes - stats['bytes'],
+                    'saved_ratio': None if not full_bytes else round(1 - stats['bytes'] / full_bytes, 3),
+                }
+            return result
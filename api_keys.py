@@ -0,0 +1,222 @@
+"""
+YouTube API 키 풀
+여러 API 키를 등록해 두고, 남은 할당량이 가장 많은 키로 요청을 분배합니다.
+키가 quotaExceeded를 반환하면 그날은 더 이상 사용하지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from quota import QUOTA_COSTS, QuotaExhausted, quota_day
+
+
+def load_api_keys_from_env():
+    """
+    환경 변수에서 API 키 목록 읽기
+    (YOUTUBE_API_KEYS=키1,키2,... 와 YOUTUBE_API_KEY=키 를 모두 지원)
+
+    Returns:
+        list: 중복을 제거한 API 키 리스트
+    """
+    keys = []
+    for value in (os.getenv('YOUTUBE_API_KEYS', ''), os.getenv('YOUTUBE_API_KEY', '')):
+        for key in value.split(','):
+            key = key.strip()
+            if key and key != 'YOUR_ACTUAL_API_KEY_HERE' and key not in keys:
+                keys.append(key)
+    return keys
+
+
+class ApiKey:
+    def __init__(self, key, client_factory, daily_budget):
+        """
+        API 키 하나의 클라이언트와 사용량
+
+        Args:
+            key (str): API 키
+            client_factory (callable): API 키를 받아 YouTube API 클라이언트를 만드는 함수
+                                       (클라이언트는 이 키로 처음 요청할 때 만듦)
+            daily_budget (int): 이 키의 하루 할당량 (units)
+        """
+        self.key = key
+        self.client_factory = client_factory
+        self.daily_budget = daily_budget
+        self.used = 0
+        self.exhausted = False
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """이 키로 만든 YouTube API 클라이언트 (처음 사용할 때 만듦)"""
+        with self._client_lock:
+            if self._client is None:
+                self._client = self.client_factory(self.key)
+            return self._client
+
+    @property
+    def label(self):
+        """출력/저장용 키 식별자 (키 전체를 노출하지 않음)"""
+        return f"...{self.key[-4:]}"
+
+    @property
+    def fingerprint(self):
+        """사용량 파일에 저장할 키 해시"""
+        return hashlib.sha256(self.key.encode('utf-8')).hexdigest()[:16]
+
+    @property
+    def remaining(self):
+        """오늘 남은 units"""
+        if self.exhausted:
+            return 0
+        return max(0, self.daily_budget - self.used)
+
+
+class ApiKeyPool:
+    def __init__(self, api_keys, client_factory, per_key_budget=10000, state_file='api_key_usage.json'):
+        """
+        API 키 풀 초기화
+
+        Args:
+            api_keys (list): API 키 리스트
+            client_factory (callable): API 키를 받아 YouTube 클라이언트를 만드는 함수 (키마다 처음 사용할 때 호출)
+            per_key_budget (int): 키 하나의 하루 할당량 (units)
+            state_file (str): 키별 오늘 사용량 저장 파일 (None이면 저장하지 않음)
+        """
+        if not api_keys:
+            raise ValueError("API 키가 하나 이상 필요합니다")
+
+        self.keys = [ApiKey(key, client_factory, per_key_budget) for key in api_keys]
+        self.state_file = state_file
+        self.day = quota_day()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 저장 순서 보장 (여러 스레드가 같은 임시 파일을 쓰지 않도록)
+        self._load()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _load(self):
+        """저장된 오늘 키별 사용량 불러오기"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️  API 키 사용량 파일 로드 실패: {e}")
+            return
+
+        if state.get('day') != self.day:
+            return
+
+        saved = state.get('keys', {})
+        for api_key in self.keys:
+            usage = saved.get(api_key.fingerprint)
+            if usage:
+                api_key.used = usage.get('used', 0)
+                api_key.exhausted = usage.get('exhausted', False)
+
+    def save(self):
+        """오늘 키별 사용량 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.state_file:
+            return
+
+        # 상태를 읽고 파일을 교체할 때까지 다른 저장이 끼어들지 않도록 (키 선택은 막지 않음)
+        with self._save_lock:
+            with self._lock:
+                state = {
+                    'day': self.day,
+                    'keys': {
+                        api_key.fingerprint: {
+                            'label': api_key.label,
+                            'used': api_key.used,
+                            'exhausted': api_key.exhausted,
+                        }
+                        for api_key in self.keys
+                    }
+                }
+
+            temp_file = f"{self.state_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.state_file)
+
+    def _roll_over(self):
+        """날짜가 바뀌었으면 모든 키 초기화 (잠금을 잡은 상태에서 호출)"""
+        today = quota_day()
+        if today != self.day:
+            self.day = today
+            for api_key in self.keys:
+                api_key.used = 0
+                api_key.exhausted = False
+
+    def acquire(self, endpoint):
+        """
+        남은 할당량이 가장 많은 키를 골라 호출 비용 차감
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+
+        Returns:
+            ApiKey: 이번 호출에 사용할 키
+
+        Raises:
+            QuotaExhausted: 모든 키의 할당량이 소진된 경우
+        """
+        cost = QUOTA_COSTS.get(endpoint, 1)
+
+        with self._lock:
+            self._roll_over()
+            candidates = [api_key for api_key in self.keys if api_key.remaining >= cost]
+            if not candidates:
+                raise QuotaExhausted(f"모든 API 키({len(self.keys)}개)의 할당량이 소진되었습니다")
+
+            api_key = max(candidates, key=lambda k: k.remaining)
+            api_key.used += cost
+
+        # 검색은 비용이 크므로 바로 저장
+        if endpoint == 'search':
+            self.save()
+
+        return api_key
+
+    def retire(self, api_key):
+        """
+        quotaExceeded를 반환한 키를 오늘 하루 사용 중지
+
+        Args:
+            api_key (ApiKey): 사용 중지할 키
+        """
+        with self._lock:
+            if api_key.exhausted:
+                return
+            api_key.exhausted = True
+        print(f"  🔑 API 키 {api_key.label} 할당량 소진 - 다른 키로 전환 (남은 키 {self.available_count}개)")
+        self.save()
+
+    @property
+    def available_count(self):
+        """오늘 아직 사용할 수 있는 키 수"""
+        return sum(1 for api_key in self.keys if not api_key.exhausted)
+
+    def usage(self):
+        """
+        키별 사용량
+
+        Returns:
+            list: [{'label', 'used', 'daily_budget', 'exhausted'}, ...]
+        """
+        with self._lock:
+            return [
+                {
+                    'label': api_key.label,
+                    'used': api_key.used,
+                    'daily_budget': api_key.daily_budget,
+                    'exhausted': api_key.exhausted,
+                }
+                for api_key in self.keys
+            ]
@@ -0,0 +1,125 @@
+"""
+크롤링 전체 과정 성능 측정
+실제 API 대신 fake_youtube로 검색 → 상세 조회 → 필터 → 저장까지 crawl()을 그대로 실행합니다.
+응답 지연과 오류 비율을 바꿔 가며 처리량(채널/초)과 요청 수를 측정합니다 (할당량 사용 없음, 임시 폴더 사용).
+
+실행:
+    python benchmarks/bench_crawl.py [--scales 1,10] [--keywords 5] [--latency 0.05] [--error-rate 0.02]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_utils import add_report_arguments, finish, parse_scales  # noqa: E402
+from fake_youtube import FakeYouTube  # noqa: E402
+from api_fields import PayloadStats  # noqa: E402
+from api_keys import ApiKeyPool  # noqa: E402
+from quota import QuotaTracker  # noqa: E402
+from youtube_channel_crawler import YouTubeChannelCrawler  # noqa: E402
+
+
+def run_crawl(fake, keywords, args):
+    """
+    키워드 목록을 main()과 같은 방식으로 수집
+
+    Returns:
+        tuple: (걸린 시간(초), 수집한 채널 수, 크롤러)
+    """
+    crawler = YouTubeChannelCrawler(
+        None,
+        max_workers=args.upload_workers,
+        requests_per_second=None,
+        quota=QuotaTracker(10 ** 9, state_file=None),
+        max_retries=args.max_retries,
+        key_pool=ApiKeyPool(['bench-key'], client_factory=fake.client_factory, per_key_budget=10 ** 9,
+                            state_file=None),
+        retry_delay=args.retry_delay,
+        payload_stats=PayloadStats() if args.debug_fields else None
+    )
+
+    def crawl_keyword(keyword):
+        _, _, accepted = crawler.crawl(
+            keyword,
+            max_results=args.max_results,
+            korean_only=True,
+            contactable_only=True,
+            # 활동 필터를 켜면 최근 업로드일(playlistItems)도 조회
+            last_upload_months=1200 if args.activity else None,
+            max_search_attempts=args.max_search_attempts,
+            storage='jsonl'
+        )
+        return accepted
+
+    started = time.perf_counter()
+    # crawl()의 진행 상황 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            accepted = sum(executor.map(crawl_keyword, keywords))
+    return time.perf_counter() - started, accepted, crawler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤링 전체 과정 성능 측정 (가짜 API 사용)')
+    parser.add_argument('--scales', default='1,10', help='가짜 API의 채널 수 배수 (쉼표로 구분)')
+    parser.add_argument('--keywords', type=int, default=5, help='수집할 키워드 수')
+    parser.add_argument('--max-results', type=int, default=50, help='키워드당 목표 채널 수')
+    parser.add_argument('--max-search-attempts', type=int, default=5, help='키워드당 최대 검색 횟수')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 수집할 키워드 수')
+    parser.add_argument('--upload-workers', type=int, default=8, help='최근 업로드일 동시 조회 스레드 수')
+    parser.add_argument('--activity', action='store_true', help='활동 필터를 켜서 최근 업로드일도 조회')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청마다 기다리는 시간 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='latency에 더하는 최대 무작위 지연 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='요청이 실패할 확률 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='넣을 오류의 HTTP 상태 코드')
+    parser.add_argument('--max-retries', type=int, default=5, help='일시적인 오류 재시도 횟수')
+    parser.add_argument('--retry-delay', type=float, default=0.01, help='첫 재시도 최대 대기 시간 (초)')
+    parser.add_argument('--debug-fields', action='store_true', help='엔드포인트별 응답 크기와 필드 선택으로 줄어든 크기 출력')
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    keywords = [f'벤치마크 키워드 {i}' for i in range(1, args.keywords + 1)]
+    results = {}
+    print(f"키워드 {args.keywords}개, 목표 {args.max_results}개/키워드, 작업자 {args.workers}명, "
+          f"지연 {args.latency * 1000:.0f}+{args.jitter * 1000:.0f} ms, 오류 {args.error_rate:.1%}")
+
+    original_directory = os.getcwd()
+    for scale in parse_scales(args.scales):
+        fake = FakeYouTube.from_fixtures(
+            scale=scale, latency=args.latency, jitter=args.jitter,
+            error_rate=args.error_rate, error_status=args.error_status
+        )
+        with tempfile.TemporaryDirectory(prefix='bench_crawl_') as directory:
+            os.chdir(directory)
+            try:
+                elapsed, accepted, crawler = run_crawl(fake, keywords, args)
+            finally:
+                os.chdir(original_directory)
+
+        report = crawler.metrics.report()
+        requests = ', '.join(f"{endpoint} {count}" for endpoint, count in sorted(fake.requests.items()))
+        print(f"\n채널 {len(fake.records)}개 (배수 {scale})")
+        print(f"  걸린 시간: {elapsed:.2f}초, 수집 {accepted}개 ({accepted / elapsed:.1f} 채널/초)")
+        print(f"  요청: {requests} (오류 주입 {fake.injected_errors}회)")
+        print(f"  할당량: {report['totals']['units']} units (수집 채널당 {report['totals']['units_per_accepted']} units)")
+        for endpoint, summary in report['endpoints'].items():
+            latency = summary['latency_ms']
+            print(f"  {endpoint:15s} p50 {latency['p50']} ms, p95 {latency['p95']} ms, p99 {latency['p99']} ms")
+        if crawler.payload_stats is not None:
+            for endpoint, sizes in crawler.payload_stats.summary().items():
+                print(f"  {endpoint:15s} 응답 {sizes['bytes'] / 1024:.1f} KB "
+                      f"(선택 전 약 {sizes['full_bytes'] / 1024:.1f} KB, {sizes['saved_ratio']:.0%} 절약)")
+        results[f'crawl[{scale}]'] = elapsed
+
+    return finish(results, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
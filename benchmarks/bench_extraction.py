@@ -0,0 +1,149 @@
+"""
+연락처 추출 성능 비교
+저장된 *_youtube_channels_*.json 파일의 채널 설명으로 기존 방식(호출마다 정규표현식 컴파일, 패턴마다 findall)과
+contact_extractor를 비교하고, 두 결과가 완전히 같은지 확인합니다.
+
+실행:
+    python benchmarks/bench_extraction.py [--repeat 20] [--scales 1,10]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import contact_extractor  # noqa: E402
+from bench_utils import add_report_arguments, finish, parse_scales  # noqa: E402
+
+
+def legacy_is_korean_text(text):
+    """기존 방식: 호출마다 패턴 컴파일"""
+    if not text:
+        return False
+    korean_pattern = re.compile('[가-힣]+')
+    return bool(korean_pattern.search(text))
+
+
+def legacy_extract_contact_info(text):
+    """기존 방식: 패턴마다 설명 전체를 findall"""
+    contact_info = {'email': '', 'phone': '', 'kakao': '', 'other_links': []}
+    if not text:
+        return contact_info
+
+    emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    if emails:
+        contact_info['email'] = emails[0]
+
+    for pattern in [
+        r'010[-\s]?\d{4}[-\s]?\d{4}',
+        r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}',
+        r'\+82[-\s]?10[-\s]?\d{4}[-\s]?\d{4}'
+    ]:
+        matches = re.findall(pattern, text)
+        if matches:
+            contact_info['phone'] = matches[0]
+            break
+
+    for pattern in [
+        r'카카오[톡]?[:\s]+([a-zA-Z0-9_-]+)',
+        r'kakao[talk]?[:\s]+([a-zA-Z0-9_-]+)',
+    ]:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            contact_info['kakao'] = matches[0]
+            break
+
+    urls = re.findall(r'https?://[^\s<>"\)]+|www\.[^\s<>"\)]+', text)
+    exclude_domains = ['youtube.com', 'youtu.be', 'instagram.com', 'twitter.com', 'facebook.com', 'x.com']
+    contact_info['other_links'] = [
+        url for url in urls if not any(domain in url.lower() for domain in exclude_domains)
+    ][:3]
+
+    return contact_info
+
+
+def legacy_analyze(title, description, country):
+    """기존 build_channel_info의 연락처/한국어 계산"""
+    contact_info = legacy_extract_contact_info(description)
+    return {
+        'is_korean': country == 'KR' or legacy_is_korean_text(description) or legacy_is_korean_text(title),
+        'email': contact_info['email'] or 'N/A',
+        'phone': contact_info['phone'] or 'N/A',
+        'kakao': contact_info['kakao'] or 'N/A',
+        'other_links': ', '.join(contact_info['other_links']) if contact_info['other_links'] else 'N/A',
+        'contactable': any([
+            contact_info['email'],
+            contact_info['phone'],
+            contact_info['kakao'],
+            contact_info['other_links']
+        ]),
+    }
+
+
+def load_samples(directory):
+    """저장된 채널 파일에서 (제목, 설명, 국가) 목록 읽기"""
+    samples = []
+    for path in sorted(glob.glob(os.path.join(directory, '*_youtube_channels_*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in json.load(f):
+                country = record.get('country')
+                samples.append((record['title'], record['description'], None if country == 'N/A' else country))
+    return samples
+
+
+def measure(analyze, samples, repeat):
+    """전체 샘플을 repeat번 처리하는 데 걸린 가장 짧은 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for title, description, country in samples:
+            analyze(title, description, country)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='연락처 추출 성능 비교')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수 (가장 빠른 결과 사용)')
+    parser.add_argument('--directory', default=ROOT, help='채널 파일이 있는 폴더')
+    parser.add_argument('--scales', default='1', help='채널 설명을 몇 배로 늘려서 측정할지 (쉼표로 구분)')
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    samples = load_samples(args.directory)
+    if not samples:
+        print(f"⚠️  {args.directory}에 *_youtube_channels_*.json 파일이 없습니다")
+        return 1
+
+    # 결과가 완전히 같은지 먼저 확인
+    mismatches = 0
+    for title, description, country in samples:
+        if legacy_analyze(title, description, country) != contact_extractor.analyze_channel_text(title, description, country):
+            mismatches += 1
+
+    results = {}
+    for scale in parse_scales(args.scales):
+        scaled = samples * scale
+        legacy = measure(legacy_analyze, scaled, args.repeat)
+        current = measure(contact_extractor.analyze_channel_text, scaled, args.repeat)
+        results[f'extraction[{len(scaled)}]'] = current
+
+        print(f"채널 설명: {len(scaled)}개, 반복 {args.repeat}회 중 최단 시간")
+        print(f"  기존 방식: {legacy * 1000:.2f} ms ({legacy / len(scaled) * 1e6:.1f} µs/채널)")
+        print(f"  contact_extractor: {current * 1000:.2f} ms ({current / len(scaled) * 1e6:.1f} µs/채널)")
+        print(f"  속도 향상: {legacy / current:.2f}배")
+    print(f"  결과 일치: {'예' if mismatches == 0 else f'아니오 ({mismatches}개 다름)'}")
+
+    return 1 if mismatches else finish(results, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+시작 시간 성능 측정
+새 파이썬 프로세스에서 크롤러 모듈을 불러오는 시간과, 정적 discovery 문서로 클라이언트를 만들어
+첫 검색 요청을 끝내기까지의 시간을 측정합니다 (cron이나 작업자 프로세스를 여러 개 띄울 때의 비용).
+첫 요청은 실제 googleapiclient 요청 객체를 만들고, 응답만 네트워크 대신 미리 만든 본문으로 돌려줍니다.
+
+실행:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_utils import ROOT, add_report_arguments, finish  # noqa: E402
+
+# 자식 프로세스에서 실행하는 코드 (결과를 JSON 한 줄로 출력)
+CHILD_SCRIPT = r'''
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import youtube_channel_crawler as crawler_module
+imported = time.perf_counter()
+
+from api_keys import ApiKeyPool
+from http_transport import HttpPool
+
+BODY = json.dumps({'items': [{'id': {'channelId': 'UC0'}, 'snippet': {'title': 't', 'description': ''}}]}).encode()
+
+class LocalHttp:
+    """네트워크 대신 미리 만든 응답을 돌려주는 연결"""
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        import httplib2  # 실제 연결과 마찬가지로 첫 요청 때 불러옴
+        return httplib2.Response({'status': 200}), BODY
+
+crawler = crawler_module.YouTubeChannelCrawler(
+    None, requests_per_second=None,
+    key_pool=ApiKeyPool(['bench-key'], client_factory=crawler_module.build_youtube_client, state_file=None),
+    transport=HttpPool(factory=LocalHttp)
+)
+created = time.perf_counter()
+crawler.search_channels('bench', max_results=1)
+finished = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'crawler': created - imported,
+    'first_request': finished - created,
+    'total': finished - started,
+}))
+'''
+
+
+def run_child():
+    """
+    자식 프로세스 한 번 실행
+
+    Returns:
+        dict: {'import', 'crawler', 'first_request', 'total'} (초)
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, ROOT],
+        check=True, capture_output=True, text=True, cwd=ROOT
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 시간 성능 측정 (모듈 로드, 첫 API 요청까지)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (가장 빠른 결과 사용)')
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    runs = [run_child() for _ in range(max(1, args.repeat))]
+    results = {}
+    print(f"새 프로세스 {len(runs)}회 실행 중 최단 시간")
+    for name in ('import', 'crawler', 'first_request', 'total'):
+        seconds = min(run[name] for run in runs)
+        results[f'startup_{name}'] = seconds
+        print(f"  {name:15s} {seconds * 1000:8.1f} ms")
+
+    return finish(results, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+저장/검색/내보내기 성능 측정
+저장된 채널 파일로 만든 채널을 여러 규모(기본 1천, 1만 개)로 늘려서 JSON 배열/JSON Lines 읽기·쓰기,
+검색 DB 반영과 검색, 분석용 내보내기에 걸리는 시간을 측정합니다 (API 호출 없음, 임시 폴더 사용).
+파일 전체를 읽었을 때 채널 하나가 차지하는 메모리(dict와 ChannelRecord)도 출력합니다.
+
+실행:
+    python benchmarks/bench_storage.py [--scales 1000,10000,100000] [--repeat 3]
+"""
+
+import argparse
+import math
+import os
+import json
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_utils import add_report_arguments, finish, measure, parse_scales  # noqa: E402
+from channel_query import ChannelDatabase  # noqa: E402
+from channel_record import ChannelRecord  # noqa: E402
+from channel_store import (  # noqa: E402
+    JsonlChannelStore, iter_json_array, load_channel_file, load_json_ids, write_json_array
+)
+from exporter import export_channels, parquet_available  # noqa: E402
+from fake_youtube import load_fixture_channels, synthesize_channels  # noqa: E402
+
+# 한 줄씩 추가 기록(매번 fsync)은 느리므로 이 개수만 측정
+APPEND_COUNT = 200
+
+
+def make_records(fixtures, count):
+    """원본 채널을 count개가 되도록 늘리기"""
+    return synthesize_channels(fixtures, math.ceil(count / len(fixtures)))[:count]
+
+
+def memory_per_channel(lines, build):
+    """
+    JSON Lines 줄을 모두 읽어 보관할 때 채널 하나당 메모리 (바이트)
+
+    Args:
+        lines (list): 채널 하나씩의 JSON 문자열
+        build (callable): 읽은 dict로 보관할 객체를 만드는 함수
+    """
+    tracemalloc.start()
+    try:
+        kept = [build(json.loads(line)) for line in lines]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(kept)
+
+
+def bench_scale(records, directory, repeat):
+    """
+    한 규모의 측정
+
+    Returns:
+        dict: {항목 이름: 걸린 시간(초)}
+    """
+    count = len(records)
+    json_path = os.path.join(directory, f'{count}_youtube_channels_bench.json')
+    jsonl_path = os.path.join(directory, f'{count}_youtube_channels_bench.jsonl')
+    db_path = os.path.join(directory, f'{count}_channels.sqlite3')
+    results = {}
+
+    def write_json():
+        with open(json_path, 'w', encoding='utf-8') as f:
+            write_json_array(f, records)
+
+    def ingest():
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        database = ChannelDatabase(db_path)
+        database.ingest_files([jsonl_path])
+        database.close()
+
+    results['json_write'] = measure(write_json, repeat)
+    results['json_stream_read'] = measure(lambda: sum(1 for _ in iter_json_array(json_path)), repeat)
+    results['json_load_ids'] = measure(lambda: load_json_ids(json_path), repeat)
+    results['json_load'] = measure(lambda: load_channel_file(json_path), repeat)
+    results['jsonl_rewrite'] = measure(lambda: JsonlChannelStore(jsonl_path).rewrite(records), repeat)
+    results['jsonl_load_ids'] = measure(lambda: JsonlChannelStore(jsonl_path).load_ids(), repeat)
+    results['jsonl_compact'] = measure(lambda: JsonlChannelStore(jsonl_path).compact(), repeat)
+    results['query_ingest'] = measure(ingest, repeat)
+
+    database = ChannelDatabase(db_path)
+    filters = {'korean': True, 'contactable': True, 'min_subscribers': 10000}
+    results['query_count'] = measure(lambda: database.count(**filters), repeat)
+    results['query_page'] = measure(lambda: database.query(sort='subscribers', limit=20, **filters), repeat)
+    database.close()
+
+    results['export_csv'] = measure(
+        lambda: export_channels(records, os.path.join(directory, f'{count}_export'), 'csv'), repeat
+    )
+    if parquet_available():
+        results['export_parquet'] = measure(
+            lambda: export_channels(records, os.path.join(directory, f'{count}_export'), 'parquet'), repeat
+        )
+
+    return results
+
+
+def bench_append(records, directory):
+    """한 줄씩 추가 기록 (채널 하나마다 flush + fsync)"""
+    store = JsonlChannelStore(os.path.join(directory, 'append_youtube_channels_bench.jsonl'))
+
+    def append():
+        for record in records[:APPEND_COUNT]:
+            store.append(record)
+        store.close()
+
+    return measure(append, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장/검색/내보내기 성능 측정')
+    parser.add_argument('--scales', default='1000,10000', help='측정할 채널 수 (쉼표로 구분)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (가장 빠른 결과 사용)')
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    fixtures = load_fixture_channels()
+    if not fixtures:
+        print("⚠️  260220_youtube_channels_*.json 파일이 없습니다")
+        return 1
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='bench_storage_') as directory:
+        seconds = bench_append(fixtures, directory)
+        results[f'jsonl_append[{APPEND_COUNT}]'] = seconds
+        print(f"한 줄씩 추가 기록: {APPEND_COUNT}개 {seconds * 1000:.1f} ms ({seconds / APPEND_COUNT * 1e6:.0f} µs/채널)")
+
+        for scale in parse_scales(args.scales):
+            records = make_records(fixtures, scale)
+            print(f"\n채널 {scale}개 (반복 {args.repeat}회 중 최단 시간)")
+            for name, seconds in bench_scale(records, directory, args.repeat).items():
+                results[f'{name}[{scale}]'] = seconds
+                print(f"  {name:20s} {seconds * 1000:10.2f} ms ({seconds / scale * 1e6:8.2f} µs/채널)")
+
+            lines = [json.dumps(record, ensure_ascii=False) for record in records]
+            dict_bytes = memory_per_channel(lines, dict)
+            record_bytes = memory_per_channel(lines, ChannelRecord.from_dict)
+            print(f"  메모리 (채널당)       dict {dict_bytes:.0f} B → ChannelRecord {record_bytes:.0f} B "
+                  f"({dict_bytes / record_bytes:.1f}배 작음)")
+
+    return finish(results, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+벤치마크 공통 도구
+측정 결과를 JSON으로 저장하고, 이전에 저장한 결과(기준값)보다 허용 범위 이상 느려진 항목이 있으면
+종료 코드 1로 끝나서 배포 전에 성능 저하를 잡을 수 있게 합니다.
+
+    python benchmarks/bench_storage.py --json baseline.json          # 기준값 저장
+    python benchmarks/bench_storage.py --baseline baseline.json       # 기준값과 비교
+"""
+
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def measure(function, repeat=3):
+    """
+    function을 repeat번 실행한 중 가장 짧은 시간 (초)
+
+    Args:
+        function (callable): 인자 없이 호출할 함수
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 가장 짧은 실행 시간 (초)
+    """
+    best = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def parse_scales(text):
+    """'1000,10000' → [1000, 10000]"""
+    return [int(value) for value in text.split(',') if value.strip()]
+
+
+def add_report_arguments(parser):
+    """결과 저장/기준값 비교 인자 추가 (--json, --baseline, --tolerance)"""
+    parser.add_argument('--json', dest='json_path', help='측정 결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일 (--json으로 저장한 파일)')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.25,
+        help='기준값보다 이 비율 이상 느려지면 실패 (기본값: 0.25 = 25%%)'
+    )
+
+
+def finish(results, args):
+    """
+    측정 결과 저장 및 기준값 비교
+
+    Args:
+        results (dict): {항목 이름: 걸린 시간(초)} (작을수록 좋음)
+        args (argparse.Namespace): add_report_arguments로 추가한 인자
+
+    Returns:
+        int: 종료 코드 (기준값보다 느려진 항목이 있으면 1)
+    """
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 측정 결과 저장: {args.json_path}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    print(f"\n기준값 비교 ({args.baseline}, 허용 {args.tolerance:.0%}):")
+    for name, seconds in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        change = seconds / expected - 1
+        mark = '❌' if change > args.tolerance else '✓'
+        print(f"  {mark} {name:40s} {expected * 1000:10.2f} ms → {seconds * 1000:10.2f} ms ({change:+.0%})")
+        if change > args.tolerance:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\n❌ 성능 저하: {len(regressions)}개 항목")
+        return 1
+    print("\n✓ 성능 저하 없음")
+    return 0
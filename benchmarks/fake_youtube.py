@@ -0,0 +1,382 @@
+"""
+오프라인 벤치마크용 가짜 YouTube Data API
+build('youtube', 'v3') 대신 크롤러에 넣어 search().list, channels().list, playlistItems().list를
+저장된 채널 파일(260220_youtube_channels_*.json)로 만든 채널에서 응답합니다.
+응답 지연과 오류 비율을 지정할 수 있어 할당량이나 네트워크 상태와 무관하게 처리량을 측정할 수 있습니다.
+
+사용:
+    fake = FakeYouTube.from_fixtures(scale=10, latency=0.05, error_rate=0.01)
+    crawler = YouTubeChannelCrawler(None, key_pool=ApiKeyPool(['bench'], client_factory=fake.client_factory,
+                                                              state_file=None))
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from channel_store import find_channel_files, iter_json_array  # noqa: E402
+
+
+# 기본 시드 파일 (저장소에 포함된 수집 결과)
+FIXTURE_PATTERN = '260220_youtube_channels_*'
+
+# 검색어 하나로 받을 수 있는 최대 결과 수 (실제 API도 약 500개에서 끊김)
+MAX_SEARCH_RESULTS = 500
+
+# 오류를 넣을 때 응답 본문에 넣는 사유
+ERROR_REASONS = {
+    403: 'rateLimitExceeded',
+    429: 'rateLimitExceeded',
+    500: 'backendError',
+    503: 'backendError',
+}
+
+
+def load_fixture_channels(directory=ROOT, pattern=FIXTURE_PATTERN):
+    """
+    저장된 채널 파일에서 채널 정보 읽기 (같은 채널은 한 번만)
+
+    Args:
+        directory (str): 채널 파일이 있는 폴더
+        pattern (str): 파일명 패턴 (확장자 제외)
+
+    Returns:
+        list: 채널 정보 리스트 (저장 형식)
+    """
+    json_files, _ = find_channel_files(pattern, directory=directory)
+    channels = {}
+    for path in json_files:
+        for record in iter_json_array(path):
+            channels.setdefault(record['channel_id'], record)
+    return list(channels.values())
+
+
+def synthesize_channels(records, scale=1):
+    """
+    채널 정보를 scale배로 늘리기 (복제본은 ID와 통계만 다르고 제목/설명은 원본과 같음)
+
+    Args:
+        records (list): 원본 채널 정보 리스트
+        scale (int): 배수
+
+    Returns:
+        list: 채널 정보 리스트 (원본이 먼저, 복제본은 원본 순서대로 이어짐)
+    """
+    channels = list(records)
+    for copy in range(1, scale):
+        for record in records:
+            clone = dict(record)
+            clone['channel_id'] = f"{record['channel_id']}-{copy}"
+            clone['channel_url'] = f"https://www.youtube.com/channel/{clone['channel_id']}"
+            for field in ('subscriber_count', 'view_count'):
+                if str(record.get(field, 'N/A')).isdigit():
+                    clone[field] = str(int(record[field]) + copy)
+            channels.append(clone)
+    return channels
+
+
+def parse_fields(fields):
+    """
+    fields 파라미터 → 경로 트리 ('items(id,snippet/title)' → {'items': {'id': {}, 'snippet': {'title': {}}}})
+
+    Raises:
+        ValueError: 괄호가 맞지 않는 등 문법 오류
+    """
+    position = 0
+
+    def parse_list():
+        nonlocal position
+        tree = {}
+        while True:
+            node = tree
+            # a/b/c 경로
+            while True:
+                start = position
+                while position < len(fields) and fields[position] not in ',/()':
+                    position += 1
+                name = fields[start:position].strip()
+                if not name:
+                    raise ValueError(f"fields 문법 오류 (위치 {position}): {fields}")
+                node = node.setdefault(name, {})
+                if position < len(fields) and fields[position] == '/':
+                    position += 1
+                    continue
+                break
+            # a(b,c) 하위 선택
+            if position < len(fields) and fields[position] == '(':
+                position += 1
+                for name, child in parse_list().items():
+                    node.setdefault(name, {}).update(child)
+                if position >= len(fields) or fields[position] != ')':
+                    raise ValueError(f"fields 괄호 오류: {fields}")
+                position += 1
+            if position < len(fields) and fields[position] == ',':
+                position += 1
+                continue
+            return tree
+
+    tree = parse_list()
+    if position != len(fields):
+        raise ValueError(f"fields 문법 오류 (위치 {position}): {fields}")
+    return tree
+
+
+def apply_fields(data, tree):
+    """경로 트리에 있는 필드만 남기기 (목록은 항목마다 적용)"""
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [apply_fields(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {name: apply_fields(data[name], child) for name, child in tree.items() if name in data}
+
+
+def _thumbnails(record):
+    """응답의 thumbnails 항목 (크기별 URL)"""
+    url = record.get('thumbnail', '')
+    return {
+        size: {'url': url.replace('s800', f's{width}'), 'width': width, 'height': width}
+        for size, width in (('default', 88), ('medium', 240), ('high', 800))
+    }
+
+
+def _channel_item(record, parts):
+    """저장 형식의 채널 정보 → channels.list 응답 항목 (요청한 part만)"""
+    channel_id = record['channel_id']
+    item = {'kind': 'youtube#channel', 'id': channel_id}
+
+    if 'snippet' in parts:
+        snippet = {
+            'title': record['title'],
+            'description': record['description'],
+            'publishedAt': record['published_at'],
+            'thumbnails': _thumbnails(record),
+        }
+        if record.get('custom_url'):
+            snippet['customUrl'] = record['custom_url']
+        if record.get('country') not in (None, 'N/A'):
+            snippet['country'] = record['country']
+        item['snippet'] = snippet
+
+    if 'statistics' in parts:
+        item['statistics'] = {
+            name: record[field]
+            for field, name in (('subscriber_count', 'subscriberCount'),
+                                ('video_count', 'videoCount'),
+                                ('view_count', 'viewCount'))
+            if record.get(field) not in (None, 'N/A')
+        }
+
+    if 'contentDetails' in parts:
+        item['contentDetails'] = {'relatedPlaylists': {'uploads': 'UU' + channel_id[2:]}}
+
+    if 'brandingSettings' in parts:
+        item['brandingSettings'] = {'channel': {'title': record['title'], 'description': record['description']}}
+
+    return item
+
+
+class FakeRequest:
+    """googleapiclient HttpRequest 대신 쓰는 요청 (execute 때 지연/오류를 넣고 응답)"""
+
+    def __init__(self, backend, endpoint, params):
+        self.backend = backend
+        self.endpoint = endpoint
+        self.params = params
+        self.headers = {}
+        self.uri = f'fake://youtube/v3/{endpoint}'
+
+    def execute(self, http=None, num_retries=0):
+        return self.backend.execute(self)
+
+
+class _FakeResource:
+    def __init__(self, backend, endpoint):
+        self._backend = backend
+        self._endpoint = endpoint
+
+    def list(self, **params):
+        return FakeRequest(self._backend, self._endpoint, params)
+
+
+class FakeYouTube:
+    def __init__(self, channels, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, seed=0):
+        """
+        가짜 API 초기화
+
+        Args:
+            channels (list): 응답할 채널 정보 리스트 (저장 형식)
+            latency (float): 요청마다 기다리는 시간 (초)
+            jitter (float): latency에 더하는 0~jitter초의 무작위 지연
+            error_rate (float): 요청이 오류로 실패할 확률 (0~1)
+            error_status (int): 넣을 오류의 HTTP 상태 코드 (503, 500, 429, 403 등)
+            seed (int): 지연/오류 난수 시드 (같으면 같은 순서로 실패)
+        """
+        self.records = channels
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        self._by_id = {record['channel_id']: record for record in channels}
+        self._by_uploads = {'UU' + record['channel_id'][2:]: record for record in channels}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.requests = {}  # {엔드포인트: 요청 수}
+        self.injected_errors = 0
+        self.not_modified = 0
+
+    @classmethod
+    def from_fixtures(cls, scale=1, directory=ROOT, **options):
+        """
+        저장된 채널 파일로 가짜 API 만들기
+
+        Args:
+            scale (int): 채널 수 배수
+            directory (str): 채널 파일이 있는 폴더
+            **options: FakeYouTube 설정 (latency, jitter, error_rate, error_status, seed)
+
+        Returns:
+            FakeYouTube: 가짜 API
+        """
+        return cls(synthesize_channels(load_fixture_channels(directory), scale), **options)
+
+    def client_factory(self, api_key):
+        """ApiKeyPool의 client_factory로 사용 (모든 키가 같은 가짜 API를 공유)"""
+        return self
+
+    # build('youtube', 'v3') 리소스와 같은 이름
+    def search(self):
+        return _FakeResource(self, 'search')
+
+    def channels(self):
+        return _FakeResource(self, 'channels')
+
+    def playlistItems(self):
+        return _FakeResource(self, 'playlistItems')
+
+    def reset_counts(self):
+        """요청 수 초기화"""
+        with self._lock:
+            self.requests = {}
+            self.injected_errors = 0
+            self.not_modified = 0
+
+    def execute(self, request):
+        """
+        요청 처리 (지연 → 오류 주입 → 응답)
+
+        Raises:
+            HttpError: 오류를 넣은 경우, 또는 ETag가 같아 304인 경우
+        """
+        with self._lock:
+            self.requests[request.endpoint] = self.requests.get(request.endpoint, 0) + 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate and self._random.random() < self.error_rate
+            if fail:
+                self.injected_errors += 1
+
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            reason = ERROR_REASONS.get(self.error_status, 'backendError')
+            content = json.dumps({'error': {
+                'code': self.error_status,
+                'message': 'Injected error',
+                'errors': [{'reason': reason, 'message': 'Injected error'}],
+            }}).encode('utf-8')
+            raise HttpError(httplib2.Response({'status': self.error_status}), content, uri=request.uri)
+
+        params = dict(request.params)
+        fields = params.pop('fields', None)
+        response = getattr(self, '_' + request.endpoint)(**params)
+        etag = hashlib.sha1(json.dumps(response, sort_keys=True).encode('utf-8')).hexdigest()
+        if fields:
+            # 실제 API처럼 fields에 적힌 필드만 응답 (etag도 fields에 있을 때만)
+            tree = parse_fields(fields)
+            response = apply_fields(response, tree)
+            if 'etag' in tree:
+                response['etag'] = etag
+        else:
+            response['etag'] = etag
+
+        if request.headers.get('If-None-Match') == etag:
+            with self._lock:
+                self.not_modified += 1
+            raise HttpError(httplib2.Response({'status': 304}), b'', uri=request.uri)
+        return response
+
+    def _search(self, q, maxResults=5, pageToken=None, order='relevance', **params):
+        """검색어/정렬마다 정해진 순서로 채널 목록을 돌려줌 (pageToken은 시작 위치)"""
+        count = len(self.records)
+        total = min(count, MAX_SEARCH_RESULTS)
+        start = int(pageToken or 0)
+        end = min(total, start + int(maxResults))
+
+        # 검색어와 조건마다 다른 위치에서 시작 (같은 검색어는 항상 같은 결과)
+        key = json.dumps([q, order, sorted(params.items())], ensure_ascii=False, default=str)
+        offset = zlib.crc32(key.encode('utf-8')) % count if count else 0
+
+        items = []
+        for position in range(start, end):
+            record = self.records[(offset + position) % count]
+            items.append({
+                'kind': 'youtube#searchResult',
+                'id': {'kind': 'youtube#channel', 'channelId': record['channel_id']},
+                'snippet': {
+                    'publishedAt': record['published_at'],
+                    'channelId': record['channel_id'],
+                    'title': record['title'],
+                    'description': record['description'][:160],
+                    'thumbnails': _thumbnails(record),
+                    'channelTitle': record['title'],
+                    'liveBroadcastContent': 'none',
+                    'publishTime': record['published_at'],
+                },
+            })
+
+        response = {'kind': 'youtube#searchListResponse', 'items': items,
+                    'pageInfo': {'totalResults': total, 'resultsPerPage': len(items)}}
+        if end < total:
+            response['nextPageToken'] = str(end)
+        return response
+
+    def _channels(self, id, part='snippet', **params):
+        parts = {name.strip() for name in part.split(',')}
+        items = [
+            _channel_item(self._by_id[channel_id], parts)
+            for channel_id in id.split(',') if channel_id in self._by_id
+        ]
+        return {'kind': 'youtube#channelListResponse', 'items': items,
+                'pageInfo': {'totalResults': len(items), 'resultsPerPage': len(items)}}
+
+    def _playlistItems(self, playlistId, **params):
+        record = self._by_uploads.get(playlistId)
+        items = []
+        if record is not None and record.get('last_upload_date'):
+            items.append({'kind': 'youtube#playlistItem', 'snippet': {
+                'publishedAt': record['last_upload_date'],
+                'channelId': record['channel_id'],
+                'title': record['title'],
+                'description': record['description'],
+                'thumbnails': _thumbnails(record),
+                'channelTitle': record['title'],
+                'playlistId': playlistId,
+                'position': 0,
+                'resourceId': {'kind': 'youtube#video', 'videoId': 'video-' + record['channel_id']},
+            }})
+        return {'kind': 'youtube#playlistItemListResponse', 'items': items}
@@ -0,0 +1,277 @@
+"""
+전체 키워드 공통 채널 색인
+지금까지 조회한 모든 채널을 SQLite에 기록하여, 다른 키워드나 다른 날짜에 다시 검색되어도
+상세 정보를 다시 요청하지 않도록 합니다. 채널마다 어떤 키워드로 발견되었는지도 함께 기록합니다.
+메모리의 블룸 필터로 처음 보는 채널은 DB를 조회하지 않고 바로 판단합니다.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from channel_store import JsonlChannelStore, find_channel_files, iter_json_array, keyword_from_filename
+
+
+class BloomFilter:
+    def __init__(self, capacity=100000, error_rate=0.01):
+        """
+        블룸 필터 초기화 (없는 항목은 확실히 없다고, 있는 항목은 아마 있다고 판단)
+
+        Args:
+            capacity (int): 예상 최대 항목 수
+            error_rate (float): 허용 오탐률
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        """항목의 비트 위치 (해시 두 개를 조합하는 double hashing)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        """항목 추가"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class ChannelIndex:
+    def __init__(self, path='channel_index.sqlite3', recheck_days=30):
+        """
+        채널 색인 초기화
+
+        Args:
+            path (str): SQLite 색인 파일 경로
+            recheck_days (int): 필터에서 제외된 채널을 다시 조회하기까지의 기간 (일)
+        """
+        self.path = path
+        self.recheck_days = recheck_days
+
+        self._lock = threading.Lock()
+        self._claims = {}  # {채널 ID: 상세 정보를 조회 중인 키워드} (이번 실행에서만, 키워드 동시 수집용)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS channels ('
+            ' channel_id TEXT PRIMARY KEY,'
+            ' first_seen_at REAL NOT NULL,'
+            ' details_fetched_at REAL,'
+            ' accepted INTEGER NOT NULL DEFAULT 0,'
+            ' reject_reason TEXT)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS channel_keywords ('
+            ' channel_id TEXT NOT NULL,'
+            ' keyword TEXT NOT NULL,'
+            ' found_at REAL NOT NULL,'
+            ' PRIMARY KEY (channel_id, keyword))'
+        )
+        self._conn.commit()
+
+        self._bloom = None
+        self._rebuild_bloom()
+
+    def _rebuild_bloom(self):
+        """DB의 모든 채널 ID로 블룸 필터 다시 만들기 (초기화 시 또는 잠금을 잡은 상태에서 호출)"""
+        count = self._conn.execute('SELECT COUNT(*) FROM channels').fetchone()[0]
+        self._bloom = BloomFilter(capacity=max(100000, count * 2))
+        for (channel_id,) in self._conn.execute('SELECT channel_id FROM channels'):
+            self._bloom.add(channel_id)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM channels').fetchone()[0]
+
+    def skip_ids(self, channel_ids):
+        """
+        상세 정보를 다시 요청할 필요가 없는 채널 찾기
+        (이미 수집된 채널, 또는 최근 recheck_days 이내에 조회해서 제외된 채널)
+
+        Args:
+            channel_ids (list): 채널 ID 리스트
+
+        Returns:
+            set: 건너뛸 채널 ID 집합
+        """
+        # 블룸 필터에 없으면 처음 보는 채널이므로 DB 조회 생략
+        maybe_known = [channel_id for channel_id in channel_ids if channel_id in self._bloom]
+        if not maybe_known:
+            return set()
+
+        recheck_after = time.time() - self.recheck_days * 24 * 60 * 60
+        placeholders = ','.join('?' * len(maybe_known))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT channel_id FROM channels WHERE channel_id IN ({placeholders})'
+                ' AND details_fetched_at IS NOT NULL'
+                ' AND (accepted = 1 OR details_fetched_at >= ?)',
+                (*maybe_known, recheck_after)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def claim(self, channel_ids, keyword):
+        """
+        상세 정보를 조회할 채널을 이 키워드가 맡기 (여러 키워드를 동시에 수집할 때 같은 채널을 한 키워드만 처리)
+        skip_ids()는 조회 결과가 기록된 채널만 찾으므로, 다른 키워드가 조회 중인 채널은 여기서 걸러냅니다.
+
+        Args:
+            channel_ids (list): 채널 ID 리스트
+            keyword (str): 검색 키워드
+
+        Returns:
+            set: 다른 키워드가 이미 맡아서 건너뛸 채널 ID 집합
+        """
+        taken = set()
+        with self._lock:
+            for channel_id in channel_ids:
+                owner = self._claims.setdefault(channel_id, keyword)
+                if owner != keyword:
+                    taken.add(channel_id)
+        return taken
+
+    def release(self, keyword):
+        """
+        키워드가 맡은 채널 모두 놓기 (키워드 수집이 끝났을 때, 조회한 채널은 이미 기록되어 skip_ids()로 걸러짐)
+
+        Args:
+            keyword (str): 검색 키워드
+        """
+        with self._lock:
+            self._claims = {
+                channel_id: owner for channel_id, owner in self._claims.items() if owner != keyword
+            }
+
+    def keywords_for(self, channel_id):
+        """
+        채널을 발견한 키워드 목록
+
+        Args:
+            channel_id (str): 채널 ID
+
+        Returns:
+            list: 키워드 리스트 (발견 순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT keyword FROM channel_keywords WHERE channel_id = ? ORDER BY found_at',
+                (channel_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def record_found(self, channel_ids, keyword):
+        """
+        검색 결과에 나온 채널과 키워드 기록
+
+        Args:
+            channel_ids (list): 채널 ID 리스트
+            keyword (str): 검색 키워드
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO channels (channel_id, first_seen_at) VALUES (?, ?)',
+                [(channel_id, now) for channel_id in channel_ids]
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO channel_keywords (channel_id, keyword, found_at) VALUES (?, ?, ?)',
+                [(channel_id, keyword, now) for channel_id in channel_ids]
+            )
+            self._conn.commit()
+
+            for channel_id in channel_ids:
+                if channel_id not in self._bloom:
+                    self._bloom.add(channel_id)
+            if self._bloom.count > self._bloom.capacity:
+                self._rebuild_bloom()
+
+    def record_fetched(self, channel_id, accepted, reject_reason=None, fetched_at=None):
+        """
+        상세 정보를 조회한 결과 기록
+
+        Args:
+            channel_id (str): 채널 ID
+            accepted (bool): 필터를 통과해 저장되었는지 여부
+            reject_reason (str): 제외 사유 (통과했으면 None)
+            fetched_at (float): 조회 시각 (None이면 현재)
+        """
+        fetched_at = fetched_at or time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR IGNORE INTO channels (channel_id, first_seen_at) VALUES (?, ?)',
+                (channel_id, fetched_at)
+            )
+            # 한 번 수집된 채널은 이후 다른 키워드에서 제외되어도 수집 상태 유지
+            self._conn.execute(
+                'UPDATE channels SET details_fetched_at = ?, accepted = MAX(accepted, ?),'
+                ' reject_reason = CASE WHEN ? THEN NULL ELSE ? END'
+                ' WHERE channel_id = ?',
+                (fetched_at, int(accepted), int(accepted), reject_reason, channel_id)
+            )
+            self._conn.commit()
+            if channel_id not in self._bloom:
+                self._bloom.add(channel_id)
+
+    def seed_from_files(self, directory='.'):
+        """
+        저장된 채널 파일(*.json, *.jsonl)로 색인 채우기 (색인을 처음 만들 때 사용)
+
+        Args:
+            directory (str): 채널 파일이 있는 폴더
+
+        Returns:
+            int: 색인에 기록한 채널 수
+        """
+        json_files, jsonl_files = find_channel_files(directory=directory)
+        rows = {}
+        keyword_rows = set()
+
+        for path in json_files + jsonl_files:
+            keyword = keyword_from_filename(path)
+            fetched_at = os.path.getmtime(path)
+
+            if path.endswith('.jsonl'):
+                records = JsonlChannelStore(path).iter_records()
+            else:
+                records = iter_json_array(path)
+
+            try:
+                for record in records:
+                    channel_id = record['channel_id']
+                    rows[channel_id] = max(rows.get(channel_id, 0), fetched_at)
+                    keyword_rows.add((channel_id, keyword, fetched_at))
+            except Exception as e:
+                print(f"⚠️  {path} 로드 실패: {e}")
+
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO channels (channel_id, first_seen_at, details_fetched_at, accepted)'
+                ' VALUES (?, ?, ?, 1)',
+                [(channel_id, fetched_at, fetched_at) for channel_id, fetched_at in rows.items()]
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO channel_keywords (channel_id, keyword, found_at) VALUES (?, ?, ?)',
+                sorted(keyword_rows)
+            )
+            self._conn.commit()
+            self._rebuild_bloom()
+
+        return len(rows)
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
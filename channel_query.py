@@ -0,0 +1,357 @@
+"""
+수집한 채널 검색 DB
+모든 키워드 파일의 채널을 하나의 SQLite DB에 모아 구독자 수, 최근 업로드일, 국가 등의 조건으로
+바로 찾을 수 있게 합니다. 숫자와 날짜는 정수/시각(epoch 초)으로 저장하고 자주 쓰는 조건에 인덱스를 둡니다.
+파일마다 읽은 위치를 기록하여 다음 실행에서는 새로 추가된 채널만 읽습니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from channel_store import find_channel_files, iter_json_array, keyword_from_filename
+from exporter import COLUMNS, convert_record
+
+
+# 정렬에 사용할 수 있는 열 {이름: SQL 열}
+SORT_COLUMNS = {
+    'subscribers': 'subscriber_count',
+    'views': 'view_count',
+    'videos': 'video_count',
+    'last_upload': 'last_upload_date',
+    'published': 'published_at',
+    'title': 'title',
+}
+
+# 인덱스를 두는 열
+INDEXED_COLUMNS = ('subscriber_count', 'last_upload_date', 'published_at', 'contactable', 'country')
+
+# .jsonl 파일이 이어서 추가된 것인지 확인할 때 비교하는 마지막 읽은 부분의 길이 (바이트)
+_TAIL_SIZE = 64
+
+# 열 형식별 SQLite 형식 (시각은 epoch 초, 참/거짓은 0/1)
+_SQL_TYPES = {
+    'string': 'TEXT',
+    'category': 'TEXT',
+    'timestamp': 'REAL',
+    'bool': 'INTEGER',
+    'int': 'INTEGER',
+}
+
+# keywords 열은 channel_keywords 테이블로 따로 저장
+_FIELDS = tuple((name, kind) for name, kind in COLUMNS if name != 'keywords')
+_FIELD_NAMES = tuple(name for name, _ in _FIELDS)
+
+
+def _to_epoch(value):
+    """datetime → epoch 초 (None은 그대로)"""
+    return value.timestamp() if value is not None else None
+
+
+def _from_epoch(value):
+    """epoch 초 → ISO 8601 문자열 (UTC)"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+class ChannelDatabase:
+    def __init__(self, path='channels.sqlite3'):
+        """
+        채널 검색 DB 초기화
+
+        Args:
+            path (str): SQLite DB 파일 경로
+        """
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+
+        columns = ', '.join(
+            f'{name} {_SQL_TYPES[kind]}' + (' PRIMARY KEY' if name == 'channel_id' else '')
+            for name, kind in _FIELDS
+        )
+        # updated_at: 기록을 읽은 파일의 수정 시각 (여러 파일에 있는 채널은 가장 최근 파일 기준)
+        self._conn.execute(f'CREATE TABLE IF NOT EXISTS channels ({columns}, updated_at REAL NOT NULL)')
+        for name in INDEXED_COLUMNS:
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_channels_{name} ON channels ({name})')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS channel_keywords ('
+            ' keyword TEXT NOT NULL,'
+            ' channel_id TEXT NOT NULL,'
+            ' PRIMARY KEY (keyword, channel_id))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_channel_keywords_channel ON channel_keywords (channel_id)')
+        # 파일별로 읽은 위치 (다음 실행에서 바뀐 파일, 추가된 줄만 읽음)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ingested_files ('
+            ' path TEXT PRIMARY KEY,'
+            ' size INTEGER NOT NULL,'
+            ' mtime REAL NOT NULL,'
+            ' tail BLOB)'
+        )
+        self._conn.commit()
+
+        placeholders = ', '.join('?' * (len(_FIELD_NAMES) + 1))
+        updates = ', '.join(f'{name} = excluded.{name}' for name in _FIELD_NAMES[1:])
+        self._upsert_sql = (
+            f'INSERT INTO channels ({", ".join(_FIELD_NAMES)}, updated_at) VALUES ({placeholders})'
+            f' ON CONFLICT (channel_id) DO UPDATE SET {updates}, updated_at = excluded.updated_at'
+            ' WHERE excluded.updated_at >= channels.updated_at'
+        )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM channels').fetchone()[0]
+
+    def _row(self, record, updated_at):
+        """채널 정보 → channels 테이블 한 행"""
+        values = convert_record(record)
+        row = []
+        for name, kind in _FIELDS:
+            value = values[name]
+            if kind == 'timestamp':
+                value = _to_epoch(value)
+            elif kind == 'bool' and value is not None:
+                value = int(value)
+            row.append(value)
+        row.append(updated_at)
+        return row
+
+    @staticmethod
+    def _tail(f, position):
+        """position 직전 _TAIL_SIZE 바이트"""
+        start = max(0, position - _TAIL_SIZE)
+        f.seek(start)
+        return f.read(position - start)
+
+    def _read_new_lines(self, path, state, size):
+        """
+        .jsonl 파일에서 지난번 이후 추가된 줄 읽기
+
+        Returns:
+            tuple: (채널 정보 리스트, 읽은 위치, 읽은 위치 직전 바이트)
+        """
+        with open(path, 'rb') as f:
+            # 지난번 읽은 끝부분이 그대로면 이어서 추가된 것, 아니면(compact 등) 처음부터 다시 읽음
+            offset = 0
+            if state is not None:
+                previous_size, _, tail = state
+                if previous_size <= size and self._tail(f, previous_size) == tail:
+                    offset = previous_size
+            f.seek(offset)
+            data = f.read(size - offset)
+
+            # 기록 중인 마지막 줄(줄바꿈 없음)은 다음에 읽음
+            position = offset + data.rfind(b'\n') + 1
+            tail = self._tail(f, position)
+
+        records = []
+        for line in data[:position - offset].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️  {path} 손상된 줄 건너뜀")
+        return records, position, tail
+
+    def ingest_files(self, files=None):
+        """
+        채널 파일을 DB에 반영 (바뀌지 않은 파일은 건너뛰고, .jsonl은 추가된 줄만 읽음)
+
+        Args:
+            files (list): 반영할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+
+        Returns:
+            dict: {'files': 읽은 파일 수, 'records': 읽은 채널 기록 수, 'channels': DB 전체 채널 수}
+        """
+        if not files:
+            json_files, jsonl_files = find_channel_files()
+            files = json_files + jsonl_files
+
+        stats = {'files': 0, 'records': 0}
+        # 파일명이 날짜로 시작하므로 이름순이면 오래된 파일부터 (같은 시각이면 나중 파일 우선)
+        for path in sorted(files):
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                print(f"⚠️  {path} 읽기 실패: {e}")
+                continue
+
+            with self._lock:
+                state = self._conn.execute(
+                    'SELECT size, mtime, tail FROM ingested_files WHERE path = ?', (path,)
+                ).fetchone()
+            if state is not None and state[0] == stat.st_size and state[1] == stat.st_mtime:
+                continue
+
+            try:
+                if path.endswith('.jsonl'):
+                    records, position, tail = self._read_new_lines(path, state, stat.st_size)
+                else:
+                    # JSON 배열 파일은 바뀌었으면 전체를 다시 읽음
+                    records, position, tail = list(iter_json_array(path)), stat.st_size, None
+            except Exception as e:
+                print(f"⚠️  {path} 읽기 실패: {e}")
+                continue
+
+            keyword = keyword_from_filename(path)
+            with self._lock:
+                self._conn.executemany(self._upsert_sql, [self._row(record, stat.st_mtime) for record in records])
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO channel_keywords (keyword, channel_id) VALUES (?, ?)',
+                    [(keyword, record['channel_id']) for record in records]
+                )
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO ingested_files (path, size, mtime, tail) VALUES (?, ?, ?, ?)',
+                    (path, position, stat.st_mtime, tail)
+                )
+                self._conn.commit()
+
+            stats['files'] += 1
+            stats['records'] += len(records)
+
+        if stats['records']:
+            # 조건이 여러 개일 때 가장 좁히는 인덱스를 고르도록 통계 갱신
+            with self._lock:
+                self._conn.execute('ANALYZE')
+                self._conn.commit()
+        stats['channels'] = len(self)
+        return stats
+
+    def _where(self, korean=None, contactable=None, country=None, keyword=None, min_subscribers=None,
+               max_subscribers=None, min_views=None, uploaded_within_days=None, published_within_days=None,
+               has_email=None, text=None):
+        """검색 조건 → (WHERE 절, 파라미터)"""
+        clauses = []
+        params = []
+        now = time.time()
+
+        if korean is not None:
+            clauses.append('is_korean = ?')
+            params.append(int(korean))
+        if contactable is not None:
+            clauses.append('contactable = ?')
+            params.append(int(contactable))
+        if country:
+            clauses.append('country = ?')
+            params.append(country.upper())
+        if keyword:
+            clauses.append('channel_id IN (SELECT channel_id FROM channel_keywords WHERE keyword = ?)')
+            params.append(keyword)
+        if min_subscribers is not None:
+            clauses.append('subscriber_count >= ?')
+            params.append(min_subscribers)
+        if max_subscribers is not None:
+            clauses.append('subscriber_count <= ?')
+            params.append(max_subscribers)
+        if min_views is not None:
+            clauses.append('view_count >= ?')
+            params.append(min_views)
+        if uploaded_within_days is not None:
+            clauses.append('last_upload_date >= ?')
+            params.append(now - uploaded_within_days * 24 * 60 * 60)
+        if published_within_days is not None:
+            clauses.append('published_at >= ?')
+            params.append(now - published_within_days * 24 * 60 * 60)
+        if has_email:
+            clauses.append('email IS NOT NULL')
+        if text:
+            clauses.append("(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            params.extend([pattern, pattern])
+
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+        return where, params
+
+    def count(self, **filters):
+        """
+        조건에 맞는 채널 수
+
+        Args:
+            **filters: query()와 같은 검색 조건
+
+        Returns:
+            int: 채널 수
+        """
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM channels{where}', params).fetchone()[0]
+
+    def query(self, sort='subscribers', descending=True, limit=20, offset=0, **filters):
+        """
+        조건에 맞는 채널 검색
+
+        Args:
+            sort (str): 정렬 기준 (SORT_COLUMNS의 키)
+            descending (bool): 내림차순 여부
+            limit (int): 최대 결과 수 (None이면 전체)
+            offset (int): 건너뛸 결과 수 (페이지 나누기)
+            **filters: korean, contactable, country, keyword, min_subscribers, max_subscribers, min_views,
+                       uploaded_within_days, published_within_days, has_email, text
+
+        Returns:
+            list: 채널 정보 리스트 (저장 형식과 같은 필드, 숫자는 int, 날짜는 ISO 8601, 없는 값은 None,
+                  'keywords'에 찾은 키워드 리스트)
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"정렬 기준은 {', '.join(SORT_COLUMNS)} 중 하나여야 합니다: {sort}")
+
+        where, params = self._where(**filters)
+        # 값이 없는 채널은 항상 마지막 (SQLite는 내림차순이면 NULL이 마지막이라 인덱스 순서를 그대로 사용)
+        column = SORT_COLUMNS[sort]
+        order = f'{column} DESC, rowid DESC' if descending else f'{column} IS NULL, {column}, rowid'
+        sql = f'SELECT {", ".join(_FIELD_NAMES)} FROM channels{where} ORDER BY {order}'
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params = params + [limit, offset]
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            keywords = {}
+            if rows:
+                ids = [row[0] for row in rows]
+                placeholders = ','.join('?' * len(ids))
+                for keyword, channel_id in self._conn.execute(
+                    f'SELECT keyword, channel_id FROM channel_keywords WHERE channel_id IN ({placeholders})'
+                    ' ORDER BY keyword', ids
+                ):
+                    keywords.setdefault(channel_id, []).append(keyword)
+
+        results = []
+        for row in rows:
+            channel = {}
+            for (name, kind), value in zip(_FIELDS, row):
+                if kind == 'timestamp':
+                    value = _from_epoch(value)
+                elif kind == 'bool' and value is not None:
+                    value = bool(value)
+                channel[name] = value
+            channel['keywords'] = keywords.get(channel['channel_id'], [])
+            results.append(channel)
+        return results
+
+    def keywords(self):
+        """
+        키워드별 채널 수
+
+        Returns:
+            list: [(키워드, 채널 수)] (채널 수 많은 순)
+        """
+        with self._lock:
+            return self._conn.execute(
+                'SELECT keyword, COUNT(*) FROM channel_keywords GROUP BY keyword ORDER BY COUNT(*) DESC, keyword'
+            ).fetchall()
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,366 @@
+"""
+채널 정보 레코드
+수집한 채널 하나를 문자열 키 dict 대신 __slots__ 객체로 보관합니다 (기존 파일과 병합하거나 통계를 갱신할 때
+모든 채널을 메모리에 올리므로). 숫자는 int, 날짜는 epoch 초, 'N/A'는 None으로 보관하고
+채널 URL처럼 다른 값에서 만들 수 있는 필드는 저장하지 않고 필요할 때 만듭니다.
+
+to_dict()는 파일에 저장하던 것과 같은 JSON(필드 순서, 문자열 형식 포함)을 돌려줍니다.
+변환하면 원래 값으로 돌아오지 않는 값(예: 형식이 다른 날짜, 숫자가 아닌 구독자 수)은 원래 값을 그대로 보관합니다.
+
+    record = ChannelRecord.from_dict(json.loads(line))
+    record.subscriber_count  # 7460 (int, 'N/A'면 None)
+    record.to_dict() == json.loads(line)  # True
+"""
+
+import sys
+from datetime import datetime, timezone
+
+
+# 저장 파일의 필드 순서
+FIELDS = (
+    'channel_id', 'title', 'description', 'custom_url', 'published_at', 'last_upload_date', 'country',
+    'is_korean', 'subscriber_count', 'video_count', 'view_count', 'channel_url', 'custom_channel_url',
+    'email', 'phone', 'kakao', 'other_links', 'contactable', 'thumbnail',
+)
+
+# 값이 없을 때 저장 파일에 쓰는 문자열
+MISSING = 'N/A'
+
+CHANNEL_URL_PREFIX = 'https://www.youtube.com/channel/'
+CUSTOM_URL_PREFIX = 'https://www.youtube.com/'
+
+# 숫자로 보관하는 필드 (저장 파일에는 API 응답 그대로 문자열)
+COUNT_FIELDS = ('subscriber_count', 'video_count', 'view_count')
+
+# epoch 초로 보관하는 필드 (저장 파일에는 ISO 8601 문자열)
+TIME_FIELDS = ('published_at', 'last_upload_date')
+
+# 'N/A'를 None으로 보관하는 문자열 필드
+OPTIONAL_FIELDS = ('country', 'email', 'phone', 'kakao', 'other_links')
+
+# 그대로 보관하는 필드
+PLAIN_FIELDS = ('channel_id', 'title', 'description', 'custom_url', 'is_korean', 'contactable', 'thumbnail')
+
+# 다른 필드에서 만드는 필드
+DERIVED_FIELDS = ('channel_url', 'custom_channel_url')
+
+
+def encode_count(value):
+    """'7460' → 7460, 'N/A' → None (변환할 수 없으면 ValueError)"""
+    if value == MISSING:
+        return None
+    if isinstance(value, str) and value.isdigit() and str(int(value)) == value:
+        return int(value)
+    raise ValueError(value)
+
+
+def decode_count(value):
+    """encode_count()의 반대"""
+    return MISSING if value is None else str(value)
+
+
+def encode_time(value):
+    """'2026-02-18T08:56:58Z' → epoch 초, None → None (변환할 수 없으면 ValueError)"""
+    if value is None:
+        return None
+    if not isinstance(value, str) or not value.endswith('Z'):
+        raise ValueError(value)
+    timestamp = datetime.fromisoformat(value[:-1] + '+00:00').timestamp()
+    if decode_time(timestamp) != value:
+        raise ValueError(value)
+    return timestamp
+
+
+def decode_time(value):
+    """encode_time()의 반대 (API처럼 소수점 아래 끝의 0은 생략)"""
+    if value is None:
+        return None
+    text = datetime.fromtimestamp(value, timezone.utc).isoformat()[:-len('+00:00')]
+    if '.' in text:
+        text = text.rstrip('0')
+    return text + 'Z'
+
+
+def parse_time(value):
+    """
+    저장 파일의 날짜 문자열을 epoch 초로 (형식이 달라도 ISO 8601이면 변환)
+
+    Args:
+        value (str): ISO 8601 날짜 문자열
+
+    Returns:
+        float: epoch 초 (변환할 수 없으면 None)
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def pack_text(value):
+    """
+    긴 문자열을 메모리를 덜 쓰는 형식으로 (이모지가 있으면 파이썬 문자열은 글자당 4바이트이므로 UTF-8이 더 작음)
+
+    Args:
+        value (str): 문자열
+
+    Returns:
+        str 또는 bytes: 더 작은 쪽 (bytes면 UTF-8)
+    """
+    encoded = value.encode('utf-8')
+    return encoded if sys.getsizeof(encoded) < sys.getsizeof(value) else value
+
+
+def unpack_text(value):
+    """pack_text()의 반대"""
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _encode_optional(value):
+    if value == MISSING:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(value)
+    return value
+
+
+def _decode_optional(value):
+    return MISSING if value is None else value
+
+
+def _encode_country(value):
+    # 국가 코드는 몇 개뿐이므로 같은 문자열 객체를 공유
+    value = _encode_optional(value)
+    return sys.intern(value) if value else value
+
+
+# 필드별 (저장 파일 값 → 보관 형식, 보관 형식 → 저장 파일 값) 변환 (None이면 그대로)
+_CODECS = {
+    **{field: (None, None) for field in PLAIN_FIELDS},
+    **{field: (encode_count, decode_count) for field in COUNT_FIELDS},
+    **{field: (encode_time, decode_time) for field in TIME_FIELDS},
+    **{field: (_encode_optional, _decode_optional) for field in OPTIONAL_FIELDS},
+    'country': (_encode_country, _decode_optional),
+}
+
+
+def _loose_value(field, value):
+    """보관 형식으로 바꿀 수 없는 값에서 읽을 수 있는 만큼 읽기 (원래 값은 따로 보관)"""
+    if field in TIME_FIELDS:
+        return parse_time(value)
+    if field in COUNT_FIELDS:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class ChannelRecord:
+    """
+    저장용 채널 정보 하나
+
+    Attributes:
+        subscriber_count, video_count, view_count (int): 'N/A'면 None
+        published_at, last_upload_date (float): epoch 초 (없으면 None)
+        country, email, phone, kakao, other_links (str): 'N/A'면 None
+        is_korean, contactable (bool)
+    """
+
+    __slots__ = tuple(field for field in PLAIN_FIELDS if field != 'description') + COUNT_FIELDS + TIME_FIELDS + \
+        OPTIONAL_FIELDS + ('_description', '_raw', '_layout')
+
+    def __init__(self, channel_id, title='', description='', custom_url='', published_at=None,
+                 last_upload_date=None, country=None, is_korean=False, subscriber_count=None,
+                 video_count=None, view_count=None, email=None, phone=None, kakao=None, other_links=None,
+                 contactable=False, thumbnail=''):
+        """
+        채널 정보 초기화 (값은 보관하는 형식: 숫자는 int, 날짜는 epoch 초, 'N/A'는 None)
+        """
+        self.channel_id = channel_id
+        self.title = title
+        self.description = description
+        self.custom_url = custom_url
+        self.published_at = published_at
+        self.last_upload_date = last_upload_date
+        self.country = _encode_country(country) if country else country
+        self.is_korean = is_korean
+        self.subscriber_count = subscriber_count
+        self.video_count = video_count
+        self.view_count = view_count
+        self.email = email
+        self.phone = phone
+        self.kakao = kakao
+        self.other_links = other_links
+        self.contactable = contactable
+        self.thumbnail = thumbnail
+        self._raw = None  # {필드: 저장 파일 값} (변환하면 원래 값으로 돌아오지 않는 필드, 모르는 필드)
+        self._layout = None  # 필드 순서 (FIELDS와 다를 때만)
+
+    @property
+    def description(self):
+        """채널 설명 (채널 정보에서 가장 크므로 pack_text()로 보관)"""
+        return unpack_text(self._description)
+
+    @description.setter
+    def description(self, value):
+        self._description = pack_text(value) if isinstance(value, str) else value
+
+    @property
+    def channel_url(self):
+        """채널 URL"""
+        return CHANNEL_URL_PREFIX + self.channel_id
+
+    @property
+    def custom_channel_url(self):
+        """사용자 지정 URL (없으면 빈 문자열)"""
+        return CUSTOM_URL_PREFIX + self.custom_url if self.custom_url else ''
+
+    @classmethod
+    def from_api(cls, channel, text_fields, last_upload_date=None):
+        """
+        channels.list 응답 항목으로 만들기
+
+        Args:
+            channel (dict): channels.list 응답의 채널 항목
+            text_fields (dict): contact_extractor.analyze_channel_text() 결과
+            last_upload_date (str): 최근 업로드 날짜 (없으면 None)
+
+        Returns:
+            ChannelRecord: 채널 정보
+        """
+        snippet = channel['snippet']
+        statistics = channel.get('statistics', {})
+        record = cls(
+            channel['id'],
+            title=snippet['title'],
+            description=snippet.get('description', ''),
+            custom_url=snippet.get('customUrl', ''),
+            is_korean=text_fields['is_korean'],
+            contactable=text_fields['contactable'],
+            thumbnail=snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
+        )
+        record._set('published_at', snippet['publishedAt'])
+        record._set('last_upload_date', last_upload_date)
+        record._set('country', snippet.get('country', MISSING))
+        record._set('subscriber_count', statistics.get('subscriberCount', MISSING))
+        record._set('video_count', statistics.get('videoCount', MISSING))
+        record._set('view_count', statistics.get('viewCount', MISSING))
+        for field in ('email', 'phone', 'kakao', 'other_links'):
+            record._set(field, text_fields[field])
+        return record
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        저장 파일의 채널 정보(dict)로 만들기
+
+        Args:
+            data (dict): 채널 정보 (channel_id 필수)
+
+        Returns:
+            ChannelRecord: 채널 정보 (to_dict()로 같은 dict를 돌려받음)
+        """
+        record = cls(data['channel_id'])
+        for field, value in data.items():
+            codec = _CODECS.get(field)
+            if codec is not None and codec[0] is None:
+                setattr(record, field, value)
+            else:
+                record._set(field, value)
+        if tuple(data) != FIELDS:
+            record._layout = tuple(data)
+        return record
+
+    def _set(self, field, value):
+        """저장 파일 값 하나를 보관 형식으로 바꿔서 설정 (원래 값으로 돌아오지 않으면 원래 값도 보관)"""
+        if self._raw is not None:
+            self._raw.pop(field, None)
+
+        codec = _CODECS.get(field)
+        if codec is None:
+            # 만들 수 있는 필드는 값이 다를 때만, 모르는 필드는 항상 원래 값으로 보관
+            if field not in DERIVED_FIELDS or value != getattr(self, field):
+                self._keep_raw(field, value)
+            return
+
+        encode = codec[0]
+        try:
+            encoded = value if encode is None else encode(value)
+        except ValueError:
+            # 보관 형식으로 바꿀 수 없는 값 (형식이 다른 날짜 등)은 원래 값으로 저장
+            self._keep_raw(field, value)
+            encoded = _loose_value(field, value)
+        setattr(self, field, encoded)
+
+    def _keep_raw(self, field, value):
+        if self._raw is None:
+            self._raw = {}
+        self._raw[field] = value
+
+    def _get(self, field):
+        """필드 하나의 저장 파일 값"""
+        if self._raw is not None and field in self._raw:
+            return self._raw[field]
+        codec = _CODECS.get(field)
+        if codec is None:
+            if field not in DERIVED_FIELDS:
+                raise KeyError(field)
+            return getattr(self, field)
+        decode = codec[1]
+        value = getattr(self, field)
+        return value if decode is None else decode(value)
+
+    def keys(self):
+        """저장 파일의 필드 이름 (저장 순서)"""
+        return FIELDS if self._layout is None else self._layout
+
+    def to_dict(self):
+        """
+        저장 파일 형식의 dict (from_dict()에 넣었던 것과 같은 필드, 순서, 값)
+
+        Returns:
+            dict: 채널 정보
+        """
+        return {field: self._get(field) for field in self.keys()}
+
+    def __getitem__(self, field):
+        """저장 파일 형식의 값 (record['subscriber_count'] == '7460')"""
+        if field not in self.keys():
+            raise KeyError(field)
+        return self._get(field)
+
+    def __setitem__(self, field, value):
+        """저장 파일 형식의 값으로 설정 (record['video_count'] = '132')"""
+        self._set(field, value)
+        if field not in self.keys():
+            self._layout = self.keys() + (field,)
+
+    def __contains__(self, field):
+        return field in self.keys()
+
+    def get(self, field, default=None):
+        """dict.get()처럼 저장 파일 형식의 값"""
+        return self[field] if field in self else default
+
+    def update(self, values):
+        """dict.update()처럼 저장 파일 형식의 값 여러 개 설정"""
+        for field, value in values.items():
+            self[field] = value
+
+    def __eq__(self, other):
+        if isinstance(other, ChannelRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ChannelRecord({self.channel_id!r}, title={self.title!r})"
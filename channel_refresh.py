@@ -0,0 +1,214 @@
+"""
+저장된 채널 통계 갱신
+검색을 다시 하지 않고 저장된 채널의 구독자 수, 동영상 수, 조회수, 최근 업로드일만 새로 조회하여
+파일을 갱신하고, 갱신할 때마다 값을 이력 파일에 남깁니다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from channel_store import JsonlChannelStore, find_channel_files, load_channel_file, save_channel_file
+from quota import QuotaExhausted
+
+
+# 통계 조회 한 번에 묶는 최대 채널 수 (channels.list 제한)
+REFRESH_BATCH_SIZE = 50
+
+# 갱신 대상 필드
+REFRESH_FIELDS = ('subscriber_count', 'video_count', 'view_count', 'last_upload_date')
+
+
+def assign_batches(batches, channel_ids):
+    """
+    채널을 고정된 묶음에 배정 (이미 배정된 채널은 그대로 두고 새 채널만 뒤쪽 묶음에 채움)
+
+    정렬한 목록을 50개씩 자르면 채널 하나만 추가되어도 뒤쪽 묶음 구성이 모두 바뀌어
+    이전 ETag를 쓸 수 없으므로, 한 번 정한 묶음은 다음 실행에도 그대로 유지합니다.
+
+    Args:
+        batches (list): 이전 묶음 구성 ([[채널 ID, ...], ...], 그대로 수정됨)
+        channel_ids (iterable): 현재 저장된 채널 ID
+
+    Returns:
+        list: 묶음 구성
+    """
+    assigned = {channel_id for batch in batches for channel_id in batch}
+    for channel_id in sorted(set(channel_ids) - assigned):
+        if not batches or len(batches[-1]) >= REFRESH_BATCH_SIZE:
+            batches.append([])
+        batches[-1].append(channel_id)
+    return batches
+
+
+class ChannelRefresher:
+    def __init__(self, crawler, refresh_hours=24, history_path='channel_history.jsonl',
+                 state_path='channel_refresh_state.json'):
+        """
+        통계 갱신기 초기화
+
+        Args:
+            crawler (YouTubeChannelCrawler): API 호출에 사용할 크롤러
+            refresh_hours (float): 이 시간 안에 갱신한 채널은 건너뜀
+            history_path (str): 갱신 이력 파일 (한 줄에 갱신 한 번)
+            state_path (str): 묶음 구성과 묶음별 ETag 저장 파일
+        """
+        self.crawler = crawler
+        self.refresh_hours = refresh_hours
+        self.history_path = history_path
+        self.state_path = state_path
+
+    def _last_refreshed(self):
+        """이력 파일에서 채널별 마지막 갱신 시각 읽기"""
+        last_refreshed = {}
+        for record in JsonlChannelStore(self.history_path).iter_records():
+            last_refreshed[record['channel_id']] = record['refreshed_at']
+        return last_refreshed
+
+    def _load_state(self):
+        """저장된 묶음 구성과 묶음별 ETag ({'batches': [[채널 ID, ...]], 'etags': {묶음 키: ETag}})"""
+        if not os.path.exists(self.state_path):
+            return {'batches': [], 'etags': {}}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return {'batches': state.get('batches', []), 'etags': state.get('etags', {})}
+        except Exception as e:
+            print(f"⚠️  갱신 상태 파일 로드 실패: {e}")
+            return {'batches': [], 'etags': {}}
+
+    def _save_state(self, state):
+        """묶음 구성과 묶음별 ETag 저장 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    def refresh(self, files=None):
+        """
+        채널 파일의 통계 갱신
+
+        Args:
+            files (list): 갱신할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+
+        Returns:
+            dict: {'due', 'skipped', 'updated', 'not_modified', 'missing', 'upload_lookups'} 개수
+        """
+        if not files:
+            json_files, jsonl_files = find_channel_files()
+            files = json_files + jsonl_files
+
+        # 여러 키워드 파일에 있는 같은 채널은 한 번만 조회하고 모든 파일에 반영
+        file_records = {}
+        for path in files:
+            try:
+                file_records[path] = load_channel_file(path)
+            except Exception as e:
+                print(f"⚠️  {path} 로드 실패: {e}")
+
+        channels = {}  # {channel_id: [해당 채널의 기록들]}
+        for records in file_records.values():
+            for channel_id, record in records.items():
+                channels.setdefault(channel_id, []).append(record)
+
+        # 최근에 갱신한 채널은 건너뜀
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=self.refresh_hours)).isoformat()
+        last_refreshed = self._last_refreshed()
+        due_ids = sorted(
+            channel_id for channel_id in channels
+            if last_refreshed.get(channel_id, '') < cutoff
+        )
+
+        stats = {
+            'due': len(due_ids),
+            'skipped': len(channels) - len(due_ids),
+            'updated': 0,
+            'not_modified': 0,
+            'missing': 0,
+            'upload_lookups': 0,
+        }
+        print(f"🔄 갱신 대상: {len(due_ids)}개 채널 (최근 {self.refresh_hours}시간 내 갱신 {stats['skipped']}개 건너뜀)")
+
+        state = self._load_state()
+        etags = state['etags']
+        batches = assign_batches(state['batches'], channels)
+        history = JsonlChannelStore(self.history_path)
+        changed_files = set()
+        due_set = set(due_ids)
+
+        # 갱신 대상이 하나라도 있는 묶음은 통째로 조회하고 결과를 묶음의 모든 채널에 반영
+        # (조회 비용은 같고, 저장한 ETag가 "묶음의 모든 채널이 최신"을 뜻하게 됨)
+        try:
+            for batch in batches:
+                chunk = [channel_id for channel_id in batch if channel_id in channels]
+                if not any(channel_id in due_set for channel_id in chunk):
+                    continue
+                batch_key = hashlib.sha1(','.join(chunk).encode('utf-8')).hexdigest()
+
+                items, etag = self.crawler.fetch_channel_statistics(chunk, etag=etags.get(batch_key))
+                refreshed_at = datetime.now(timezone.utc).isoformat()
+
+                if items is None:
+                    # 이전 갱신 이후 바뀐 것이 없음 (최근 업로드일 조회도 생략)
+                    stats['not_modified'] += len(chunk)
+                    for channel_id in chunk:
+                        history.append(dict(
+                            {field: channels[channel_id][0].get(field) for field in REFRESH_FIELDS},
+                            channel_id=channel_id, refreshed_at=refreshed_at
+                        ))
+                    continue
+
+                # 동영상 수가 바뀌었거나 최근 업로드일이 없는 채널만 업로드일 다시 조회
+                upload_lookups = []
+                for channel_id in chunk:
+                    item = items.get(channel_id)
+                    if item is None:
+                        stats['missing'] += 1
+                        continue
+                    record = channels[channel_id][0]
+                    video_count = item.get('statistics', {}).get('videoCount', 'N/A')
+                    if video_count != record.get('video_count') or not record.get('last_upload_date'):
+                        upload_lookups.append(item)
+
+                last_upload_dates = dict(zip(
+                    [item['id'] for item in upload_lookups],
+                    self.crawler.get_last_upload_dates(upload_lookups)
+                ))
+                stats['upload_lookups'] += len(upload_lookups)
+
+                for channel_id, item in items.items():
+                    if channel_id not in channels:
+                        continue
+                    statistics = item.get('statistics', {})
+                    values = {
+                        'subscriber_count': statistics.get('subscriberCount', 'N/A'),
+                        'video_count': statistics.get('videoCount', 'N/A'),
+                        'view_count': statistics.get('viewCount', 'N/A'),
+                        'last_upload_date': last_upload_dates.get(
+                            channel_id, channels[channel_id][0].get('last_upload_date')
+                        ),
+                    }
+                    for record in channels[channel_id]:
+                        record.update(values)
+                    history.append(dict(values, channel_id=channel_id, refreshed_at=refreshed_at))
+                    stats['updated'] += 1
+
+                changed_files.update(
+                    path for path, records in file_records.items()
+                    if any(channel_id in records for channel_id in items)
+                )
+
+                # 묶음 전체를 반영한 뒤에만 ETag 저장 (도중에 할당량이 끝나면 다음에 다시 조회)
+                if etag:
+                    etags[batch_key] = etag
+        except QuotaExhausted as e:
+            print(f"\n⛔ {e}")
+            print("   지금까지 갱신한 채널만 저장합니다.")
+        finally:
+            history.close()
+            for path in sorted(changed_files):
+                save_channel_file(path, file_records[path].values())
+            self._save_state({'batches': batches, 'etags': etags})
+
+        return stats
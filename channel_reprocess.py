@@ -0,0 +1,134 @@
+"""
+저장된 채널 재처리
+API를 호출하지 않고 저장된 채널 설명에 현재 연락처 추출/한국어 판별 규칙을 다시 적용합니다.
+채널을 일정 개수씩 묶어 여러 프로세스에서 처리하므로 코어 수에 비례해 빨라집니다.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from channel_store import JsonlChannelStore, find_channel_files, iter_json_array, save_channel_file
+from contact_extractor import analyze_channel_text
+
+
+# 재처리로 다시 계산하는 필드
+REPROCESS_FIELDS = ('is_korean', 'email', 'phone', 'kakao', 'other_links', 'contactable')
+
+# 프로세스 하나에 한 번에 보내는 채널 수
+CHUNK_SIZE = 2000
+
+
+def _analyze_chunk(texts):
+    """작업자 프로세스: (제목, 설명, 국가) 목록을 분석"""
+    return [analyze_channel_text(title, description, country) for title, description, country in texts]
+
+
+def _chunks(records, size):
+    """채널을 size개씩 묶기"""
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_records(path):
+    """채널 파일의 기록을 순서대로 읽기"""
+    if path.endswith('.jsonl'):
+        return JsonlChannelStore(path).iter_records()
+    return iter_json_array(path)
+
+
+class ChannelReprocessor:
+    def __init__(self, processes=None, chunk_size=CHUNK_SIZE):
+        """
+        재처리기 초기화
+
+        Args:
+            processes (int): 작업자 프로세스 수 (None이면 CPU 코어 수)
+            chunk_size (int): 프로세스에 한 번에 보내는 채널 수
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def _process_chunks(self, executor, records):
+        """
+        채널 묶음을 프로세스 풀에 보내고 입력 순서대로 (묶음, 분석 결과) 돌려주기
+        (동시에 처리 중인 묶음 수를 제한하여 메모리 사용량 유지)
+        """
+        in_flight = deque()
+        for chunk in _chunks(records, self.chunk_size):
+            texts = [
+                (record.get('title', ''), record.get('description', ''),
+                 None if record.get('country') in (None, 'N/A') else record['country'])
+                for record in chunk
+            ]
+            in_flight.append((chunk, executor.submit(_analyze_chunk, texts)))
+            if len(in_flight) >= self.processes * 2:
+                chunk, future = in_flight.popleft()
+                yield chunk, future.result()
+
+        while in_flight:
+            chunk, future = in_flight.popleft()
+            yield chunk, future.result()
+
+    def reprocess(self, files=None, dry_run=False):
+        """
+        채널 파일의 연락처/한국어 필드 다시 계산
+
+        Args:
+            files (list): 재처리할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+            dry_run (bool): True면 바뀔 내용만 집계하고 파일은 그대로 둠
+
+        Returns:
+            dict: {'records', 'changed_records', 'changed_files', 'fields': {필드: 바뀐 개수}}
+        """
+        if not files:
+            json_files, jsonl_files = find_channel_files()
+            files = json_files + jsonl_files
+
+        summary = {
+            'records': 0,
+            'changed_records': 0,
+            'changed_files': 0,
+            'fields': {field: 0 for field in REPROCESS_FIELDS},
+        }
+
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            for path in files:
+                # 1차: 여러 프로세스로 다시 계산하고 바뀐 필드만 기록 (파일 전체를 메모리에 올리지 않음)
+                updates = {}  # {기록 순번: {필드: 새 값}}
+                count = 0
+                try:
+                    for chunk, results in self._process_chunks(executor, _iter_records(path)):
+                        for record, fields in zip(chunk, results):
+                            diff = {
+                                field: fields[field] for field in REPROCESS_FIELDS
+                                if record.get(field) != fields[field]
+                            }
+                            if diff:
+                                updates[count] = diff
+                                for field in diff:
+                                    summary['fields'][field] += 1
+                            count += 1
+                except Exception as e:
+                    print(f"⚠️  {path} 처리 실패: {e}")
+                    continue
+
+                summary['records'] += count
+                summary['changed_records'] += len(updates)
+                if updates:
+                    summary['changed_files'] += 1
+
+                # 2차: 바뀐 기록이 있으면 파일을 다시 읽으면서 반영하여 교체
+                if updates and not dry_run:
+                    save_channel_file(path, (
+                        dict(record, **updates[position]) if position in updates else record
+                        for position, record in enumerate(_iter_records(path))
+                    ))
+                print(f"{'🔍' if dry_run else '✓'} {path}: {count}개 중 {len(updates)}개 변경")
+
+        return summary
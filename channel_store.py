@@ -0,0 +1,348 @@
+"""
+채널 데이터 저장소 (JSON Lines)
+필터를 통과한 채널을 한 줄씩 바로 추가 기록하므로, 키워드 처리 중 종료되어도 그때까지 수집한 채널이 남습니다.
+같은 채널이 여러 번 기록되면 마지막 기록이 유효하며, compact()로 정리할 수 있습니다.
+파일 전체를 읽을 때는 채널을 ChannelRecord로 보관하고(메모리 절약), 쓸 때는 원래 JSON 형식 그대로 씁니다.
+"""
+
+import glob
+import json
+import os
+import re
+import threading
+
+from channel_record import ChannelRecord
+
+
+# 스트리밍 JSON 읽기에 사용하는 디코더와 한 번에 읽는 크기
+_DECODER = json.JSONDecoder()
+_READ_SIZE = 64 * 1024
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789+-.eE'
+
+
+def iter_json_array(path):
+    """
+    JSON 배열 파일의 항목을 하나씩 읽기 (파일 전체를 메모리에 올리지 않음)
+
+    Args:
+        path (str): JSON 배열 파일 경로
+
+    Yields:
+        항목 (채널 파일이면 채널 정보 dict)
+
+    Raises:
+        ValueError: JSON 배열 형식이 아닌 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        eof = False
+
+        def fill():
+            """읽은 부분을 버리고 다음 조각 읽기 (더 읽을 것이 없으면 False)"""
+            nonlocal buffer, position, eof
+            chunk = f.read(_READ_SIZE)
+            if not chunk:
+                eof = True
+            buffer = buffer[position:] + chunk
+            position = 0
+            return bool(chunk)
+
+        def next_char():
+            """공백을 건너뛴 다음 글자 (파일 끝이면 빈 문자열)"""
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE:
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not fill():
+                    return ''
+
+        if next_char() != '[':
+            raise ValueError(f"{path}: JSON 배열이 아닙니다")
+        position += 1
+        if next_char() == ']':
+            return
+
+        while True:
+            # 항목 하나 읽기 (조각 끝에서 잘렸으면 더 읽고 다시 시도)
+            while True:
+                try:
+                    item, end = _DECODER.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f"{path}: JSON 항목을 읽을 수 없습니다 ({e})")
+                    fill()
+                    continue
+                # 숫자처럼 뒤에 글자가 더 이어질 수 있는 값은 다음 조각까지 확인
+                # (조각 끝에서 끝났거나, '2.5|e10'처럼 숫자 뒷부분이 남아 있을 수 있음)
+                if not eof and (
+                    end == len(buffer)
+                    or (isinstance(item, (int, float)) and buffer[end] in _NUMBER_CHARS)
+                ) and fill():
+                    continue
+                break
+
+            yield item
+            position = end
+
+            char = next_char()
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"{path}: JSON 배열 항목 사이에 쉼표가 없습니다")
+            position += 1
+            next_char()
+
+
+def encode_record(value):
+    """json.dumps의 default (ChannelRecord는 저장 파일 형식의 dict로)"""
+    if isinstance(value, ChannelRecord):
+        return value.to_dict()
+    raise TypeError(f"{type(value).__name__}는 JSON으로 변환할 수 없습니다")
+
+
+def write_json_array(f, records):
+    """
+    항목을 하나씩 JSON 배열로 쓰기 (json.dump(list, indent=2)와 같은 형식, 목록 전체를 메모리에 올리지 않음)
+
+    Args:
+        f: 쓰기용으로 연 파일
+        records (iterable): 항목 목록 (dict 또는 ChannelRecord)
+    """
+    first = True
+    for record in records:
+        f.write('[\n  ' if first else ',\n  ')
+        f.write(json.dumps(record, ensure_ascii=False, indent=2, default=encode_record).replace('\n', '\n  '))
+        first = False
+    f.write('[]' if first else '\n]')
+
+
+def load_json_ids(path):
+    """
+    JSON 배열 채널 파일의 채널 ID 집합 (중복 확인용, 설명 등 전체 기록은 보관하지 않음)
+
+    Args:
+        path (str): JSON 배열 채널 파일 경로
+
+    Returns:
+        set: 채널 ID 집합
+    """
+    return {record['channel_id'] for record in iter_json_array(path)}
+
+
+class JsonlChannelStore:
+    def __init__(self, path):
+        """
+        저장소 초기화
+
+        Args:
+            path (str): JSON Lines 파일 경로 (한 줄에 채널 하나)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def exists(self):
+        """저장 파일 존재 여부"""
+        return os.path.exists(self.path)
+
+    def iter_records(self):
+        """
+        저장된 채널을 한 줄씩 읽기 (기록 중 종료되어 깨진 줄은 건너뜀)
+
+        Yields:
+            dict: 채널 정보
+        """
+        if not self.exists():
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"⚠️  {self.path} {line_number}번째 줄 손상 - 건너뜀")
+
+    def load_ids(self):
+        """
+        저장된 채널 ID 집합 (중복 확인용)
+
+        Returns:
+            set: 채널 ID 집합
+        """
+        return {record['channel_id'] for record in self.iter_records()}
+
+    def load(self):
+        """
+        저장된 채널 전체 (같은 채널은 마지막 기록 사용)
+
+        Returns:
+            dict: {channel_id: ChannelRecord} 형태의 딕셔너리
+        """
+        return {record['channel_id']: ChannelRecord.from_dict(record) for record in self.iter_records()}
+
+    def append(self, record):
+        """
+        채널 하나를 파일 끝에 바로 기록
+
+        Args:
+            record (dict): 채널 정보 (dict 또는 ChannelRecord)
+        """
+        line = json.dumps(record, ensure_ascii=False, default=encode_record) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """열린 파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def compact(self):
+        """
+        중복 기록을 정리하여 채널당 한 줄만 남기기 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            tuple: (정리 전 줄 수, 정리 후 채널 수)
+        """
+        self.close()
+
+        line_count = 0
+        records = {}
+        for record in self.iter_records():
+            line_count += 1
+            # 마지막 기록을 남기되 처음 수집된 순서는 유지
+            records.pop(record['channel_id'], None)
+            records[record['channel_id']] = ChannelRecord.from_dict(record)
+
+        self.rewrite(records.values())
+        return line_count, len(records)
+
+    def rewrite(self, records):
+        """
+        파일 전체를 주어진 채널 목록으로 다시 쓰기 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            records (iterable): 채널 정보 목록 (dict 또는 ChannelRecord)
+        """
+        self.close()
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=encode_record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def import_json(self, json_path):
+        """
+        기존 JSON 배열 파일의 채널 중 아직 없는 채널만 추가
+
+        Args:
+            json_path (str): 기존 *_youtube_channels_*.json 파일 경로
+
+        Returns:
+            int: 추가한 채널 수
+        """
+        existing_ids = self.load_ids()
+        imported = 0
+        for record in iter_json_array(json_path):
+            if record['channel_id'] in existing_ids:
+                continue
+            self.append(record)
+            existing_ids.add(record['channel_id'])
+            imported += 1
+
+        self.close()
+        return imported
+
+
+def load_channel_file(path):
+    """
+    채널 파일 읽기 (.json 배열 또는 .jsonl)
+
+    Args:
+        path (str): 채널 파일 경로
+
+    Returns:
+        dict: {channel_id: ChannelRecord} 형태의 딕셔너리 (파일 순서 유지)
+    """
+    if path.endswith('.jsonl'):
+        return JsonlChannelStore(path).load()
+
+    return {record['channel_id']: ChannelRecord.from_dict(record) for record in iter_json_array(path)}
+
+
+def save_channel_file(path, records):
+    """
+    채널 파일 다시 쓰기 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path (str): 채널 파일 경로 (.json 배열 또는 .jsonl)
+        records (iterable): 채널 정보 목록 (dict 또는 ChannelRecord)
+    """
+    if path.endswith('.jsonl'):
+        JsonlChannelStore(path).rewrite(records)
+        return
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        write_json_array(f, records)
+    os.replace(temp_path, path)
+
+
+def jsonl_path_for(json_path):
+    """
+    JSON 파일명에 대응하는 JSON Lines 파일명
+
+    Args:
+        json_path (str): *.json 파일 경로
+
+    Returns:
+        str: *.jsonl 파일 경로
+    """
+    root, _ = os.path.splitext(json_path)
+    return root + '.jsonl'
+
+
+def keyword_from_filename(path):
+    """
+    채널 파일명에서 키워드 추출
+
+    Args:
+        path (str): YYMMDD_youtube_channels_키워드.json(l) 형식의 파일 경로
+
+    Returns:
+        str: 키워드 (형식이 다르면 확장자를 뺀 파일명)
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    match = re.match(r'\d{6}_youtube_channels_(.+)$', name)
+    return match.group(1).replace('_', ' ') if match else name
+
+
+def find_channel_files(pattern='*_youtube_channels_*', directory='.'):
+    """
+    저장된 채널 파일 찾기
+
+    Args:
+        pattern (str): 파일명 패턴 (확장자 제외)
+        directory (str): 찾을 폴더
+
+    Returns:
+        tuple: (JSON 파일 리스트, JSON Lines 파일 리스트)
+    """
+    json_files = sorted(glob.glob(os.path.join(directory, pattern + '.json')))
+    jsonl_files = sorted(glob.glob(os.path.join(directory, pattern + '.jsonl')))
+    return json_files, jsonl_files
@@ -0,0 +1,152 @@
+"""
+크롤링 중간 저장 (체크포인트)
+키워드별 검색 위치(page token), 수집한 채널, 제외 개수와 끝난 키워드 목록을 주기적으로 저장하여
+중간에 종료되어도 --resume으로 마지막 저장 위치부터 이어서 진행할 수 있습니다.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class CrawlCheckpoint:
+    def __init__(self, path='crawl_state.json', save_interval=5.0):
+        """
+        체크포인트 초기화
+
+        Args:
+            path (str): 체크포인트 파일 경로
+            save_interval (float): 진행 상황을 파일에 저장하는 최소 간격 (초)
+        """
+        self.path = path
+        self.save_interval = save_interval
+
+        self.keywords = []
+        self.completed = []
+        self.keyword_states = {}  # {키워드: {'planner', 'search_count', 'accepted', 'reject_counts'}}
+
+        self._lock = threading.Lock()
+        self._last_saved = 0.0
+
+    def exists(self):
+        """체크포인트 파일 존재 여부"""
+        return os.path.exists(self.path)
+
+    def load(self):
+        """
+        저장된 체크포인트 불러오기
+
+        Returns:
+            bool: 이어서 진행할 기록이 있는지 여부
+        """
+        if not self.exists():
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️  체크포인트 로드 실패: {e}")
+            return False
+
+        if 'pending_keywords' in state:
+            # 이전 형식: 할당량 소진으로 남은 키워드 목록만 저장됨
+            self.keywords = list(state['pending_keywords'])
+            self.completed = []
+            self.keyword_states = {}
+        else:
+            self.keywords = state.get('keywords', [])
+            self.completed = state.get('completed', [])
+            self.keyword_states = state.get('keyword_states', {})
+
+        return bool(self.pending_keywords())
+
+    def start(self, keywords):
+        """
+        새 실행 시작 (이전 기록을 불러오지 않은 경우 키워드 목록 등록)
+
+        Args:
+            keywords (list): 전체 키워드 리스트
+        """
+        with self._lock:
+            if not self.keywords:
+                self.keywords = list(keywords)
+        self.save()
+
+    def pending_keywords(self):
+        """
+        아직 끝나지 않은 키워드 (키워드 파일 순서 유지)
+
+        Returns:
+            list: 키워드 리스트
+        """
+        with self._lock:
+            completed = set(self.completed)
+            return [keyword for keyword in self.keywords if keyword not in completed]
+
+    def keyword_state(self, keyword):
+        """
+        키워드의 저장된 진행 상황
+
+        Args:
+            keyword (str): 키워드
+
+        Returns:
+            dict: 진행 상황 (없으면 None)
+        """
+        with self._lock:
+            state = self.keyword_states.get(keyword)
+            return dict(state) if state else None
+
+    def update_keyword(self, keyword, state, force=False):
+        """
+        키워드 진행 상황 기록 (save_interval마다, 또는 force면 바로 파일에 저장)
+
+        Args:
+            keyword (str): 키워드
+            state (dict): 진행 상황
+            force (bool): 간격과 관계없이 바로 저장할지 여부
+        """
+        with self._lock:
+            self.keyword_states[keyword] = state
+            due = force or time.monotonic() - self._last_saved >= self.save_interval
+        if due:
+            self.save()
+
+    def complete_keyword(self, keyword):
+        """
+        키워드 완료 기록 (다음 --resume에서 건너뜀)
+
+        Args:
+            keyword (str): 키워드
+        """
+        with self._lock:
+            if keyword not in self.completed:
+                self.completed.append(keyword)
+            self.keyword_states.pop(keyword, None)
+        self.save()
+
+    def save(self):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 저장 중 종료되어도 파일이 깨지지 않음)"""
+        with self._lock:
+            state = {
+                'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'keywords': list(self.keywords),
+                'completed': list(self.completed),
+                'keyword_states': self.keyword_states,
+            }
+            self._last_saved = time.monotonic()
+
+            temp_file = f"{self.path}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.path)
+
+    def clear(self):
+        """모든 키워드가 끝났으면 체크포인트 삭제"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,150 @@
+"""
+채널 설명 연락처 추출
+정규표현식은 모듈을 불러올 때 한 번만 컴파일하고, 패턴에 꼭 필요한 글자('@', '01', 'http' 등)가
+설명에 없으면 해당 패턴 검사를 건너뜁니다. 결과는 패턴마다 findall을 돌리던 기존 방식과 같습니다.
+"""
+
+import re
+
+
+# 이메일
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# 전화번호 (한국, 앞의 패턴이 우선)
+PHONE_PATTERNS = (
+    re.compile(r'010[-\s]?\d{4}[-\s]?\d{4}'),
+    re.compile(r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}'),
+    re.compile(r'\+82[-\s]?10[-\s]?\d{4}[-\s]?\d{4}'),
+)
+
+# 카카오톡 ID (앞의 패턴이 우선)
+KAKAO_PATTERNS = (
+    re.compile(r'카카오[톡]?[:\s]+([a-zA-Z0-9_-]+)', re.IGNORECASE),
+    re.compile(r'kakao[talk]?[:\s]+([a-zA-Z0-9_-]+)', re.IGNORECASE),
+)
+
+# 기타 연락 방법 (네이버 블로그, 개인 사이트 등)
+URL_PATTERN = re.compile(r'https?://[^\s<>"\)]+|www\.[^\s<>"\)]+')
+
+# 연락 링크에서 제외할 유튜브, 소셜미디어 도메인
+EXCLUDE_DOMAINS = ('youtube.com', 'youtu.be', 'instagram.com', 'twitter.com', 'facebook.com', 'x.com')
+
+# 한글 유니코드 범위: AC00-D7A3
+KOREAN_PATTERN = re.compile('[가-힣]')
+
+# 저장하는 기타 링크 최대 개수
+MAX_OTHER_LINKS = 3
+
+
+def _first_match(patterns, text, group=0):
+    """패턴을 순서대로 검사하여 처음 찾은 패턴의 첫 번째 결과 (없으면 빈 문자열)"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(group)
+    return ''
+
+
+def extract_email(text):
+    """
+    텍스트에서 이메일 주소 추출
+
+    Args:
+        text (str): 검색할 텍스트
+
+    Returns:
+        str: 찾은 이메일 주소 또는 빈 문자열
+    """
+    if not text or '@' not in text:
+        return ''
+    match = EMAIL_PATTERN.search(text)
+    return match.group() if match else ''
+
+
+def is_korean_text(text):
+    """
+    텍스트에 한국어가 포함되어 있는지 확인
+
+    Args:
+        text (str): 검색할 텍스트
+
+    Returns:
+        bool: 한국어 포함 여부
+    """
+    if not text:
+        return False
+    return KOREAN_PATTERN.search(text) is not None
+
+
+def extract_contact_info(text):
+    """
+    텍스트에서 다양한 연락처 정보 추출
+
+    Args:
+        text (str): 검색할 텍스트
+
+    Returns:
+        dict: {'email', 'phone', 'kakao', 'other_links'} 추출된 연락처 정보
+    """
+    contact_info = {
+        'email': '',
+        'phone': '',
+        'kakao': '',
+        'other_links': []
+    }
+    if not text:
+        return contact_info
+
+    contact_info['email'] = extract_email(text)
+
+    # 모든 전화번호 패턴은 '01' 또는 '+82'를 포함
+    if '01' in text or '+82' in text:
+        contact_info['phone'] = _first_match(PHONE_PATTERNS, text)
+
+    # 카카오 패턴은 '카카오' 또는 대소문자 무관 'kakao'를 포함
+    if '카카오' in text or 'kakao' in text.lower():
+        contact_info['kakao'] = _first_match(KAKAO_PATTERNS, text, group=1)
+
+    # URL 패턴은 'http' 또는 'www.'를 포함
+    if 'http' in text or 'www.' in text:
+        contact_urls = []
+        for match in URL_PATTERN.finditer(text):
+            url = match.group()
+            lowered = url.lower()
+            if not any(domain in lowered for domain in EXCLUDE_DOMAINS):
+                contact_urls.append(url)
+                if len(contact_urls) == MAX_OTHER_LINKS:
+                    break
+        contact_info['other_links'] = contact_urls
+
+    return contact_info
+
+
+def analyze_channel_text(title, description, country=None):
+    """
+    채널 제목/설명에서 저장용 연락처 필드와 한국 채널 여부를 한 번에 계산
+
+    Args:
+        title (str): 채널 제목
+        description (str): 채널 설명
+        country (str): 채널 국가 코드 (없으면 None)
+
+    Returns:
+        dict: {'is_korean', 'email', 'phone', 'kakao', 'other_links', 'contactable'}
+              (채널 정보에 저장하는 형식, 없는 값은 'N/A')
+    """
+    contact_info = extract_contact_info(description)
+
+    return {
+        'is_korean': country == 'KR' or is_korean_text(description) or is_korean_text(title),
+        'email': contact_info['email'] or 'N/A',
+        'phone': contact_info['phone'] or 'N/A',
+        'kakao': contact_info['kakao'] or 'N/A',
+        'other_links': ', '.join(contact_info['other_links']) if contact_info['other_links'] else 'N/A',
+        'contactable': any([
+            contact_info['email'],
+            contact_info['phone'],
+            contact_info['kakao'],
+            contact_info['other_links']
+        ]),
+    }
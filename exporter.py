@@ -0,0 +1,293 @@
+"""
+채널 데이터 열 형식 내보내기
+수집한 채널을 분석용 파일로 내보냅니다. 숫자는 정수, 날짜는 시각, 'N/A'는 빈 값(null)으로 바꿉니다.
+pyarrow가 설치되어 있으면 Parquet(country는 사전 인코딩), 없으면 CSV로 저장합니다.
+"""
+
+import csv
+import os
+from datetime import datetime
+
+from channel_store import find_channel_files, keyword_from_filename, load_channel_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow가 없는 환경에서는 CSV로 내보냄
+    pa = None
+    pq = None
+
+
+# 내보낼 열과 형식 (저장된 채널 정보 필드 순서)
+COLUMNS = (
+    ('channel_id', 'string'),
+    ('title', 'string'),
+    ('description', 'string'),
+    ('custom_url', 'string'),
+    ('published_at', 'timestamp'),
+    ('last_upload_date', 'timestamp'),
+    ('country', 'category'),
+    ('is_korean', 'bool'),
+    ('subscriber_count', 'int'),
+    ('video_count', 'int'),
+    ('view_count', 'int'),
+    ('channel_url', 'string'),
+    ('custom_channel_url', 'string'),
+    ('email', 'string'),
+    ('phone', 'string'),
+    ('kakao', 'string'),
+    ('other_links', 'string'),
+    ('contactable', 'bool'),
+    ('thumbnail', 'string'),
+    ('keywords', 'string'),
+)
+
+# 병합 데이터 파일명 (확장자 제외)
+MERGED_NAME = 'all_channels'
+
+
+def parquet_available():
+    """Parquet으로 내보낼 수 있는지 (pyarrow 설치 여부)"""
+    return pa is not None
+
+
+def _to_int(value):
+    """'1234' → 1234, 'N/A'/빈 값 → None"""
+    if value in (None, '', 'N/A'):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_timestamp(value):
+    """ISO 8601 문자열 → datetime (UTC), 없거나 잘못된 값 → None"""
+    if not value or value == 'N/A':
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_string(value):
+    """'N/A'/빈 문자열 → None"""
+    if value in (None, '', 'N/A'):
+        return None
+    return value
+
+
+def _convert(value, kind):
+    """저장된 값을 열 형식에 맞게 변환"""
+    if kind == 'int':
+        return _to_int(value)
+    if kind == 'timestamp':
+        return _to_timestamp(value)
+    if kind == 'bool':
+        return None if value is None else bool(value)
+    return _to_string(value)
+
+
+def convert_record(record):
+    """
+    채널 정보 하나를 열 형식에 맞게 변환
+
+    Args:
+        record (dict): 저장된 채널 정보
+
+    Returns:
+        dict: {열 이름: 변환한 값} (숫자는 int, 날짜는 datetime, 없는 값은 None)
+    """
+    return {name: _convert(record.get(name), kind) for name, kind in COLUMNS}
+
+
+def to_columns(records):
+    """
+    채널 정보 목록을 열 단위 목록으로 변환
+
+    Args:
+        records (iterable): 채널 정보 목록 ('keywords' 키가 있으면 함께 변환)
+
+    Returns:
+        dict: {열 이름: 값 리스트}
+    """
+    columns = {name: [] for name, _ in COLUMNS}
+    for record in records:
+        for name, kind in COLUMNS:
+            columns[name].append(_convert(record.get(name), kind))
+    return columns
+
+
+def _arrow_table(columns):
+    """열 목록을 pyarrow Table로 변환 (country는 사전 인코딩)"""
+    types = {
+        'string': pa.string(),
+        'timestamp': pa.timestamp('us', tz='UTC'),
+        'bool': pa.bool_(),
+        'int': pa.int64(),
+    }
+    arrays = []
+    for name, kind in COLUMNS:
+        if kind == 'category':
+            arrays.append(pa.array(columns[name], type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(columns[name], type=types[kind]))
+    return pa.Table.from_arrays(arrays, names=[name for name, _ in COLUMNS])
+
+
+def _write_csv(columns, path):
+    """열 목록을 CSV로 저장 (빈 값은 빈 칸, 날짜는 ISO 8601)"""
+    names = [name for name, _ in COLUMNS]
+    row_count = len(columns[names[0]])
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for i in range(row_count):
+            row = []
+            for name in names:
+                value = columns[name][i]
+                if value is None:
+                    value = ''
+                elif isinstance(value, datetime):
+                    value = value.isoformat()
+                row.append(value)
+            writer.writerow(row)
+
+
+def _resolve_format(fmt):
+    """'auto'를 실제 형식으로 바꾸고, 쓸 수 없는 형식이면 RuntimeError"""
+    if fmt == 'auto':
+        fmt = 'parquet' if parquet_available() else 'csv'
+    if fmt == 'parquet' and not parquet_available():
+        raise RuntimeError("Parquet으로 내보내려면 pyarrow가 필요합니다: pip install pyarrow")
+    return fmt
+
+
+def export_channels(records, path_without_extension, fmt='auto'):
+    """
+    채널 정보 목록을 열 형식 파일로 저장
+
+    Args:
+        records (iterable): 채널 정보 목록
+        path_without_extension (str): 저장 경로 (확장자는 형식에 따라 붙임)
+        fmt (str): 'parquet', 'csv', 'auto'(pyarrow가 있으면 parquet)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    fmt = _resolve_format(fmt)
+    columns = to_columns(records)
+    path = f"{path_without_extension}.{fmt}"
+    _write_columns(columns, path, fmt)
+    return path
+
+
+def _write_columns(columns, path, fmt):
+    """열 목록을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    temp_path = f"{path}.tmp"
+    if fmt == 'parquet':
+        pq.write_table(_arrow_table(columns), temp_path, compression='zstd')
+    else:
+        _write_csv(columns, temp_path)
+    os.replace(temp_path, path)
+
+
+def _read_columns(path, fmt):
+    """내보낸 파일을 열 목록으로 읽기 (CSV는 값을 문자열 그대로 둠)"""
+    if fmt == 'parquet':
+        return pq.read_table(path).to_pydict()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        names = next(reader)
+        columns = {name: [] for name in names}
+        for row in reader:
+            for name, value in zip(names, row):
+                columns[name].append(value)
+    return columns
+
+
+def _is_up_to_date(target, sources):
+    """target 파일이 있고 sources의 모든 파일보다 나중에 쓰였는지"""
+    if not os.path.exists(target):
+        return False
+    target_time = os.path.getmtime(target)
+    return all(os.path.getmtime(source) <= target_time for source in sources)
+
+
+def merge_parts(parts, path, fmt):
+    """
+    키워드별로 내보낸 파일을 합쳐 전체 키워드 병합본 만들기 (채널당 한 줄)
+
+    저장된 채널 파일을 다시 읽고 변환하지 않고, 이미 변환된 키워드별 파일을 그대로 합칩니다.
+
+    Args:
+        parts (list): 키워드별로 내보낸 파일 (이름순이면 오래된 파일부터)
+        path (str): 병합본 경로
+        fmt (str): 'parquet' 또는 'csv'
+    """
+    names = [name for name, _ in COLUMNS]
+    merged_rows = {}  # {channel_id: 행} (나중 파일, 즉 최근 날짜 기록 우선)
+    merged_keywords = {}  # {channel_id: [키워드]}
+
+    for part in parts:
+        columns = _read_columns(part, fmt)
+        for i, channel_id in enumerate(columns['channel_id']):
+            merged_rows.pop(channel_id, None)
+            merged_rows[channel_id] = [columns[name][i] for name in names]
+            keyword = columns['keywords'][i]
+            keywords = merged_keywords.setdefault(channel_id, [])
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+
+    columns = {name: [] for name in names}
+    for channel_id, row in merged_rows.items():
+        row[-1] = ', '.join(merged_keywords[channel_id]) or None
+        for name, value in zip(names, row):
+            columns[name].append(value)
+    _write_columns(columns, path, fmt)
+
+
+def export_files(files=None, output_dir='exports', fmt='auto', merged=True, only_changed=False):
+    """
+    채널 파일을 키워드별로, 그리고 전체 키워드 병합본으로 내보내기
+
+    병합본은 키워드별로 내보낸 파일을 합쳐서 만듭니다.
+
+    Args:
+        files (list): 내보낼 채널 파일 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+        output_dir (str): 내보낸 파일을 저장할 폴더
+        fmt (str): 'parquet', 'csv', 'auto'(pyarrow가 있으면 parquet)
+        merged (bool): 전체 키워드 병합본(채널당 한 줄)도 만들지 여부
+        only_changed (bool): 내보낸 뒤 바뀐(또는 아직 내보내지 않은) 채널 파일만 다시 내보낼지 여부
+
+    Returns:
+        list: 저장한 파일 경로 리스트
+    """
+    fmt = _resolve_format(fmt)
+    if not files:
+        json_files, jsonl_files = find_channel_files()
+        files = json_files + jsonl_files
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    parts = []
+
+    # 파일명이 날짜로 시작하므로 이름순이면 오래된 파일부터
+    for path in sorted(files):
+        part = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(path))[0]}.{fmt}")
+        parts.append(part)
+        if only_changed and _is_up_to_date(part, [path]):
+            continue
+
+        keyword = keyword_from_filename(path)
+        rows = (dict(record, keywords=keyword) for record in load_channel_file(path).values())
+        written.append(export_channels(rows, os.path.splitext(part)[0], fmt))
+
+    merged_path = os.path.join(output_dir, f"{MERGED_NAME}.{fmt}")
+    if merged and parts and not (only_changed and _is_up_to_date(merged_path, parts)):
+        merge_parts(parts, merged_path, fmt)
+        written.append(merged_path)
+
+    return written
@@ -0,0 +1,139 @@
+"""
+API 요청용 HTTP 연결 풀
+httplib2.Http는 스레드 안전하지 않아서 스레드마다 연결을 따로 만들어 왔는데, 최근 업로드일 조회 스레드 풀은
+호출마다 새 스레드를 만들기 때문에 TLS 연결도 매번 새로 맺었습니다.
+HttpPool은 keep-alive 연결(httplib2.Http)을 스레드와 무관하게 모아 두고 한 번에 한 스레드에만 빌려주므로
+여러 스레드가 동시에 써도 안전하고, 스레드가 바뀌어도 이미 맺은 연결을 다시 사용합니다.
+
+크롤러는 acquire() / release() / prepare()만 사용하므로 같은 메서드를 가진 다른 전송 계층으로 바꿀 수 있습니다.
+"""
+
+import threading
+
+
+# gzip 압축 응답 요청에 필요한 헤더 (Google API는 user-agent에 gzip이 있어야 압축해서 보냄)
+# googleapiclient가 이미 붙여 보내므로, 다른 클라이언트로 만든 요청처럼 빠져 있을 때만 채움
+DEFAULT_ACCEPT_ENCODING = 'gzip, deflate'
+GZIP_USER_AGENT = '(gzip)'
+
+# 풀에 보관할 최대 유휴 연결 수 (동시에 빌려가는 수에는 제한 없음, 넘치는 연결은 반납할 때 닫음)
+DEFAULT_MAX_IDLE = 16
+
+
+def build_http():
+    """
+    새 연결 만들기 (googleapiclient 기본 설정: 제한 시간, 308 리디렉션 제외)
+    googleapiclient.http는 불러오는 데 오래 걸리므로 첫 요청 때 불러옵니다.
+
+    Returns:
+        httplib2.Http: 새 연결
+    """
+    from googleapiclient.http import build_http as build_google_http
+
+    return build_google_http()
+
+
+def close_http(http):
+    """httplib2.Http의 열린 연결 모두 닫기"""
+    connections = getattr(http, 'connections', {})
+    for connection in list(connections.values()):
+        try:
+            connection.close()
+        except OSError:
+            pass
+    connections.clear()
+
+
+class HttpPool:
+    def __init__(self, max_idle=DEFAULT_MAX_IDLE, timeout=None, factory=build_http):
+        """
+        연결 풀 초기화
+
+        Args:
+            max_idle (int): 보관할 최대 유휴 연결 수
+            timeout (float): 요청 제한 시간 (초, None이면 googleapiclient 기본값)
+            factory (callable): 새 연결을 만드는 함수 (기본값: googleapiclient의 build_http)
+        """
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.factory = factory
+        self._idle = []
+        self._lock = threading.Lock()
+
+        self.created = 0  # 새로 만든 연결 수
+        self.reused = 0  # 유휴 연결을 다시 빌려준 횟수
+        self.discarded = 0  # 연결 오류로 버린 연결 수
+
+    def acquire(self):
+        """
+        연결 빌리기 (유휴 연결이 있으면 가장 최근에 반납된 것, 없으면 새로 만듦)
+
+        Returns:
+            httplib2.Http: 요청에 사용할 연결 (사용 후 release()로 반납)
+        """
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+            self.created += 1
+
+        http = self.factory()
+        if self.timeout is not None:
+            http.timeout = self.timeout
+        return http
+
+    def release(self, http, reusable=True):
+        """
+        연결 반납
+
+        Args:
+            http (httplib2.Http): acquire()로 빌린 연결
+            reusable (bool): False면 연결 오류가 난 연결이므로 닫고 버림
+        """
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(http)
+                    return
+        else:
+            with self._lock:
+                self.discarded += 1
+        close_http(http)
+
+    @staticmethod
+    def prepare(request):
+        """
+        요청 헤더 설정 (gzip 압축 응답 요청, 빠진 값만 추가하고 이미 있는 값은 줄이지 않음)
+
+        Args:
+            request: googleapiclient HttpRequest (headers 속성 사용)
+        """
+        headers = request.headers
+        accept_encoding = headers.setdefault('accept-encoding', DEFAULT_ACCEPT_ENCODING)
+        if 'gzip' not in accept_encoding:
+            headers['accept-encoding'] = f"{accept_encoding}, gzip"
+        user_agent = headers.get('user-agent', '')
+        if 'gzip' not in user_agent:
+            headers['user-agent'] = f"{user_agent} {GZIP_USER_AGENT}".strip()
+
+    def stats(self):
+        """
+        연결 사용 통계
+
+        Returns:
+            dict: {'created', 'reused', 'discarded', 'idle'}
+        """
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'discarded': self.discarded,
+                'idle': len(self._idle),
+            }
+
+    def close(self):
+        """유휴 연결 모두 닫기"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for http in idle:
+            close_http(http)
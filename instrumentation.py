@@ -0,0 +1,364 @@
+"""
+API 호출 계측
+엔드포인트별, 키워드별로 호출 수, 응답 시간(p50/p95/p99), 오류 코드, 사용한 할당량을 기록하고
+키워드별 필터 제외 개수와 함께 실행이 끝나면 JSON 보고서(선택: Prometheus 텍스트 형식)로 저장합니다.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from quota import is_quota_exceeded_error
+
+
+# Prometheus 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 키워드 밖에서 호출된 경우(refresh 등)의 키워드 이름
+NO_KEYWORD = '-'
+
+
+def error_code(error):
+    """
+    예외를 보고서용 오류 코드로 변환
+
+    Args:
+        error (Exception): API 호출 중 발생한 예외
+
+    Returns:
+        str: '403 quotaExceeded', '500', 'TimeoutError' 등
+    """
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is None:
+        return type(error).__name__
+    if is_quota_exceeded_error(error):
+        return f'{status} quotaExceeded'
+    return str(status)
+
+
+def percentile(sorted_values, fraction):
+    """
+    정렬된 값에서 백분위수 (nearest-rank 방식)
+
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값
+        fraction (float): 0~1 (예: 0.95)
+
+    Returns:
+        float: 백분위수 (값이 없으면 None)
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def units_per_accepted(units, accepted):
+    """수집한 채널 하나당 사용한 할당량 (수집한 채널이 없으면 None)"""
+    return round(units / accepted, 1) if accepted else None
+
+
+class _CallStats:
+    """엔드포인트 하나(또는 엔드포인트와 키워드 한 쌍)의 호출 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.not_modified = 0
+        self.units = 0
+        self.errors = {}  # {오류 코드: 횟수}
+        self.latencies = []  # 실제 요청의 응답 시간 (초)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'not_modified': self.not_modified,
+            'units': self.units,
+            'errors': dict(sorted(self.errors.items())),
+            'latency_ms': {
+                'count': len(latencies),
+                'mean': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else None,
+                'p50': self._ms(percentile(latencies, 0.50)),
+                'p95': self._ms(percentile(latencies, 0.95)),
+                'p99': self._ms(percentile(latencies, 0.99)),
+                'max': self._ms(latencies[-1] if latencies else None),
+            },
+        }
+
+    @staticmethod
+    def _ms(seconds):
+        return None if seconds is None else round(seconds * 1000, 1)
+
+
+class Metrics:
+    def __init__(self):
+        """계측기 초기화 (크롤러 하나의 실행 동안 사용)"""
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._endpoints = {}  # {엔드포인트: _CallStats}
+        self._by_keyword = {}  # {키워드: {엔드포인트: _CallStats}}
+        self._keywords = {}  # {키워드: 키워드 수집 결과}
+        self._startup = {}  # {단계: 걸린 시간(초)}
+        self.first_request_at = None  # 첫 실제 API 요청을 보낸 시각 (perf_counter)
+
+    @contextmanager
+    def keyword_scope(self, keyword):
+        """
+        이 스레드에서 실행하는 API 호출을 keyword로 집계
+
+        Args:
+            keyword (str): 검색 키워드 (None이면 현재 값 유지)
+        """
+        previous = getattr(self._local, 'keyword', None)
+        if keyword is not None:
+            self._local.keyword = keyword
+        try:
+            yield
+        finally:
+            self._local.keyword = previous
+
+    def current_keyword(self):
+        """이 스레드의 현재 키워드 (없으면 None)"""
+        return getattr(self._local, 'keyword', None)
+
+    def _stats_for(self, endpoint):
+        """(엔드포인트 통계, 키워드별 엔드포인트 통계) (잠금을 잡은 상태에서 호출)"""
+        keyword = self.current_keyword() or NO_KEYWORD
+        endpoint_stats = self._endpoints.setdefault(endpoint, _CallStats())
+        keyword_stats = self._by_keyword.setdefault(keyword, {}).setdefault(endpoint, _CallStats())
+        return endpoint_stats, keyword_stats
+
+    def record_call(self, endpoint, duration, units=0, error=None, not_modified=False):
+        """
+        API 요청 한 번 기록 (재시도는 각각 한 번으로 기록)
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+            duration (float): 응답 시간 (초)
+            units (int): 이 요청에 사용한 할당량
+            error (Exception): 요청이 실패했으면 예외
+            not_modified (bool): ETag가 같아 본문 없이 304를 받았는지 여부
+        """
+        code = error_code(error) if error is not None else None
+        with self._lock:
+            if self.first_request_at is None:
+                self.first_request_at = time.perf_counter() - duration
+            for stats in self._stats_for(endpoint):
+                stats.calls += 1
+                stats.units += units
+                stats.latencies.append(duration)
+                if not_modified:
+                    stats.not_modified += 1
+                if code is not None:
+                    stats.errors[code] = stats.errors.get(code, 0) + 1
+
+    def record_cache_hit(self, endpoint):
+        """
+        캐시에서 응답한 호출 기록 (요청 없음, 할당량 사용 없음)
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+        """
+        with self._lock:
+            for stats in self._stats_for(endpoint):
+                stats.cache_hits += 1
+
+    def record_startup(self, phase, seconds):
+        """
+        시작 단계에 걸린 시간 기록 (예: 'import' = 모듈 로드, 'first_request' = 첫 API 요청까지)
+
+        Args:
+            phase (str): 단계 이름
+            seconds (float): 걸린 시간 (초)
+        """
+        with self._lock:
+            self._startup[phase] = round(seconds, 3)
+
+    def keyword_units(self, keyword):
+        """
+        키워드 하나에 사용한 할당량 (지금까지)
+
+        Args:
+            keyword (str): 검색 키워드
+
+        Returns:
+            int: 할당량 (units)
+        """
+        with self._lock:
+            return sum(stats.units for stats in self._by_keyword.get(keyword, {}).values())
+
+    def record_keyword(self, keyword, accepted, reject_counts, elapsed, search_count=None, search_streams=None):
+        """
+        키워드 하나의 수집 결과 기록
+
+        Args:
+            keyword (str): 검색 키워드
+            accepted (int): 이번 실행에서 새로 수집한 채널 수
+            reject_counts (dict): 이번 실행의 {제외 사유: 개수}
+            elapsed (float): 걸린 시간 (초)
+            search_count (int): 검색 횟수 (지금까지의 누적)
+            search_streams (list): 검색 흐름(정렬/지역/언어)별 결과 (SearchPlanner.summary())
+        """
+        with self._lock:
+            self._keywords[keyword] = {
+                'accepted': accepted,
+                'rejected': {reason: count for reason, count in reject_counts.items() if count},
+                'elapsed_seconds': round(elapsed, 3),
+                'search_count': search_count,
+                'search_streams': search_streams or [],
+            }
+
+    def report(self):
+        """
+        실행 보고서
+
+        Returns:
+            dict: {'started_at', 'elapsed_seconds', 'startup', 'totals', 'endpoints', 'keywords'}
+        """
+        with self._lock:
+            startup = dict(self._startup)
+            endpoints = {endpoint: stats.summary() for endpoint, stats in sorted(self._endpoints.items())}
+            keywords = {}
+            for keyword in list(self._keywords) + sorted(set(self._by_keyword) - set(self._keywords)):
+                by_endpoint = self._by_keyword.get(keyword, {})
+                units = sum(stats.units for stats in by_endpoint.values())
+                keywords[keyword] = dict(
+                    self._keywords.get(keyword, {}),
+                    units=units,
+                    units_per_accepted=units_per_accepted(units, self._keywords.get(keyword, {}).get('accepted', 0)),
+                    endpoints={endpoint: stats.summary() for endpoint, stats in sorted(by_endpoint.items())},
+                )
+
+        rejected = {}
+        for result in keywords.values():
+            for reason, count in result.get('rejected', {}).items():
+                rejected[reason] = rejected.get(reason, 0) + count
+
+        units = sum(summary['units'] for summary in endpoints.values())
+        accepted = sum(result.get('accepted', 0) for result in keywords.values())
+        return {
+            'started_at': self.started_at.isoformat(),
+            'elapsed_seconds': round(time.perf_counter() - self._started, 3),
+            'startup': startup,
+            'totals': {
+                'calls': sum(summary['calls'] for summary in endpoints.values()),
+                'cache_hits': sum(summary['cache_hits'] for summary in endpoints.values()),
+                'errors': sum(sum(summary['errors'].values()) for summary in endpoints.values()),
+                'units': units,
+                'accepted': accepted,
+                'units_per_accepted': units_per_accepted(units, accepted),
+                'rejected': rejected,
+            },
+            'endpoints': endpoints,
+            'keywords': keywords,
+        }
+
+    def write_report(self, path):
+        """
+        실행 보고서를 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (str): 저장 경로
+        """
+        report = self.report()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    def prometheus_text(self):
+        """
+        Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 읽을 수 있음)
+
+        Returns:
+            str: 메트릭 텍스트
+        """
+        lines = []
+
+        def label(value):
+            return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        with self._lock:
+            series = [
+                (endpoint, keyword, stats)
+                for keyword, by_endpoint in sorted(self._by_keyword.items())
+                for endpoint, stats in sorted(by_endpoint.items())
+            ]
+
+            lines.append('# HELP youtube_api_requests_total API requests sent (retries counted separately)')
+            lines.append('# TYPE youtube_api_requests_total counter')
+            for endpoint, keyword, stats in series:
+                lines.append(f'youtube_api_requests_total{{endpoint="{label(endpoint)}",keyword="{label(keyword)}"}} '
+                             f'{stats.calls}')
+
+            lines.append('# HELP youtube_api_cache_hits_total API calls answered from the response cache')
+            lines.append('# TYPE youtube_api_cache_hits_total counter')
+            for endpoint, keyword, stats in series:
+                lines.append(f'youtube_api_cache_hits_total{{endpoint="{label(endpoint)}",keyword="{label(keyword)}"}} '
+                             f'{stats.cache_hits}')
+
+            lines.append('# HELP youtube_api_quota_units_total Quota units charged')
+            lines.append('# TYPE youtube_api_quota_units_total counter')
+            for endpoint, keyword, stats in series:
+                lines.append(f'youtube_api_quota_units_total{{endpoint="{label(endpoint)}",keyword="{label(keyword)}"}} '
+                             f'{stats.units}')
+
+            lines.append('# HELP youtube_api_errors_total Failed API requests by error code')
+            lines.append('# TYPE youtube_api_errors_total counter')
+            for endpoint, keyword, stats in series:
+                for code, count in sorted(stats.errors.items()):
+                    lines.append(f'youtube_api_errors_total{{endpoint="{label(endpoint)}",keyword="{label(keyword)}",'
+                                 f'code="{label(code)}"}} {count}')
+
+            lines.append('# HELP youtube_api_request_duration_seconds API request latency')
+            lines.append('# TYPE youtube_api_request_duration_seconds histogram')
+            for endpoint, stats in sorted(self._endpoints.items()):
+                labels = f'endpoint="{label(endpoint)}"'
+                for bucket in LATENCY_BUCKETS:
+                    count = sum(1 for latency in stats.latencies if latency <= bucket)
+                    lines.append(f'youtube_api_request_duration_seconds_bucket{{{labels},le="{bucket}"}} {count}')
+                lines.append(f'youtube_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} '
+                             f'{len(stats.latencies)}')
+                lines.append(f'youtube_api_request_duration_seconds_sum{{{labels}}} {sum(stats.latencies):.6f}')
+                lines.append(f'youtube_api_request_duration_seconds_count{{{labels}}} {len(stats.latencies)}')
+
+            lines.append('# HELP youtube_crawl_rejected_total Channels rejected by filter stage')
+            lines.append('# TYPE youtube_crawl_rejected_total counter')
+            for keyword, result in self._keywords.items():
+                for reason, count in result['rejected'].items():
+                    lines.append(f'youtube_crawl_rejected_total{{keyword="{label(keyword)}",reason="{label(reason)}"}} '
+                                 f'{count}')
+
+            lines.append('# HELP youtube_crawl_accepted_total Channels accepted')
+            lines.append('# TYPE youtube_crawl_accepted_total counter')
+            for keyword, result in self._keywords.items():
+                lines.append(f'youtube_crawl_accepted_total{{keyword="{label(keyword)}"}} {result["accepted"]}')
+
+            lines.append('# HELP youtube_crawl_startup_seconds Time spent in each startup phase')
+            lines.append('# TYPE youtube_crawl_startup_seconds gauge')
+            for phase, seconds in self._startup.items():
+                lines.append(f'youtube_crawl_startup_seconds{{phase="{label(phase)}"}} {seconds}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """
+        Prometheus 텍스트 형식으로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (str): 저장 경로 (예: crawl_metrics.prom)
+        """
+        text = self.prometheus_text()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
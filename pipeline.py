@@ -0,0 +1,136 @@
+"""
+단계별 파이프라인
+각 단계를 별도 스레드에서 실행하고 크기가 제한된 큐로 연결합니다.
+앞 단계가 다음 작업을 미리 진행하되, 큐가 가득 차면 대기하므로 메모리 사용량이 일정하게 유지됩니다.
+"""
+
+import queue
+import threading
+
+
+# 단계 사이에 전달되는 종료 신호
+_DONE = object()
+
+
+class _Failure:
+    """앞 단계에서 발생한 예외를 마지막 소비자까지 전달하기 위한 래퍼"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class Pipeline:
+    def __init__(self, source, stages, depth=2):
+        """
+        파이프라인 초기화
+
+        Args:
+            source (callable): 항목을 생성하는 제너레이터 함수 (첫 번째 단계)
+            stages (list): 항목을 받아 변환하는 함수 리스트 (None을 반환하면 해당 항목은 버림)
+            depth (int): 단계 사이 큐의 최대 크기 (배압 조절)
+        """
+        self.stop_event = threading.Event()
+        self._queues = [queue.Queue(maxsize=depth) for _ in range(len(stages) + 1)]
+        self._threads = [
+            threading.Thread(target=self._run_source, args=(source, self._queues[0]), daemon=True)
+        ]
+        for i, stage in enumerate(stages):
+            self._threads.append(threading.Thread(
+                target=self._run_stage,
+                args=(stage, self._queues[i], self._queues[i + 1]),
+                daemon=True
+            ))
+
+    @property
+    def stopped(self):
+        """중단 요청 여부"""
+        return self.stop_event.is_set()
+
+    def __iter__(self):
+        """
+        마지막 단계의 결과를 순서대로 반환
+
+        Yields:
+            마지막 단계가 만든 항목
+        """
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(self._queues[-1])
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            self.stop()
+
+    def stop(self):
+        """
+        모든 단계에 중단을 요청하고 스레드 종료를 기다림
+        (진행 중인 API 호출은 끝날 때까지 기다리고, 대기 중인 작업은 버림)
+        """
+        self.stop_event.set()
+        for thread in self._threads:
+            if thread.is_alive() and thread is not threading.current_thread():
+                thread.join()
+
+    def _put(self, q, item):
+        """
+        큐에 항목 추가 (가득 차면 대기, 중단 요청 시 포기)
+
+        Returns:
+            bool: 추가 성공 여부
+        """
+        while not self.stopped:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        """
+        큐에서 항목 꺼내기 (비어 있으면 대기, 중단 요청 시 종료 신호 반환)
+        """
+        while not self.stopped:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _run_source(self, source, out_queue):
+        """첫 번째 단계: 제너레이터가 만든 항목을 다음 큐로 전달"""
+        items = source()
+        try:
+            for item in items:
+                if not self._put(out_queue, item):
+                    return
+        except Exception as e:
+            self._put(out_queue, _Failure(e))
+            return
+        finally:
+            items.close()
+
+        self._put(out_queue, _DONE)
+
+    def _run_stage(self, stage, in_queue, out_queue):
+        """중간 단계: 앞 큐의 항목을 변환하여 다음 큐로 전달"""
+        while True:
+            item = self._get(in_queue)
+            if item is _DONE or isinstance(item, _Failure):
+                self._put(out_queue, item)
+                return
+
+            try:
+                result = stage(item)
+            except Exception as e:
+                self._put(out_queue, _Failure(e))
+                return
+
+            if result is not None and not self._put(out_queue, result):
+                return
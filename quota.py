@@ -0,0 +1,202 @@
+"""
+YouTube API 할당량 관리
+API 호출마다 실제 비용(units)을 차감하고, 하루 예산을 넘지 않도록 관리합니다.
+사용량은 파일에 저장되어 같은 날 여러 번 실행해도 누적됩니다.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except Exception:
+    # tzdata가 없는 환경에서는 태평양 표준시(UTC-8)로 근사
+    _QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+# 엔드포인트별 호출 비용 (units)
+QUOTA_COSTS = {
+    'search': 100,
+    'channels': 1,
+    'playlistItems': 1,
+}
+
+# 검색 1회(페이지)에 드는 예상 비용: 검색 + 채널 정보 묶음 조회 + 최근 업로드 최대 50회
+ESTIMATED_SEARCH_PAGE_COST = QUOTA_COSTS['search'] + QUOTA_COSTS['channels'] + 50 * QUOTA_COSTS['playlistItems']
+
+
+class QuotaExhausted(Exception):
+    """하루 할당량 예산을 모두 사용함"""
+
+
+def is_quota_exceeded_error(error):
+    """
+    API 오류가 할당량 초과(quotaExceeded)인지 확인
+
+    Args:
+        error (HttpError): googleapiclient 오류
+
+    Returns:
+        bool: 할당량 초과 여부
+    """
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    content = getattr(error, 'content', b'') or b''
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
+    return status == 403 and 'quotaExceeded' in content
+
+
+def quota_day():
+    """
+    할당량 기준 날짜 (YouTube 할당량은 태평양 시간 자정에 초기화됨)
+
+    Returns:
+        str: YYYY-MM-DD
+    """
+    return datetime.now(_QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+class QuotaTracker:
+    def __init__(self, daily_budget=10000, state_file='quota_state.json'):
+        """
+        할당량 관리자 초기화
+
+        Args:
+            daily_budget (int): 하루 사용 가능한 최대 units
+            state_file (str): 사용량 저장 파일 (None이면 저장하지 않음)
+        """
+        self.daily_budget = daily_budget
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 저장 순서 보장 (여러 스레드가 같은 임시 파일을 쓰지 않도록)
+
+        self.day = quota_day()
+        self.used = 0
+        self.used_by_endpoint = {}
+        self.exhausted = False
+        self._load()
+
+    def _load(self):
+        """저장된 오늘 사용량 불러오기 (날짜가 바뀌었으면 0부터 시작)"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️  할당량 파일 로드 실패: {e}")
+            return
+
+        if state.get('day') != self.day:
+            return
+
+        self.used = state.get('used', 0)
+        self.used_by_endpoint = state.get('used_by_endpoint', {})
+        self.exhausted = state.get('exhausted', False)
+
+    def save(self):
+        """오늘 사용량 저장 (임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 파일이 깨지지 않음)"""
+        if not self.state_file:
+            return
+
+        # 상태를 읽고 파일을 교체할 때까지 다른 저장이 끼어들지 않도록 (차감은 막지 않음)
+        with self._save_lock:
+            with self._lock:
+                state = {
+                    'day': self.day,
+                    'daily_budget': self.daily_budget,
+                    'used': self.used,
+                    'used_by_endpoint': dict(self.used_by_endpoint),
+                    'exhausted': self.exhausted,
+                }
+
+            temp_file = f"{self.state_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.state_file)
+
+    def _roll_over(self):
+        """날짜가 바뀌었으면 사용량 초기화 (잠금을 잡은 상태에서 호출)"""
+        today = quota_day()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+            self.used_by_endpoint = {}
+            self.exhausted = False
+
+    @property
+    def remaining(self):
+        """오늘 남은 units"""
+        if self.exhausted:
+            return 0
+        return max(0, self.daily_budget - self.used)
+
+    def charge(self, endpoint):
+        """
+        API 호출 비용 차감 (호출 전에 실행)
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+
+        Raises:
+            QuotaExhausted: 남은 예산으로 호출할 수 없는 경우
+                            (상태는 바꾸지 않으므로 검색은 못 해도 비용이 작은 호출은 계속 가능)
+        """
+        cost = QUOTA_COSTS.get(endpoint, 1)
+
+        with self._lock:
+            self._roll_over()
+            if self.exhausted or self.used + cost > self.daily_budget:
+                raise QuotaExhausted(
+                    f"일일 할당량 예산 소진 ({self.used}/{self.daily_budget} units, '{endpoint}' 호출에 {cost} units 필요)"
+                )
+
+            self.used += cost
+            self.used_by_endpoint[endpoint] = self.used_by_endpoint.get(endpoint, 0) + cost
+
+        # 검색은 비용이 크므로 바로 저장, 나머지는 일정 간격으로 저장
+        if endpoint == 'search' or self.used % 50 == 0:
+            self.save()
+
+    def refund(self, endpoint):
+        """
+        charge()로 차감했지만 보내지 못한 호출의 비용 되돌리기
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+        """
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            self.used = max(0, self.used - cost)
+            self.used_by_endpoint[endpoint] = max(0, self.used_by_endpoint.get(endpoint, 0) - cost)
+
+    def mark_exhausted(self):
+        """API가 quotaExceeded를 반환한 경우 오늘 예산을 모두 쓴 것으로 처리"""
+        with self._lock:
+            self.exhausted = True
+        self.save()
+
+    def search_attempts_for_keyword(self, remaining_keywords, max_attempts=5,
+                                    page_cost=ESTIMATED_SEARCH_PAGE_COST):
+        """
+        남은 예산을 남은 키워드에 나눠서 이번 키워드의 최대 검색 횟수 계산
+
+        Args:
+            remaining_keywords (int): 이번 키워드를 포함한 남은 키워드 수
+            max_attempts (int): 키워드당 최대 검색 횟수 상한
+            page_cost (int): 검색 1회에 드는 예상 비용
+
+        Returns:
+            int: 이번 키워드에 허용할 검색 횟수 (0이면 검색 1회도 감당할 수 없음)
+        """
+        remaining = self.remaining
+        if remaining < QUOTA_COSTS['search'] + QUOTA_COSTS['channels']:
+            return 0
+
+        share = remaining // max(1, remaining_keywords)
+        # 몫이 부족해도 예산이 남아 있으면 최소 1회는 검색
+        return max(1, min(max_attempts, share // page_cost))
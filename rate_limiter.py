@@ -0,0 +1,139 @@
+"""
+API 호출 속도 제한기
+여러 스레드가 공유하는 토큰 버킷으로 초당 요청 수를 조절합니다.
+일시적인 오류(403 rateLimitExceeded, 429, 5xx)가 나면 속도를 줄이고,
+성공이 이어지면 설정한 최대 속도까지 조금씩 다시 올립니다.
+"""
+
+import random
+import threading
+import time
+
+
+# 재시도할 HTTP 상태 코드 (403은 사유를 보고 판단)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 재시도할 403 오류 사유 (quotaExceeded는 기다려도 풀리지 않으므로 제외)
+RETRYABLE_403_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+
+def is_retryable_error(error):
+    """
+    잠시 후 다시 시도하면 성공할 수 있는 오류인지 확인
+
+    Args:
+        error (Exception): API 호출 중 발생한 오류
+
+    Returns:
+        bool: 재시도 가능 여부
+    """
+    # 연결 끊김, 타임아웃 등 네트워크 오류
+    if isinstance(error, OSError):
+        return True
+
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is None:
+        return False
+    status = int(status)
+
+    if status in RETRYABLE_STATUS:
+        return True
+
+    if status == 403:
+        content = getattr(error, 'content', b'') or b''
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        return any(reason in content for reason in RETRYABLE_403_REASONS)
+
+    return False
+
+
+def backoff_delay(attempt, base=1.0, cap=32.0):
+    """
+    지수 백오프 대기 시간 계산 (full jitter)
+
+    Args:
+        attempt (int): 재시도 횟수 (0부터 시작)
+        base (float): 첫 재시도의 최대 대기 시간 (초)
+        cap (float): 최대 대기 시간 (초)
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RateLimiter:
+    def __init__(self, requests_per_second=10, burst=None, min_rate=0.5, adaptive=True):
+        """
+        속도 제한기 초기화
+
+        Args:
+            requests_per_second (float): 초당 최대 요청 수 (None 또는 0이면 제한 없음)
+            burst (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본값: 초당 요청 수)
+            min_rate (float): 오류가 계속될 때 내려갈 수 있는 최소 초당 요청 수
+            adaptive (bool): 오류율에 따라 속도를 자동 조절할지 여부
+        """
+        self.max_rate = requests_per_second
+        self.rate = requests_per_second
+        self.min_rate = min(min_rate, requests_per_second) if requests_per_second else min_rate
+        self.burst = burst or max(1, int(requests_per_second or 1))
+        self.adaptive = adaptive
+
+        self.successes = 0
+        self.errors = 0
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_second(self):
+        """현재 초당 요청 수 (오류에 따라 조절된 값)"""
+        return self.rate
+
+    def _refill(self, now):
+        """지난 시간만큼 토큰 채우기 (잠금을 잡은 상태에서 호출)"""
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """
+        요청 토큰을 얻을 때까지 대기
+        """
+        if not self.max_rate:
+            return
+
+        while True:
+            # 토큰 계산은 잠금 안에서, 대기는 잠금 밖에서 (다른 스레드가 막히지 않도록)
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+
+    def record_success(self):
+        """
+        요청 성공 기록 (성공이 이어지면 속도를 조금씩 올림)
+        """
+        with self._lock:
+            self.successes += 1
+            if self.adaptive and self.max_rate and self.rate < self.max_rate:
+                # 가산 증가: 초당 요청 수만큼 성공할 때마다 약 1씩 증가
+                self.rate = min(self.max_rate, self.rate + 1.0 / max(1.0, self.rate))
+
+    def record_error(self):
+        """
+        재시도 가능한 오류 기록 (속도를 절반으로 줄임)
+        """
+        with self._lock:
+            self.errors += 1
+            if self.adaptive and self.max_rate:
+                # 승산 감소: 한도에 걸리면 바로 절반으로
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
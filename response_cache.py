@@ -0,0 +1,171 @@
+"""
+YouTube API 응답 캐시
+SQLite 파일에 API 응답을 저장하여 같은 요청을 다시 보내지 않도록 합니다.
+엔드포인트별 유효 기간(TTL)과 최대 저장 개수(LRU 방식 삭제)를 지원합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+
+# 엔드포인트별 기본 유효 기간 (초)
+DEFAULT_TTLS = {
+    'search': 6 * 60 * 60,          # 검색 결과: 6시간
+    'channels': 24 * 60 * 60,       # 채널 정보: 1일
+    'playlistItems': 6 * 60 * 60,   # 최근 업로드: 6시간
+}
+
+
+class ResponseCache:
+    def __init__(self, path='youtube_api_cache.sqlite3', ttls=None, max_entries=50000):
+        """
+        응답 캐시 초기화
+
+        Args:
+            path (str): SQLite 캐시 파일 경로
+            ttls (dict): {엔드포인트: 유효 기간(초)} (지정하지 않은 엔드포인트는 기본값 사용)
+            max_entries (int): 최대 저장 개수 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_entries = max_entries
+
+        self.hits = {}
+        self.misses = {}
+        self._writes = 0
+
+        # 여러 스레드에서 사용하므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY,'
+            ' endpoint TEXT NOT NULL,'
+            ' response TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' last_access REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(endpoint, params):
+        """
+        엔드포인트와 정규화된 요청 파라미터로 캐시 키 생성
+
+        Args:
+            endpoint (str): API 엔드포인트 이름 (예: 'channels')
+            params (dict): 요청 파라미터
+
+        Returns:
+            str: 캐시 키
+        """
+        normalized = {}
+        for name, value in params.items():
+            if value is None:
+                continue
+            value = str(value)
+            # 쉼표로 구분된 목록(id, part)은 순서와 무관하게 같은 키가 되도록 정렬
+            if name in ('id', 'part'):
+                value = ','.join(sorted(v.strip() for v in value.split(',')))
+            normalized[name] = value
+
+        return endpoint + ':' + json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+    def get(self, endpoint, params):
+        """
+        캐시된 응답 가져오기
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+            params (dict): 요청 파라미터
+
+        Returns:
+            dict: 캐시된 응답 (없거나 만료되었으면 None)
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        ttl = self.ttls.get(endpoint, 0)
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response, created_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > ttl:
+                self.misses[endpoint] = self.misses.get(endpoint, 0) + 1
+                return None
+
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            self.hits[endpoint] = self.hits.get(endpoint, 0) + 1
+
+        return json.loads(row[0])
+
+    def set(self, endpoint, params, response):
+        """
+        응답을 캐시에 저장
+
+        Args:
+            endpoint (str): API 엔드포인트 이름
+            params (dict): 요청 파라미터
+            response (dict): API 응답
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, endpoint, response, created_at, last_access)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (key, endpoint, json.dumps(response, ensure_ascii=False), now, now)
+            )
+            self._writes += 1
+
+            # 매번 개수를 세지 않도록 일정 횟수마다 정리
+            if self._writes % 100 == 0:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """
+        만료된 항목과 최대 개수를 초과한 항목 삭제 (잠금을 잡은 상태에서 호출)
+        """
+        now = time.time()
+        for endpoint, ttl in self.ttls.items():
+            self._conn.execute(
+                'DELETE FROM responses WHERE endpoint = ? AND created_at < ?', (endpoint, now - ttl)
+            )
+
+        count = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                'DELETE FROM responses WHERE key IN ('
+                ' SELECT key FROM responses ORDER BY last_access LIMIT ?)',
+                (count - self.max_entries,)
+            )
+
+    def stats(self):
+        """
+        엔드포인트별 적중/실패 횟수
+
+        Returns:
+            dict: {엔드포인트: {'hits': int, 'misses': int}}
+        """
+        endpoints = sorted(set(self.hits) | set(self.misses))
+        return {
+            endpoint: {'hits': self.hits.get(endpoint, 0), 'misses': self.misses.get(endpoint, 0)}
+            for endpoint in endpoints
+        }
+
+    def close(self):
+        """캐시 파일 정리 후 연결 종료"""
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
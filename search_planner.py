@@ -0,0 +1,296 @@
+"""
+검색 계획
+검색(search.list)은 결과 수와 관계없이 한 번에 100 units이므로, 키워드마다 실제로 필터를 통과한 비율을 보고
+검색 한 번의 결과 수와 다음 검색 조건을 정합니다.
+
+- 통과 비율이 낮으면 항상 50개씩 요청 (같은 100 units로 후보를 최대한 받음)
+- 목표까지 몇 개 남지 않았고 통과 비율이 높으면 필요한 만큼만 요청 (최근 업로드일 조회 할당량 절약)
+- 한 검색 흐름(정렬 + 지역/언어)의 결과가 끝나거나 통과하는 채널이 더 나오지 않으면
+  다음 흐름(relevance → date → viewCount, 한국 채널이면 regionCode=KR/relevanceLanguage=ko 포함)으로 바꿈
+"""
+
+import math
+import threading
+
+from quota import QUOTA_COSTS
+
+
+# 검색 한 번의 최대 결과 수 (API 제한)
+MAX_PAGE_SIZE = 50
+
+# 아직 측정값이 없을 때 가정하는 통과 비율 (검색 결과 중 수집되는 비율)
+DEFAULT_YIELD = 0.2
+
+# 측정값과 섞을 때 가정값의 무게 (검색 결과 몇 개만큼으로 칠지)
+PRIOR_WEIGHT = 20
+
+# 필요한 만큼만 요청할 때 통과 비율 오차를 감안해 더 받는 배수
+SAFETY_FACTOR = 1.5
+
+# 통과한 채널이 없는 페이지가 이만큼 이어지면 그 검색 흐름은 끝난 것으로 봄
+DRY_PAGES = 2
+
+# 검색 흐름에 사용하는 정렬 순서
+ORDERS = ('relevance', 'date', 'viewCount')
+
+
+def build_streams(order='relevance', korean_only=True):
+    """
+    검색 흐름 목록 (앞에서부터 사용)
+
+    Args:
+        order (str): 처음 사용할 정렬 방식
+        korean_only (bool): True면 한국 지역/한국어 조건을 붙인 흐름도 사용
+
+    Returns:
+        list: [{'order', 'region_code', 'relevance_language'}]
+    """
+    orders = [order] + [other for other in ORDERS if other != order]
+    streams = [{'order': name, 'region_code': None, 'relevance_language': None} for name in orders]
+    if korean_only:
+        # 같은 정렬이라도 지역/언어 조건이 다르면 다른 결과가 나옴
+        streams += [{'order': name, 'region_code': 'KR', 'relevance_language': 'ko'} for name in orders]
+    return streams
+
+
+def stream_label(stream):
+    """출력용 검색 흐름 이름 (예: 'date/KR/ko')"""
+    return '/'.join(value for value in (stream['order'], stream['region_code'], stream['relevance_language']) if value)
+
+
+class YieldTracker:
+    """여러 키워드에 걸친 통과 비율 (새 키워드의 첫 검색 크기를 정할 때 사용)"""
+
+    def __init__(self, default=DEFAULT_YIELD):
+        self.default = default
+        self.results = 0
+        self.accepted = 0
+        self._lock = threading.Lock()
+
+    def observe(self, results, accepted):
+        """
+        키워드 하나의 결과 반영
+
+        Args:
+            results (int): 검색 결과 수
+            accepted (int): 그중 수집한 채널 수
+        """
+        with self._lock:
+            self.results += results
+            self.accepted += accepted
+
+    def rate(self):
+        """지금까지의 통과 비율 (측정값이 적으면 기본값 쪽으로)"""
+        with self._lock:
+            return (self.accepted + self.default * PRIOR_WEIGHT) / (self.results + PRIOR_WEIGHT)
+
+
+class SearchPlanner:
+    def __init__(self, order='relevance', korean_only=True, lookups=False, prior=DEFAULT_YIELD, state=None):
+        """
+        검색 계획 초기화
+
+        Args:
+            order (str): 처음 사용할 정렬 방식
+            korean_only (bool): True면 한국 지역/한국어 조건을 붙인 흐름도 사용
+            lookups (bool): 기본 필터를 통과한 채널마다 최근 업로드일을 조회하는지 (활동 필터 사용 여부)
+            prior (float): 측정값이 없을 때의 통과 비율 (다른 키워드의 측정값)
+            state (dict): 체크포인트에 저장했던 state() (있으면 이어서 진행)
+        """
+        self.lookups = lookups
+        self.prior = prior
+        self._lock = threading.Lock()
+
+        # page_token/exhausted는 검색 스레드가 다음 요청에 쓰는 위치 (미리 받은 페이지 포함),
+        # resume_token/finished는 필터링까지 끝난 페이지 기준의 위치 (체크포인트에 저장)
+        self.streams = [
+            dict(stream, page_token=None, exhausted=False, resume_token=None, finished=False,
+                 searches=0, pages=0, results=0, accepted=0, looked_up=0, dry_pages=0)
+            for stream in build_streams(order, korean_only)
+        ]
+        if state:
+            self._restore(state)
+
+    def _restore(self, state):
+        """저장된 상태 반영 (예전 체크포인트는 첫 번째 흐름의 page token만 있음)"""
+        if 'streams' not in state:
+            first = self.streams[0]
+            first['searches'] = first['pages'] = state.get('search_count', 0)
+            first['resume_token'] = state.get('page_token')
+            first['finished'] = bool(first['pages']) and not first['resume_token']
+        else:
+            saved = {stream_label(stream): stream for stream in state['streams']}
+            for stream in self.streams:
+                for field in ('resume_token', 'finished', 'searches', 'pages', 'results', 'accepted', 'looked_up',
+                              'dry_pages'):
+                    stream[field] = saved.get(stream_label(stream), {}).get(field, stream[field])
+
+        for stream in self.streams:
+            stream['page_token'] = stream['resume_token']
+            stream['exhausted'] = stream['finished']
+
+    def state(self):
+        """
+        체크포인트에 저장할 상태 (필터링까지 끝난 페이지 기준)
+
+        Returns:
+            dict: {'streams': [흐름별 위치와 통계]}
+        """
+        fields = ('order', 'region_code', 'relevance_language', 'resume_token', 'finished',
+                  'searches', 'pages', 'results', 'accepted', 'looked_up', 'dry_pages')
+        with self._lock:
+            return {'streams': [{field: stream[field] for field in fields} for stream in self.streams]}
+
+    @property
+    def search_count(self):
+        """필터링까지 끝난 검색 횟수 (모든 흐름 합계)"""
+        with self._lock:
+            return sum(stream['pages'] for stream in self.streams)
+
+    def yield_rate(self):
+        """이 키워드의 통과 비율 (검색 결과가 적으면 prior 쪽으로)"""
+        with self._lock:
+            return self._yield_rate()
+
+    def _yield_rate(self):
+        results = sum(stream['results'] for stream in self.streams)
+        accepted = sum(stream['accepted'] for stream in self.streams)
+        return (accepted + self.prior * PRIOR_WEIGHT) / (results + PRIOR_WEIGHT)
+
+    def observed(self):
+        """
+        이 키워드에서 필터링까지 끝난 검색 결과 수와 수집한 채널 수
+
+        Returns:
+            tuple: (results, accepted)
+        """
+        with self._lock:
+            return (sum(stream['results'] for stream in self.streams),
+                    sum(stream['accepted'] for stream in self.streams))
+
+    def _lookup_rate(self):
+        """검색 결과 하나당 최근 업로드일 조회 수 (측정값이 없으면 통과 비율의 2배로 가정)"""
+        results = sum(stream['results'] for stream in self.streams)
+        looked_up = sum(stream['looked_up'] for stream in self.streams)
+        if not results:
+            return min(1.0, self._yield_rate() * 2)
+        return looked_up / results
+
+    def _expected_units_per_channel(self, size, needed, yield_rate, lookup_rate):
+        """검색 결과 size개를 요청할 때 수집 채널 하나당 예상 할당량"""
+        units = (QUOTA_COSTS['search'] + math.ceil(size / MAX_PAGE_SIZE) * QUOTA_COSTS['channels'] +
+                 (size * lookup_rate * QUOTA_COSTS['playlistItems'] if self.lookups else 0))
+        accepted = min(size * yield_rate, needed)
+        return units / accepted if accepted > 0 else math.inf
+
+    def page_size(self, needed):
+        """
+        이번 검색의 결과 수
+
+        Args:
+            needed (int): 목표까지 남은 채널 수 (대기 중인 후보 제외)
+
+        Returns:
+            int: 1~50
+        """
+        with self._lock:
+            yield_rate = self._yield_rate()
+            lookup_rate = self._lookup_rate()
+
+        if needed <= 0 or yield_rate <= 0:
+            return MAX_PAGE_SIZE
+
+        # 필요한 만큼(여유 포함)만 받는 것과 50개를 받는 것 중 채널당 할당량이 적은 쪽
+        enough = min(MAX_PAGE_SIZE, max(1, math.ceil(needed / yield_rate * SAFETY_FACTOR)))
+        if enough == MAX_PAGE_SIZE:
+            return MAX_PAGE_SIZE
+        full = self._expected_units_per_channel(MAX_PAGE_SIZE, needed, yield_rate, lookup_rate)
+        partial = self._expected_units_per_channel(enough, needed, yield_rate, lookup_rate)
+        return enough if partial < full else MAX_PAGE_SIZE
+
+    def next_request(self, needed):
+        """
+        다음 검색 조건
+
+        Args:
+            needed (int): 목표까지 남은 채널 수
+
+        Returns:
+            dict: {'stream', 'order', 'region_code', 'relevance_language', 'page_token', 'max_results'}
+                  (모든 흐름이 끝났으면 None)
+        """
+        size = self.page_size(needed)
+        with self._lock:
+            for index, stream in enumerate(self.streams):
+                if not stream['exhausted']:
+                    return {
+                        'stream': index,
+                        'order': stream['order'],
+                        'region_code': stream['region_code'],
+                        'relevance_language': stream['relevance_language'],
+                        'page_token': stream['page_token'],
+                        'max_results': size,
+                    }
+        return None
+
+    def record_page(self, index, result_count, next_token):
+        """
+        검색 결과 반영 (다음 페이지가 없으면 그 흐름은 더 검색하지 않음)
+
+        Args:
+            index (int): next_request()의 'stream'
+            result_count (int): 받은 결과 수
+            next_token (str): 다음 페이지 토큰
+        """
+        with self._lock:
+            stream = self.streams[index]
+            stream['searches'] += 1
+            stream['page_token'] = next_token
+            if not result_count or not next_token:
+                stream['exhausted'] = True
+
+    def record_outcome(self, index, results, accepted, next_token, looked_up=0, complete=True):
+        """
+        필터링을 마친 페이지 반영 (통과한 채널이 없는 페이지가 이어지면 그 흐름은 끝)
+
+        Args:
+            index (int): next_request()의 'stream'
+            results (int): 이 페이지에서 필터링한 검색 결과 수
+            accepted (int): 이 페이지에서 수집한 채널 수
+            next_token (str): 이 페이지 응답의 다음 페이지 토큰
+            looked_up (int): 이 페이지에서 최근 업로드일을 조회한 채널 수
+            complete (bool): False면 목표를 채워 페이지 중간에 멈춘 경우 (통과 비율에만 반영)
+        """
+        with self._lock:
+            stream = self.streams[index]
+            stream['results'] += results
+            stream['accepted'] += accepted
+            stream['looked_up'] += looked_up
+            if not complete:
+                return
+
+            stream['pages'] += 1
+            stream['resume_token'] = next_token
+            stream['dry_pages'] = 0 if accepted else stream['dry_pages'] + 1
+            if not results or not next_token or stream['dry_pages'] >= DRY_PAGES:
+                stream['finished'] = True
+                stream['exhausted'] = True
+
+    def summary(self):
+        """
+        사용한 검색 흐름별 결과
+
+        Returns:
+            list: [{'stream', 'searches', 'results', 'accepted', 'finished'}] (검색한 흐름만)
+        """
+        with self._lock:
+            return [
+                {
+                    'stream': stream_label(stream),
+                    'searches': stream['searches'],
+                    'results': stream['results'],
+                    'accepted': stream['accepted'],
+                    'finished': stream['finished'],
+                }
+                for stream in self.streams if stream['searches']
+            ]
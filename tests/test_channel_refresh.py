@@ -0,0 +1,77 @@
+"""
+channel_refresh 테스트 (가짜 API 사용)
+"""
+
+import copy
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fake_youtube import FakeYouTube, load_fixture_channels  # noqa: E402
+from api_keys import ApiKeyPool  # noqa: E402
+from channel_refresh import REFRESH_BATCH_SIZE, ChannelRefresher, assign_batches  # noqa: E402
+from channel_store import load_channel_file, save_channel_file  # noqa: E402
+from quota import QuotaTracker  # noqa: E402
+from youtube_channel_crawler import YouTubeChannelCrawler  # noqa: E402
+
+
+def make_crawler(fake):
+    """가짜 API를 쓰는 크롤러 (할당량/키 상태 파일 없음)"""
+    return YouTubeChannelCrawler(
+        None,
+        requests_per_second=None,
+        quota=QuotaTracker(10 ** 9, state_file=None),
+        key_pool=ApiKeyPool(['test-key'], client_factory=fake.client_factory, per_key_budget=10 ** 9,
+                            state_file=None)
+    )
+
+
+def test_assign_batches_keeps_existing_batches():
+    """새 채널이 추가되어도 이미 정한 묶음 구성은 바뀌지 않음"""
+    ids = [f'UC{i:04d}' for i in range(1, 2 * REFRESH_BATCH_SIZE + 1)]
+    batches = assign_batches([], ids)
+    before = copy.deepcopy(batches)
+
+    # 정렬하면 맨 앞에 오는 채널을 추가
+    assign_batches(batches, ids + ['UC0000'])
+
+    assert batches[:len(before)] == before
+    assert batches[-1] == ['UC0000']
+
+
+def test_not_due_channel_gets_current_values_after_304(tmp_path, monkeypatch, capsys):
+    """갱신 대상이 아니던 채널도 묶음 조회 결과로 갱신되어, 이후 304를 받아도 최신 값을 가짐"""
+    monkeypatch.chdir(tmp_path)
+    records = load_fixture_channels(ROOT)[:2]
+    fake = FakeYouTube(copy.deepcopy(records))
+    a_id, b_id = records[0]['channel_id'], records[1]['channel_id']
+
+    # 저장된 B의 구독자 수는 예전 값, API는 새 값
+    stored = copy.deepcopy(records)
+    stored[1]['subscriber_count'] = '4810'
+    fake._by_id[b_id]['subscriber_count'] = '999999'
+    path = str(tmp_path / '260101_youtube_channels_test.jsonl')
+    save_channel_file(path, stored)
+
+    # B는 방금 갱신한 것으로 기록 (첫 실행에서 갱신 대상 아님)
+    with open('channel_history.jsonl', 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'channel_id': b_id, 'refreshed_at': datetime.now(timezone.utc).isoformat()}) + '\n')
+
+    crawler = make_crawler(fake)
+    first = ChannelRefresher(crawler, refresh_hours=24).refresh([path])
+    assert first['due'] == 1
+    assert first['updated'] == 2
+
+    # 두 번째 실행: 모두 갱신 대상, 묶음이 같으므로 ETag가 맞아 304
+    second = ChannelRefresher(crawler, refresh_hours=0).refresh([path])
+    assert second['not_modified'] == 2
+    assert fake.not_modified == 1
+
+    records_after = load_channel_file(path)
+    assert records_after[b_id]['subscriber_count'] == '999999'
+    assert records_after[a_id]['subscriber_count'] == records[0]['subscriber_count']
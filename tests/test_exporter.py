@@ -0,0 +1,54 @@
+"""
+exporter 테스트
+"""
+
+import glob
+import os
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from exporter import MERGED_NAME, export_files  # noqa: E402
+
+
+def copy_fixtures(directory):
+    """저장된 채널 파일을 임시 폴더로 복사"""
+    files = []
+    for path in sorted(glob.glob(os.path.join(ROOT, '*_youtube_channels_*.json'))):
+        target = os.path.join(directory, os.path.basename(path))
+        shutil.copy(path, target)
+        files.append(target)
+    return files
+
+
+def read(path):
+    """파일 내용 (바이트)"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_only_changed_exports_changed_files_and_same_merged(tmp_path):
+    """바뀐 파일만 다시 내보내고, 병합본은 전체를 내보낸 것과 같음"""
+    files = copy_fixtures(str(tmp_path))
+    output_dir = str(tmp_path / 'exports')
+    merged_path = os.path.join(output_dir, f'{MERGED_NAME}.csv')
+
+    written = export_files(files, output_dir=output_dir, fmt='csv', only_changed=True)
+    assert len(written) == len(files) + 1
+
+    # 바뀐 파일이 없으면 아무것도 쓰지 않음
+    assert export_files(files, output_dir=output_dir, fmt='csv', only_changed=True) == []
+
+    # 파일 하나가 바뀌면 그 파일과 병합본만 다시 씀
+    changed = files[0]
+    os.utime(changed, (os.path.getmtime(merged_path) + 10,) * 2)
+    written = export_files(files, output_dir=output_dir, fmt='csv', only_changed=True)
+    part = os.path.join(output_dir, os.path.splitext(os.path.basename(changed))[0] + '.csv')
+    assert written == [part, merged_path]
+
+    # 전체를 다시 내보낸 결과와 같음
+    full_dir = str(tmp_path / 'full')
+    export_files(files, output_dir=full_dir, fmt='csv')
+    assert read(merged_path) == read(os.path.join(full_dir, f'{MERGED_NAME}.csv'))
@@ -0,0 +1,60 @@
+"""
+http_transport 테스트 (실제 googleapiclient 요청을 만들고, 보내는 헤더를 가짜 연결에서 확인)
+"""
+
+import os
+import sys
+
+import httplib2
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from api_keys import ApiKeyPool  # noqa: E402
+from http_transport import HttpPool  # noqa: E402
+from quota import QuotaTracker  # noqa: E402
+from youtube_channel_crawler import YouTubeChannelCrawler, build_youtube_client  # noqa: E402
+
+
+class RecordingHttp:
+    """보낸 요청의 헤더를 기록하고 빈 응답을 돌려주는 연결"""
+
+    def __init__(self):
+        self.sent_headers = []
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        self.sent_headers.append(dict(headers or {}))
+        return httplib2.Response({'status': '200'}), b'{"items": []}'
+
+
+def test_sent_headers_keep_gzip_and_deflate():
+    """googleapiclient가 붙이는 압축 헤더를 줄이거나 중복하지 않고 그대로 보냄"""
+    http = RecordingHttp()
+    crawler = YouTubeChannelCrawler(
+        None,
+        requests_per_second=None,
+        quota=QuotaTracker(10 ** 9, state_file=None),
+        key_pool=ApiKeyPool(['test-key'], client_factory=build_youtube_client, state_file=None),
+        transport=HttpPool(factory=lambda: http)
+    )
+
+    crawler._execute('channels', part='statistics', id='UC1234')
+
+    headers = http.sent_headers[0]
+    assert headers['accept-encoding'] == 'gzip, deflate'
+    assert headers['user-agent'].count('gzip') == 1
+
+
+def test_prepare_adds_only_missing_headers():
+    """압축 헤더가 없는 요청에는 추가하고, 이미 있는 값은 줄이지 않음"""
+    class Request:
+        def __init__(self, headers):
+            self.headers = headers
+
+    bare = Request({})
+    HttpPool.prepare(bare)
+    assert bare.headers == {'accept-encoding': 'gzip, deflate', 'user-agent': '(gzip)'}
+
+    identity = Request({'accept-encoding': 'br', 'user-agent': 'client/1.0'})
+    HttpPool.prepare(identity)
+    assert identity.headers == {'accept-encoding': 'br, gzip', 'user-agent': 'client/1.0 (gzip)'}
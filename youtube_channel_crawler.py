@@ -3,25 +3,316 @@ YouTube 채널 정보 크롤러
 YouTube Data API v3를 사용하여 검색어로 채널을 찾고 채널 정보를 수집합니다.
 """
 
-from googleapiclient.discovery import build
+import time
+
+# 모듈 로드 시작 시각 (시작 시간 측정용)
+IMPORT_STARTED = time.perf_counter()
+
 from googleapiclient.errors import HttpError
+import argparse
 import json
+import math
 import os
 import re
-from datetime import datetime, timedelta
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
+import contact_extractor
+from api_fields import (
+    PayloadStats, channel_selection, reference_params, search_selection, statistics_selection, upload_date_selection
+)
+from api_keys import ApiKeyPool, load_api_keys_from_env
+from channel_index import ChannelIndex
+from channel_record import ChannelRecord
+from channel_query import SORT_COLUMNS, ChannelDatabase
+from channel_refresh import ChannelRefresher
+from channel_reprocess import REPROCESS_FIELDS, ChannelReprocessor
+from channel_store import (
+    JsonlChannelStore, find_channel_files, jsonl_path_for, load_channel_file, load_json_ids, write_json_array
+)
+from checkpoint import CrawlCheckpoint
+from exporter import export_files, parquet_available
+from http_transport import HttpPool
+from instrumentation import Metrics, units_per_accepted
+from pipeline import Pipeline
+from quota import QUOTA_COSTS, QuotaExhausted, QuotaTracker, is_quota_exceeded_error
+from rate_limiter import RateLimiter, backoff_delay, is_retryable_error
+from response_cache import ResponseCache
+from search_planner import SearchPlanner, YieldTracker, stream_label
+
+# 모듈 로드에 걸린 시간 (초)
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+
+_discovery_lock = threading.Lock()
+_discovery_document = None
+
+
+def load_discovery_document():
+    """
+    YouTube Data API v3 discovery 문서 (googleapiclient에 포함된 정적 파일, 네트워크 요청 없음)
+    프로세스에서 한 번만 읽고, 키가 여러 개여도 같은 문서로 클라이언트를 만듭니다.
+    
+    Returns:
+        dict: discovery 문서
+    """
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            from googleapiclient.discovery_cache import get_static_doc
+            
+            document = get_static_doc('youtube', 'v3')
+            if document is None:
+                raise RuntimeError("googleapiclient에 YouTube Data API v3 discovery 문서가 없습니다 "
+                                   "(google-api-python-client를 다시 설치하세요)")
+            _discovery_document = json.loads(document)
+        return _discovery_document
+
+
+def build_youtube_client(api_key):
+    """
+    API 키로 YouTube Data API 클라이언트 생성 (정적 discovery 문서 사용)
+    
+    Args:
+        api_key (str): YouTube Data API 키
+    
+    Returns:
+        googleapiclient 리소스 객체
+    """
+    # googleapiclient.discovery는 불러오는 데 오래 걸리므로 첫 API 요청 때 불러옴
+    from googleapiclient.discovery import build_from_document
+    
+    return build_from_document(load_discovery_document(), developerKey=api_key)
+
+
+# channels.list 한 번에 조회할 수 있는 최대 채널 ID 수
+MAX_IDS_PER_REQUEST = 50
+
+# 필터 제외 사유별 출력 메시지
+REJECT_MESSAGES = {
+    'duplicate': '이미 존재하는 채널',
+    'indexed': '다른 키워드에서 이미 조회한 채널',
+    'not_korean': '한국 채널 아님',
+    'too_old': '채널 개설 {channel_age_months}개월 초과',
+    'no_contact': '연락처 없음',
+    'no_uploads': '업로드 영상 없음',
+    'inactive': '최근 {last_upload_months}개월간 활동 없음',
+}
+REJECT_REASONS = tuple(REJECT_MESSAGES)
+
+# channels.list 응답만으로 판단하는 저비용 필터의 제외 사유
+BASIC_FILTER_REASONS = ('not_korean', 'too_old', 'no_contact')
+
+
+class SharedFetchCache:
+    """
+    여러 작업자 스레드가 공유하는 조회 결과 저장소
+    같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 API를 호출하고 나머지는 결과를 기다립니다.
+    """
+    
+    def __init__(self):
+        self._results = {}
+        self._in_flight = {}  # {키: 조회가 끝나면 설정되는 Event}
+        self._lock = threading.Lock()
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._results
+    
+    def fetch(self, keys, loader):
+        """
+        저장된 결과를 돌려주고, 없는 키만 loader로 조회
+        
+        Args:
+            keys (list): 조회할 키 리스트
+            loader (callable): 키 리스트를 받아 {키: 결과}를 돌려주는 함수
+        
+        Returns:
+            dict: {키: 결과} (조회되지 않은 키는 제외)
+        """
+        found = {}
+        mine = []
+        waiting = []
+        
+        with self._lock:
+            for key in keys:
+                if key in self._results:
+                    found[key] = self._results[key]
+                elif key in self._in_flight:
+                    waiting.append((key, self._in_flight[key]))
+                elif key not in mine:
+                    self._in_flight[key] = threading.Event()
+                    mine.append(key)
+        
+        loaded = {}
+        try:
+            if mine:
+                loaded = loader(mine)
+        finally:
+            with self._lock:
+                for key in mine:
+                    if key in loaded:
+                        self._results[key] = loaded[key]
+                    self._in_flight.pop(key).set()
+        
+        found.update(loaded)
+        
+        # 다른 스레드가 조회 중인 키는 끝날 때까지 기다렸다가 결과 사용
+        for key, done in waiting:
+            done.wait()
+            with self._lock:
+                if key in self._results:
+                    found[key] = self._results[key]
+        
+        return found
+
 
 class YouTubeChannelCrawler:
-    def __init__(self, api_key):
+    def __init__(self, api_key, max_workers=8, requests_per_second=10, pipeline_depth=2, cache=None,
+                 quota=None, max_retries=5, key_pool=None, index=None, metrics=None, retry_delay=1.0,
+                 transport=None, payload_stats=None):
         """
         YouTube Data API 클라이언트 초기화
         
         Args:
-            api_key (str): YouTube Data API 키
+            api_key (str): YouTube Data API 키 (key_pool을 지정하면 무시)
+            max_workers (int): 최근 업로드일 동시 조회 스레드 수 (기본값: 8)
+            requests_per_second (float): 초당 최대 API 요청 수 (None이면 제한 없음)
+            pipeline_depth (int): 크롤링 단계 사이에 대기할 수 있는 최대 페이지 수 (기본값: 2)
+            cache (ResponseCache): API 응답 캐시 (None이면 캐시 사용 안 함)
+            quota (QuotaTracker): 할당량 관리자 (None이면 할당량을 계산하지 않음)
+            max_retries (int): 일시적인 오류(403 rateLimitExceeded, 429, 5xx) 재시도 횟수
+            key_pool (ApiKeyPool): 여러 API 키를 돌려 쓰는 키 풀 (None이면 api_key 하나만 사용)
+            index (ChannelIndex): 전체 키워드 공통 채널 색인 (None이면 키워드 파일 안에서만 중복 확인)
+            metrics (Metrics): API 호출 계측기 (None이면 새로 만듦)
+            retry_delay (float): 첫 재시도의 최대 대기 시간 (초, 이후 지수적으로 늘어남)
+            transport (HttpPool): HTTP 연결 풀 (None이면 새로 만듦, acquire/release/prepare를 가진 객체면 교체 가능)
+            payload_stats (PayloadStats): 응답 크기 기록 (지정하면 엔드포인트마다 한 번 필드를 고르지 않은 요청을
+                                          추가로 보내서 줄어든 크기를 비교, None이면 기록하지 않음)
         """
-        self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        if key_pool is None:
+            key_pool = ApiKeyPool([api_key], client_factory=build_youtube_client, state_file=None)
+        self.key_pool = key_pool
+        self.api_key = key_pool.keys[0].key
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.pipeline_depth = pipeline_depth
+        self.cache = cache
+        self.quota = quota
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.index = index
+        self.metrics = metrics if metrics is not None else Metrics()
+        
+        # httplib2는 스레드 안전하지 않으므로 연결 풀에서 요청마다 연결 하나를 빌려 씀 (keep-alive 연결 재사용)
+        self.transport = transport if transport is not None else HttpPool(max_idle=max_workers * 2)
+        self.payload_stats = payload_stats
+        
+        # 키워드끼리 공유하는 검색 결과 통과 비율 (새 키워드의 첫 검색 크기 결정용)
+        self.search_yield = YieldTracker()
+        
+        # 키워드끼리 공유하는 조회 결과 (여러 키워드에서 찾은 채널도 한 번만 요청)
+        self._seen_channels = {}  # {요청 필드(ApiSelection): SharedFetchCache}
+        self._seen_uploads = SharedFetchCache()
+        
+        # 할당량이 모자라 목표를 채우지 못하고 멈춘 키워드 (다음 --resume에서 이어서 진행)
+        self.quota_stopped = set()
+    
+    def _execute(self, endpoint, etag=None, use_cache=True, **params):
+        """
+        API 요청 실행 (캐시에 있으면 캐시 사용, 없으면 속도 제한을 지키며 연결 풀에서 빌린 연결로 요청)
+        일시적인 오류는 지수 백오프(jitter 포함)로 재시도하고, 속도 제한기가 오류율에 맞춰 속도를 조절합니다.
+        
+        Args:
+            endpoint (str): API 엔드포인트 이름 ('search', 'channels', 'playlistItems')
+            etag (str): 이전 응답의 ETag (지정하면 바뀌지 않았을 때 본문 없이 304 응답)
+            use_cache (bool): False면 캐시를 읽지도 저장하지도 않음
+            **params: list() 요청 파라미터
+        
+        Returns:
+            dict: API 응답 (etag를 지정했는데 바뀌지 않았으면 None)
+        
+        Raises:
+            QuotaExhausted: 할당량 예산을 모두 사용한 경우
+        """
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                self.metrics.record_cache_hit(endpoint)
+                return cached
+        
+        attempt = 0
+        while True:
+            # 남은 할당량이 가장 많은 키를 골라 비용 차감 (예산 부족 시 QuotaExhausted, 재시도도 비용이 듦)
+            # 예산이 이번 호출에 모자랄 뿐이면 비용이 작은 다른 호출은 계속 보낼 수 있음
+            if self.quota is not None:
+                self.quota.charge(endpoint)
+            try:
+                api_key = self.key_pool.acquire(endpoint)
+            except QuotaExhausted:
+                if self.quota is not None:
+                    self.quota.refund(endpoint)
+                    # 모든 키가 quotaExceeded를 반환했으면 오늘은 더 요청할 수 없음
+                    if not self.key_pool.available_count:
+                        self.quota.mark_exhausted()
+                raise
+            
+            self.rate_limiter.acquire()
+            request = getattr(api_key.client, endpoint)().list(**params)
+            self.transport.prepare(request)
+            if etag:
+                request.headers['If-None-Match'] = etag
+            http = self.transport.acquire()
+            started = time.perf_counter()
+            try:
+                response = request.execute(http=http)
+            except (HttpError, OSError) as e:
+                elapsed = time.perf_counter() - started
+                # HTTP 오류 응답은 연결을 계속 쓸 수 있지만, 연결 오류는 새 연결로 재시도하도록 버림
+                self.transport.release(http, reusable=isinstance(e, HttpError))
+                if etag and isinstance(e, HttpError) and int(e.resp.status) == 304:
+                    # 이전 응답과 같음 (본문 없음)
+                    self.metrics.record_call(endpoint, elapsed, QUOTA_COSTS.get(endpoint, 1), not_modified=True)
+                    self.rate_limiter.record_success()
+                    return None
+                
+                self.metrics.record_call(endpoint, elapsed, QUOTA_COSTS.get(endpoint, 1), error=e)
+                
+                if isinstance(e, HttpError) and is_quota_exceeded_error(e):
+                    # 이 키는 오늘 사용 중지하고 남은 키로 다시 요청 (키가 없으면 다음 반복에서 QuotaExhausted)
+                    self.key_pool.retire(api_key)
+                    continue
+                
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise
+                
+                attempt += 1
+                self.rate_limiter.record_error()
+                delay = backoff_delay(attempt - 1, base=self.retry_delay)
+                print(f"  ↻ 일시적인 API 오류 - {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries}): {e}")
+                time.sleep(delay)
+                continue
+            
+            self.transport.release(http)
+            self.metrics.record_call(endpoint, time.perf_counter() - started, QUOTA_COSTS.get(endpoint, 1))
+            self.rate_limiter.record_success()
+            break
+        
+        if use_cache:
+            self.cache.set(endpoint, params, response)
+        
+        # 필드를 고른 응답 크기 기록 (엔드포인트마다 한 번은 필드를 고르지 않은 같은 요청과 비교)
+        if self.payload_stats is not None and 'fields' in params:
+            self.payload_stats.record(endpoint, response)
+            if self.payload_stats.claim_sample(endpoint):
+                reference = self._execute(endpoint, use_cache=False, **reference_params(endpoint, params))
+                if reference is not None:
+                    self.payload_stats.record_sample(endpoint, response, reference)
+        
+        return response
     
     @staticmethod
     def load_existing_data(filename='youtube_channels.json'):
@@ -32,18 +323,15 @@ class YouTubeChannelCrawler:
             filename (str): JSON 파일명
         
         Returns:
-            dict: {channel_id: channel_data} 형태의 딕셔너리
+            dict: {channel_id: ChannelRecord} 형태의 딕셔너리
         """
         if not os.path.exists(filename):
             print(f"ℹ️  기존 파일 없음 - 새로 시작합니다")
             return {}
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # channel_id를 키로 하는 딕셔너리로 변환
-            existing = {item['channel_id']: item for item in data}
+            # channel_id를 키로 하는 딕셔너리로 변환 (배열 전체를 한 번에 읽지 않고 항목별로)
+            existing = load_channel_file(filename)
             print(f"✓ 기존 데이터 로드: {len(existing)}개 채널")
             return existing
             
@@ -52,12 +340,37 @@ class YouTubeChannelCrawler:
             return {}
     
     @staticmethod
-    def make_safe_filename(query):
+    def load_existing_ids(filename='youtube_channels.json'):
+        """
+        기존 JSON 파일에서 채널 ID만 로드 (중복 확인용, 파일이 커져도 메모리 사용량이 거의 늘지 않음)
+        
+        Args:
+            filename (str): JSON 파일명
+        
+        Returns:
+            set: 채널 ID 집합
+        """
+        if not os.path.exists(filename):
+            print(f"ℹ️  기존 파일 없음 - 새로 시작합니다")
+            return set()
+        
+        try:
+            existing_ids = load_json_ids(filename)
+            print(f"✓ 기존 데이터 로드: {len(existing_ids)}개 채널")
+            return existing_ids
+            
+        except Exception as e:
+            print(f"⚠️  기존 파일 로드 실패: {e}")
+            return set()
+    
+    @staticmethod
+    def make_safe_filename(query, extension='.json'):
         """
         검색어를 안전한 파일명으로 변환
         
         Args:
             query (str): 검색어
+            extension (str): 파일 확장자 ('.json' 또는 '.jsonl')
         
         Returns:
             str: 안전한 파일명
@@ -72,7 +385,7 @@ class YouTubeChannelCrawler:
         # 최대 50자로 제한
         safe_query = safe_query[:50]
         
-        return f"{date_prefix}_youtube_channels_{safe_query}.json"
+        return f"{date_prefix}_youtube_channels_{safe_query}{extension}"
     
     @staticmethod
     def extract_email(text):
@@ -85,17 +398,7 @@ class YouTubeChannelCrawler:
         Returns:
             str: 찾은 이메일 주소 또는 빈 문자열
         """
-        if not text:
-            return ''
-        
-        # 이메일 정규표현식 패턴
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        
-        # 이메일 찾기
-        emails = re.findall(email_pattern, text)
-        
-        # 첫 번째 이메일 반환 (없으면 빈 문자열)
-        return emails[0] if emails else ''
+        return contact_extractor.extract_email(text)
     
     @staticmethod
     def is_korean_text(text):
@@ -108,14 +411,7 @@ class YouTubeChannelCrawler:
         Returns:
             bool: 한국어 포함 여부
         """
-        if not text:
-            return False
-        
-        # 한글 유니코드 범위: AC00-D7A3
-        korean_pattern = re.compile('[가-힣]+')
-        
-        # 한글이 있는지 확인
-        return bool(korean_pattern.search(text))
+        return contact_extractor.is_korean_text(text)
     
     @staticmethod
     def extract_contact_info(text):
@@ -128,65 +424,10 @@ class YouTubeChannelCrawler:
         Returns:
             dict: 추출된 연락처 정보
         """
-        if not text:
-            return {
-                'email': '',
-                'phone': '',
-                'kakao': '',
-                'other_links': []
-            }
-        
-        contact_info = {
-            'email': '',
-            'phone': '',
-            'kakao': '',
-            'other_links': []
-        }
-        
-        # 이메일
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact_info['email'] = emails[0]
-        
-        # 전화번호 (한국)
-        phone_patterns = [
-            r'010[-\s]?\d{4}[-\s]?\d{4}',
-            r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}',
-            r'\+82[-\s]?10[-\s]?\d{4}[-\s]?\d{4}'
-        ]
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                contact_info['phone'] = matches[0]
-                break
-        
-        # 카카오톡 ID
-        kakao_patterns = [
-            r'카카오[톡]?[:\s]+([a-zA-Z0-9_-]+)',
-            r'kakao[talk]?[:\s]+([a-zA-Z0-9_-]+)',
-        ]
-        for pattern in kakao_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                contact_info['kakao'] = matches[0]
-                break
-        
-        # 기타 연락 방법 (네이버 블로그, 개인 사이트 등)
-        url_pattern = r'https?://[^\s<>"\)]+|www\.[^\s<>"\)]+'
-        urls = re.findall(url_pattern, text)
-        # 유튜브, 소셜미디어 링크 제외하고 개인 연락 링크만
-        contact_urls = []
-        exclude_domains = ['youtube.com', 'youtu.be', 'instagram.com', 'twitter.com', 'facebook.com', 'x.com']
-        for url in urls:
-            if not any(domain in url.lower() for domain in exclude_domains):
-                contact_urls.append(url)
-        
-        contact_info['other_links'] = contact_urls[:3]  # 최대 3개까지
-        
-        return contact_info
-    
-    def search_channels(self, query, max_results=10, order='relevance', page_token=None):
+        return contact_extractor.extract_contact_info(text)
+    
+    def search_channels(self, query, max_results=10, order='relevance', page_token=None,
+                        region_code=None, relevance_language=None):
         """
         검색어로 채널 검색
         
@@ -195,33 +436,38 @@ class YouTubeChannelCrawler:
             max_results (int): 최대 결과 수 (기본값: 10)
             order (str): 정렬 방식 - 'relevance'(관련성), 'date'(최신순), 'viewCount'(조회수순)
             page_token (str): 다음 페이지 토큰 (페이지네이션용)
+            region_code (str): 지역 코드 (예: 'KR', None이면 지정 안 함)
+            relevance_language (str): 우선할 언어 (예: 'ko', None이면 지정 안 함)
         
         Returns:
             tuple: (channels 리스트, next_page_token)
         """
         try:
-            # 채널 타입만 검색
+            # 채널 타입만 검색 (채널 ID와 제목만 받음, 설명은 channels.list에서 받음)
+            selection = search_selection()
             search_params = {
                 'q': query,
                 'type': 'channel',
-                'part': 'id,snippet',
+                'part': selection.part,
+                'fields': selection.fields,
                 'maxResults': max_results,
                 'order': order
             }
             
             if page_token:
                 search_params['pageToken'] = page_token
+            if region_code:
+                search_params['regionCode'] = region_code
+            if relevance_language:
+                search_params['relevanceLanguage'] = relevance_language
             
-            search_response = self.youtube.search().list(**search_params).execute()
+            search_response = self._execute('search', **search_params)
             
             channels = []
             for item in search_response.get('items', []):
-                channel_id = item['id']['channelId']
-                channel_title = item['snippet']['title']
                 channels.append({
-                    'channel_id': channel_id,
-                    'title': channel_title,
-                    'description': item['snippet']['description']
+                    'channel_id': item['id']['channelId'],
+                    'title': item['snippet']['title'],
                 })
             
             next_page_token = search_response.get('nextPageToken')
@@ -232,6 +478,8 @@ class YouTubeChannelCrawler:
                 'viewCount': '조회수순'
             }.get(order, order)
             
+            if region_code or relevance_language:
+                order_text += ', ' + '/'.join(value for value in (region_code, relevance_language) if value)
             page_info = f" (추가 페이지)" if page_token else ""
             print(f"✓ 검색어 '{query}'로 {len(channels)}개 채널 발견 ({order_text}){page_info}")
             
@@ -244,11 +492,28 @@ class YouTubeChannelCrawler:
     def get_last_upload_date(self, channel_id, channel_data):
         """
         채널의 최근 업로드 영상 날짜 가져오기
+        (이번 실행에서 다른 키워드로 이미 조회한 채널은 다시 요청하지 않음)
         
         Args:
             channel_id (str): 채널 ID
             channel_data (dict): 채널 정보 (이미 가져온 경우)
         
+        Returns:
+            str: 최근 업로드 날짜 (ISO 8601 형식) 또는 None
+        """
+        uploads = self._seen_uploads.fetch(
+            [channel_id],
+            lambda ids: {channel_id: self._request_last_upload_date(channel_data)}
+        )
+        return uploads.get(channel_id)
+    
+    def _request_last_upload_date(self, channel_data):
+        """
+        uploads 플레이리스트에서 최근 업로드 영상 날짜 요청
+        
+        Args:
+            channel_data (dict): channels.list 응답의 채널 항목
+        
         Returns:
             str: 최근 업로드 날짜 (ISO 8601 형식) 또는 None
         """
@@ -262,11 +527,14 @@ class YouTubeChannelCrawler:
                 return None
             
             # 최신 업로드 영상 1개 가져오기
-            playlist_response = self.youtube.playlistItems().list(
-                part='snippet',
+            selection = upload_date_selection()
+            playlist_response = self._execute(
+                'playlistItems',
+                part=selection.part,
+                fields=selection.fields,
                 playlistId=uploads_playlist_id,
                 maxResults=1
-            ).execute()
+            )
             
             items = playlist_response.get('items', [])
             if items:
@@ -278,6 +546,204 @@ class YouTubeChannelCrawler:
             # 에러 발생 시 None 반환 (필수 정보는 아니므로)
             return None
     
+    def get_last_upload_dates(self, channels, stop_event=None):
+        """
+        여러 채널의 최근 업로드일을 스레드 풀로 동시에 조회
+        
+        Args:
+            channels (list): channels.list 응답의 채널 항목 리스트
+            stop_event (threading.Event): 설정되면 아직 시작하지 않은 조회를 건너뜀
+        
+        Returns:
+            list: 입력 순서와 같은 순서의 최근 업로드 날짜 리스트 (없으면 None)
+        """
+        if not channels:
+            return []
+        
+        # 작업자 스레드의 호출도 요청한 스레드의 키워드로 집계
+        keyword = self.metrics.current_keyword()
+        
+        def lookup(channel):
+            if stop_event is not None and stop_event.is_set():
+                return None
+            with self.metrics.keyword_scope(keyword):
+                return self.get_last_upload_date(channel['id'], channel)
+        
+        workers = max(1, min(self.max_workers, len(channels)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map은 입력 순서대로 결과를 돌려줌
+            return list(executor.map(lookup, channels))
+    
+    @staticmethod
+    def check_basic_filters(details, korean_only=True, channel_age_cutoff=None, contactable_only=True):
+        """
+        channels.list 응답만으로 판단할 수 있는 필터 검사 (추가 API 호출 없음)
+        
+        Args:
+            details (ChannelRecord): 채널 상세 정보
+            korean_only (bool): 한국 채널만 허용
+            channel_age_cutoff (datetime): 이 시점 이전에 개설된 채널 제외 (None이면 제한 없음)
+            contactable_only (bool): 연락처 있는 채널만 허용
+        
+        Returns:
+            str: 제외 사유 ('not_korean', 'too_old', 'no_contact') 또는 None (통과)
+        """
+        # 한국 채널 필터링
+        if korean_only and not details.is_korean:
+            return 'not_korean'
+        
+        # 채널 개설일 필터링 (날짜 파싱 실패 시 무시)
+        if channel_age_cutoff and details.published_at is not None:
+            if details.published_at < channel_age_cutoff.timestamp():
+                return 'too_old'
+        
+        # 연락처 필터링
+        if contactable_only and not details.contactable:
+            return 'no_contact'
+        
+        return None
+    
+    @staticmethod
+    def check_activity_filter(details, last_upload_cutoff):
+        """
+        최근 업로드일 필터 검사 (playlistItems 조회 결과 필요)
+        
+        Args:
+            details (ChannelRecord): 최근 업로드일이 채워진 채널 상세 정보
+            last_upload_cutoff (datetime): 이 시점 이후 업로드가 없으면 제외
+        
+        Returns:
+            str: 제외 사유 ('no_uploads', 'inactive') 또는 None (통과)
+        """
+        if details.last_upload_date is None:
+            # 날짜 파싱 실패 시 무시
+            return None if details.get('last_upload_date') else 'no_uploads'
+        
+        if details.last_upload_date < last_upload_cutoff.timestamp():
+            return 'inactive'
+        
+        return None
+    
+    def fetch_channels(self, channel_ids, uploads=True):
+        """
+        channels.list를 최대 50개 ID씩 묶어서 호출하여 원본 채널 데이터 가져오기
+        (이번 실행에서 다른 키워드로 이미 조회한 채널은 다시 요청하지 않음)
+        
+        Args:
+            channel_ids (list): 채널 ID 리스트
+            uploads (bool): 최근 업로드일 조회에 필요한 uploads 플레이리스트 ID도 받을지 (False면 contentDetails 생략)
+        
+        Returns:
+            dict: {channel_id: API 응답의 채널 항목} 형태의 딕셔너리
+        """
+        selection = channel_selection(uploads)
+        # 받는 필드가 다르면 따로 보관 (dict.setdefault는 스레드 간에도 하나만 만듦)
+        seen = self._seen_channels.setdefault(selection, SharedFetchCache())
+        return seen.fetch(channel_ids, lambda ids: self._request_channels(ids, selection))
+    
+    def _request_channels(self, channel_ids, selection):
+        """
+        channels.list 묶음 요청 (최대 50개 ID씩)
+        
+        Args:
+            channel_ids (list): 채널 ID 리스트
+            selection (ApiSelection): 요청할 part와 fields
+        
+        Returns:
+            dict: {channel_id: API 응답의 채널 항목} 형태의 딕셔너리
+        """
+        channels = {}
+        
+        # API 제한: 한 번에 최대 50개 ID
+        for start in range(0, len(channel_ids), MAX_IDS_PER_REQUEST):
+            chunk = channel_ids[start:start + MAX_IDS_PER_REQUEST]
+            try:
+                channel_response = self._execute(
+                    'channels',
+                    part=selection.part,
+                    fields=selection.fields,
+                    id=','.join(chunk),
+                    maxResults=MAX_IDS_PER_REQUEST
+                )
+            except HttpError as e:
+                print(f"✗ 채널 정보 가져오기 실패 ({len(chunk)}개): {e}")
+                continue
+            
+            for item in channel_response.get('items', []):
+                channels[item['id']] = item
+        
+        return channels
+    
+    def fetch_channel_statistics(self, channel_ids, etag=None):
+        """
+        저장된 채널의 통계를 새로 요청 (캐시를 사용하지 않음, 최대 50개 ID)
+        
+        Args:
+            channel_ids (list): 채널 ID 리스트 (최대 50개)
+            etag (str): 같은 ID 묶음의 이전 응답 ETag
+        
+        Returns:
+            tuple: ({channel_id: 채널 항목} 또는 바뀌지 않았으면 None, 응답 ETag)
+        """
+        selection = statistics_selection()
+        response = self._execute(
+            'channels',
+            etag=etag,
+            use_cache=False,
+            part=selection.part,
+            fields=selection.fields,
+            id=','.join(channel_ids),
+            maxResults=MAX_IDS_PER_REQUEST
+        )
+        if response is None:
+            return None, etag
+        
+        channels = {item['id']: item for item in response.get('items', [])}
+        return channels, response.get('etag')
+    
+    def build_channel_info(self, channel, last_upload_date=None):
+        """
+        channels.list 응답 항목을 저장용 채널 정보로 변환
+        
+        Args:
+            channel (dict): channels.list 응답의 채널 항목
+            last_upload_date (str): 최근 업로드 날짜 (없으면 None)
+        
+        Returns:
+            ChannelRecord: 채널 상세 정보 (to_dict()로 저장 파일 형식)
+        """
+        snippet = channel['snippet']
+        
+        # 연락처 정보와 한국어 여부를 설명 한 번 훑어서 계산
+        text_fields = contact_extractor.analyze_channel_text(
+            snippet['title'], snippet.get('description', ''), snippet.get('country')
+        )
+        
+        return ChannelRecord.from_api(channel, text_fields, last_upload_date)
+    
+    def get_channels_details(self, channel_ids):
+        """
+        여러 채널의 상세 정보를 한 번에 가져오기 (50개씩 묶음 요청)
+        
+        Args:
+            channel_ids (list): 채널 ID 리스트
+        
+        Returns:
+            dict: {channel_id: ChannelRecord} 형태의 딕셔너리 (조회 실패한 채널은 제외)
+        """
+        raw_channels = self.fetch_channels(channel_ids)
+        
+        found = [raw_channels[channel_id] for channel_id in channel_ids if channel_id in raw_channels]
+        
+        # 최근 업로드일은 묶음 조회가 없으므로 동시에 가져오기
+        last_upload_dates = self.get_last_upload_dates(found)
+        
+        details = {}
+        for channel, last_upload_date in zip(found, last_upload_dates):
+            details[channel['id']] = self.build_channel_info(channel, last_upload_date)
+        
+        return details
+    
     def get_channel_details(self, channel_id):
         """
         채널 상세 정보 가져오기
@@ -288,83 +754,12 @@ class YouTubeChannelCrawler:
         Returns:
             dict: 채널 상세 정보
         """
-        try:
-            # 채널 정보 가져오기
-            channel_response = self.youtube.channels().list(
-                part='snippet,statistics,contentDetails,brandingSettings',
-                id=channel_id
-            ).execute()
-            
-            if not channel_response.get('items'):
-                return None
-            
-            channel = channel_response['items'][0]
-            
-            # 최근 업로드일 가져오기
-            last_upload_date = self.get_last_upload_date(channel_id, channel)
-            
-            # 채널 정보 추출
-            snippet = channel['snippet']
-            statistics = channel.get('statistics', {})
-            branding = channel.get('brandingSettings', {})
-            description = snippet.get('description', '')
-            
-            # 연락처 정보 추출
-            contact_info = self.extract_contact_info(description)
-            
-            # 한국어 여부 확인
-            is_korean = (
-                snippet.get('country') == 'KR' or 
-                self.is_korean_text(description) or 
-                self.is_korean_text(snippet['title'])
-            )
-            
-            channel_info = {
-                'channel_id': channel_id,
-                'title': snippet['title'],
-                'description': description,
-                'custom_url': snippet.get('customUrl', ''),
-                'published_at': snippet['publishedAt'],
-                'last_upload_date': last_upload_date,
-                'country': snippet.get('country', 'N/A'),
-                'is_korean': is_korean,
-                
-                # 통계
-                'subscriber_count': statistics.get('subscriberCount', 'N/A'),
-                'video_count': statistics.get('videoCount', 'N/A'),
-                'view_count': statistics.get('viewCount', 'N/A'),
-                
-                # 링크
-                'channel_url': f"https://www.youtube.com/channel/{channel_id}",
-                'custom_channel_url': f"https://www.youtube.com/{snippet.get('customUrl', '')}" if snippet.get('customUrl') else '',
-                
-                # 연락처 정보 (이메일, 전화, 카카오, 기타 링크만)
-                'email': contact_info['email'] if contact_info['email'] else 'N/A',
-                'phone': contact_info['phone'] if contact_info['phone'] else 'N/A',
-                'kakao': contact_info['kakao'] if contact_info['kakao'] else 'N/A',
-                'other_links': ', '.join(contact_info['other_links']) if contact_info['other_links'] else 'N/A',
-                
-                # 연락 가능 여부
-                'contactable': any([
-                    contact_info['email'],
-                    contact_info['phone'],
-                    contact_info['kakao'],
-                    contact_info['other_links']
-                ]),
-                
-                # 썸네일
-                'thumbnail': snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
-            }
-            
-            return channel_info
-            
-        except HttpError as e:
-            print(f"✗ 채널 정보 가져오기 실패 ({channel_id}): {e}")
-            return None
+        return self.get_channels_details([channel_id]).get(channel_id)
     
     def crawl(self, query, max_results=10, korean_only=True, order='relevance', 
               data_file=None, update_mode=True, contactable_only=True,
-              channel_age_months=None, last_upload_months=None):
+              channel_age_months=None, last_upload_months=None, max_search_attempts=5,
+              storage='json', checkpoint=None):
         """
         검색어로 채널을 검색하고 상세 정보 수집
         
@@ -378,13 +773,22 @@ class YouTubeChannelCrawler:
             contactable_only (bool): True면 연락처 있는 채널만 수집 (기본값: True)
             channel_age_months (int): 채널 개설 기간 제한 (개월, None이면 제한 없음)
             last_upload_months (int): 최근 업로드 기간 제한 (개월, None이면 제한 없음)
+            max_search_attempts (int): 최대 검색 횟수 (할당량 예산에 맞춰 조절)
+            storage (str): 저장 방식 - 'json'(기존 데이터와 병합해서 반환, 저장은 save_to_json),
+                           'jsonl'(필터를 통과한 채널을 바로 파일에 추가 기록)
+            checkpoint (CrawlCheckpoint): 진행 상황 저장소 (저장된 진행 상황이 있으면 그 검색 위치부터 이어서 진행)
         
         Returns:
-            tuple: (channels 리스트, 사용된 파일명)
+            tuple: (ChannelRecord 리스트, 사용된 파일명, 이번 실행에서 새로 수집한 채널 수)
+            ('json'이면 기존 + 새 채널 전체, 'jsonl'이면 이미 기록된 새 채널만 반환(이어서 진행하면 이전 실행분 포함).
+             할당량이 소진되면 그때까지 수집한 채널만 반영)
         """
+        started = time.perf_counter()
+        self.quota_stopped.discard(query)
+        
         # 파일명 자동 생성 (지정하지 않은 경우)
         if data_file is None:
-            data_file = self.make_safe_filename(query)
+            data_file = self.make_safe_filename(query, '.jsonl' if storage == 'jsonl' else '.json')
         
         print(f"\n{'='*60}")
         print(f"YouTube 채널 크롤링 시작: '{query}'")
@@ -407,205 +811,773 @@ class YouTubeChannelCrawler:
         print(f"📊 정렬: {order_text}")
         print(f"{'='*60}\n")
         
-        # 기존 데이터 로드 (update_mode일 때만)
-        existing_data = {}
-        if update_mode:
-            existing_data = self.load_existing_data(data_file)
+        # 기존 데이터 로드 (update_mode일 때만, 중복 확인에는 채널 ID만 필요)
+        existing_data = set()
+        store = None
+        if storage == 'jsonl':
+            store = JsonlChannelStore(data_file)
+            if not update_mode and store.exists():
+                os.remove(data_file)
+            elif update_mode and not store.exists():
+                # 같은 이름의 기존 JSON 파일이 있으면 한 번만 옮겨옴
+                json_file = os.path.splitext(data_file)[0] + '.json'
+                if os.path.exists(json_file):
+                    imported = store.import_json(json_file)
+                    print(f"✓ 기존 JSON 파일에서 {imported}개 채널을 옮겨왔습니다: {json_file}")
+            
+            # 중복 확인에는 채널 ID만 필요
+            existing_data = store.load_ids()
+            if existing_data:
+                print(f"✓ 기존 데이터 로드: {len(existing_data)}개 채널")
+            else:
+                print(f"ℹ️  기존 파일 없음 - 새로 시작합니다")
+        elif update_mode:
+            existing_data = self.load_existing_ids(data_file)
         
         # 수집 변수
         new_channels = []
-        duplicate_count = 0
-        filtered_count = 0
-        no_contact_count = 0  # 연락처 없음 카운트
-        old_channel_count = 0  # 채널 개설 오래됨
-        inactive_channel_count = 0  # 최근 활동 없음
-        page_token = None
-        search_count = 0
-        max_search_attempts = 5  # 최대 5번까지 추가 검색
-        
-        # 기간 계산
-        now = datetime.now()
+        reject_counts = {reason: 0 for reason in REJECT_REASONS}  # 필터별 제외 개수
+        skipped_upload_lookups = 0  # 저비용 필터로 제외되어 생략한 최근 업로드일 조회 수
+        
+        # 이전 실행에서 저장된 진행 상황이 있으면 이어서 진행 (--resume)
+        resume_state = checkpoint.keyword_state(query) if checkpoint is not None else None
+        if resume_state:
+            new_channels = [ChannelRecord.from_dict(record) for record in resume_state.get('accepted', [])]
+            reject_counts.update(resume_state.get('reject_counts', {}))
+        # 검색 계획 (이어서 진행하면 저장된 검색 흐름별 위치부터)
+        planner = SearchPlanner(
+            order=order,
+            korean_only=korean_only,
+            lookups=bool(last_upload_months),
+            prior=self.search_yield.rate(),
+            state=resume_state.get('planner', resume_state) if resume_state else None
+        )
+        if resume_state:
+            print(f"♻️  이전 진행 상황에서 이어서: 검색 {planner.search_count}회 완료, {len(new_channels)}개 수집됨")
+        resumed_count = len(new_channels)
+        resumed_reject_counts = dict(reject_counts)
+        accepted_ids = {ch.channel_id for ch in new_channels}
+        if store is not None:
+            # jsonl은 이미 기록된 채널이므로 새 채널로 다시 세지 않도록 기존 데이터에서 분리
+            existing_data -= accepted_ids
+        
+        resumed_results, resumed_accepted = planner.observed()
+        
+        # 체크포인트에 기록할 검색 위치 (필터링까지 끝난 페이지 기준, 처리 중인 페이지는 다시 검색)
+        progress = {
+            'planner': planner.state(),
+            'search_count': planner.search_count,
+            'reject_counts': dict(reject_counts),
+        }
+        
+        def save_progress(force=False):
+            """현재 검색 위치와 수집한 채널을 체크포인트에 기록"""
+            if checkpoint is None:
+                return
+            checkpoint.update_keyword(query, {
+                'planner': progress['planner'],
+                'search_count': progress['search_count'],
+                'reject_counts': dict(progress['reject_counts']),
+                'accepted': [channel.to_dict() for channel in new_channels],
+            }, force=force)
+        
+        # 기간 계산 (API 날짜는 UTC 기준이므로 비교 기준도 UTC로)
+        now = datetime.now(timezone.utc)
+        channel_age_cutoff = None
+        last_upload_cutoff = None
         if channel_age_months:
             channel_age_cutoff = now - timedelta(days=channel_age_months * 30)
         if last_upload_months:
             last_upload_cutoff = now - timedelta(days=last_upload_months * 30)
         
-        # 목표 개수를 채울 때까지 반복 검색
-        while len(new_channels) < max_results and search_count < max_search_attempts:
-            search_count += 1
-            
-            # 부족한 개수 계산 (여유있게 2배 검색)
-            needed = (max_results - len(new_channels)) * 2
-            search_size = min(needed, 50)  # API 제한: 최대 50개
-            
-            if search_count > 1:
-                print(f"\n{'='*60}")
-                print(f"📍 부족분 추가 검색 ({search_count}회차)")
-                print(f"   현재: {len(new_channels)}개, 목표: {max_results}개")
-                print(f"   추가 검색: {search_size}개")
-                print(f"{'='*60}\n")
-            
-            # 채널 검색
-            channels, next_page_token = self.search_channels(
-                query, 
-                max_results=search_size, 
-                order=order, 
-                page_token=page_token
-            )
-            
-            if not channels:
-                print("더 이상 검색 결과가 없습니다.")
-                break
-            
-            # 다음 페이지 토큰 저장
-            page_token = next_page_token
+        # 필터링을 기다리는 후보 수 (선행 검색량 조절용)
+        pending = {'candidates': 0}
+        pending_cond = threading.Condition()
+        
+        def search_pages():
+            """1단계: 검색 페이지 가져오기 (앞 페이지를 처리하는 동안 다음 페이지를 미리 요청)"""
+            search_count = progress['search_count']
+            attempts = 0  # 이번 실행의 검색 횟수
             
-            # 각 채널의 상세 정보 수집
-            for i, channel in enumerate(channels, 1):
-                # 이미 목표 개수를 달성했으면 중단
-                if len(new_channels) >= max_results:
-                    print(f"\n✅ 목표 개수 달성! ({len(new_channels)}개)")
-                    break
+            while attempts < max_search_attempts:
+                # 대기 중인 후보가 모두 통과해도 목표에 못 미칠 때만 다음 페이지를 미리 요청
+                # (필요 없는 검색에 할당량을 쓰지 않도록)
+                with pending_cond:
+                    while (not pipeline.stopped and
+                           pending['candidates'] >= max_results - len(new_channels)):
+                        pending_cond.wait(0.1)
+                
+                if pipeline.stopped or len(new_channels) >= max_results:
+                    return
+                
+                # 부족한 개수 (대기 중인 후보에서 통과할 것으로 예상되는 만큼 제외)
+                needed = max(1, math.ceil(max_results - len(new_channels) -
+                                          pending['candidates'] * planner.yield_rate()))
+                request = planner.next_request(needed)
+                if request is None:
+                    print("\n⚠️  더 이상 검색 결과가 없습니다.")
+                    return
+                search_size = request['max_results']
+                
+                # 대기 중인 후보와 이번 페이지를 처리할 할당량이 남지 않으면 검색하지 않음
+                if self.quota is not None:
+                    required = (QUOTA_COSTS['search'] + QUOTA_COSTS['channels'] +
+                                (search_size + pending['candidates']) * QUOTA_COSTS['playlistItems'])
+                    if self.quota.remaining < required:
+                        print(f"\n⚠️  남은 할당량({self.quota.remaining} units) 부족 - 추가 검색 중단")
+                        self.quota_stopped.add(query)
+                        return
                 
-                channel_id = channel['channel_id']
+                attempts += 1
+                search_count += 1
                 
-                # 중복 체크
-                if channel_id in existing_data:
-                    print(f"\n[검색 {search_count}회-{i}/{len(channels)}] {channel['title']}")
-                    print(f"  ⊝ 이미 존재하는 채널 - 건너뜀")
-                    duplicate_count += 1
+                if search_count > 1:
+                    print(f"\n{'='*60}")
+                    print(f"📍 부족분 추가 검색 ({search_count}회차)")
+                    print(f"   현재: {len(new_channels)}개, 목표: {max_results}개")
+                    print(f"   추가 검색: {search_size}개 ({stream_label(request)}, "
+                          f"통과 비율 {planner.yield_rate():.0%})")
+                    print(f"{'='*60}\n")
+                
+                # 채널 검색
+                channels, next_token = self.search_channels(
+                    query, 
+                    max_results=search_size, 
+                    order=request['order'], 
+                    page_token=request['page_token'],
+                    region_code=request['region_code'],
+                    relevance_language=request['relevance_language']
+                )
+                # 결과가 없거나 다음 페이지가 없으면 다음 검색 흐름(정렬/지역/언어)으로
+                planner.record_page(request['stream'], len(channels), next_token)
+                
+                if not channels:
                     continue
                 
-                print(f"\n[검색 {search_count}회-{i}/{len(channels)}] {channel['title']} 정보 수집 중...")
+                with pending_cond:
+                    pending['candidates'] += len(channels)
                 
-                details = self.get_channel_details(channel_id)
-                if details:
-                    # 한국 채널 필터링
-                    if korean_only and not details['is_korean']:
-                        print(f"  ⊝ 한국 채널 아님 - 제외")
-                        filtered_count += 1
-                        continue
+                yield search_count, channels, request['stream'], next_token
+        
+        def fetch_details(page):
+            """2단계: 상세 정보 조회 → 저비용 필터 → 통과한 채널만 최근 업로드일 조회"""
+            search_count, channels, stream, next_token = page
+            
+            page_details = {}
+            rejections = {}  # {channel_id: 제외 사유}
+            survivors = []
+            
+            # 중복이 아닌 채널만 후보로 (다른 키워드나 이전 실행에서 이미 조회한 채널도 제외)
+            candidate_ids = [ch['channel_id'] for ch in channels if ch['channel_id'] not in existing_data]
+            if self.index is not None:
+                indexed_ids = self.index.skip_ids(candidate_ids)
+                self.index.record_found([ch['channel_id'] for ch in channels], query)
+                # 동시에 수집 중인 다른 키워드가 먼저 맡은 채널도 제외 (같은 채널을 두 키워드가 수집하지 않도록)
+                indexed_ids |= self.index.claim(
+                    [channel_id for channel_id in candidate_ids if channel_id not in indexed_ids], query
+                )
+                for channel_id in indexed_ids:
+                    rejections[channel_id] = 'indexed'
+                candidate_ids = [channel_id for channel_id in candidate_ids if channel_id not in indexed_ids]
+            
+            # 후보 채널의 상세 정보를 한 번에 요청 (최대 50개씩 묶음)
+            raw_channels = self.fetch_channels(candidate_ids, uploads=bool(last_upload_cutoff))
+            
+            # channels.list 응답만으로 판단 가능한 필터를 먼저 적용 (추가 API 호출 없음)
+            for channel_id in candidate_ids:
+                channel = raw_channels.get(channel_id)
+                if channel is None:
+                    continue
+                
+                details = self.build_channel_info(channel)
+                page_details[channel_id] = details
+                
+                reason = self.check_basic_filters(
+                    details,
+                    korean_only=korean_only,
+                    channel_age_cutoff=channel_age_cutoff,
+                    contactable_only=contactable_only
+                )
+                if reason:
+                    rejections[channel_id] = reason
+                else:
+                    survivors.append(channel)
+            
+            # 최근 업로드일은 활동 필터가 켜져 있을 때, 통과한 채널만 동시에 조회 (검색 순서 유지)
+            if last_upload_cutoff:
+                last_upload_dates = self.get_last_upload_dates(survivors, stop_event=pipeline.stop_event)
+                for channel, last_upload_date in zip(survivors, last_upload_dates):
+                    details = page_details[channel['id']]
+                    details['last_upload_date'] = last_upload_date
                     
-                    # 채널 개설일 필터링
-                    if channel_age_months:
-                        try:
-                            published_date = datetime.fromisoformat(details['published_at'].replace('Z', '+00:00'))
-                            if published_date < channel_age_cutoff:
-                                print(f"  ⊝ 채널 개설 {channel_age_months}개월 초과 - 제외")
-                                old_channel_count += 1
-                                continue
-                        except:
-                            pass  # 날짜 파싱 실패 시 무시
+                    reason = self.check_activity_filter(details, last_upload_cutoff)
+                    if reason:
+                        rejections[channel['id']] = reason
+            
+            return search_count, channels, stream, next_token, page_details, rejections
+        
+        # 검색/상세 조회 단계는 각자의 스레드에서 실행되므로 그 안의 API 호출도 이 키워드로 집계
+        def scoped_search_pages():
+            with self.metrics.keyword_scope(query):
+                yield from search_pages()
+        
+        def scoped_fetch_details(page):
+            with self.metrics.keyword_scope(query):
+                return fetch_details(page)
+        
+        # 검색 → 상세 조회 → 필터링(현재 스레드) 단계를 제한된 큐로 연결
+        pipeline = Pipeline(scoped_search_pages, [scoped_fetch_details], depth=self.pipeline_depth)
+        
+        # 3단계: 필터링 (목표 달성 시 파이프라인 중단 → 진행 중인 작업 취소)
+        try:
+            for search_count, channels, stream, next_token, page_details, rejections in pipeline:
+                # 이 페이지를 처리하다 종료되면 같은 페이지부터 다시 (검색 응답은 캐시에서 읽음)
+                accepted_before = len(new_channels)
+                examined = 0  # 이 페이지에서 필터링한 채널 수
+                
+                for i, channel in enumerate(channels, 1):
+                    # 이미 목표 개수를 달성했으면 중단
+                    if len(new_channels) >= max_results:
+                        print(f"\n✅ 목표 개수 달성! ({len(new_channels)}개)")
+                        break
+                    examined = i
                     
-                    # 최근 업로드일 필터링
-                    if last_upload_months:
-                        last_upload = details.get('last_upload_date')
-                        if not last_upload:
-                            print(f"  ⊝ 업로드 영상 없음 - 제외")
-                            inactive_channel_count += 1
-                            continue
-                        
-                        try:
-                            last_upload_date = datetime.fromisoformat(last_upload.replace('Z', '+00:00'))
-                            if last_upload_date < last_upload_cutoff:
-                                print(f"  ⊝ 최근 {last_upload_months}개월간 활동 없음 - 제외")
-                                inactive_channel_count += 1
-                                continue
-                        except:
-                            pass  # 날짜 파싱 실패 시 무시
+                    with pending_cond:
+                        pending['candidates'] -= 1
+                        pending_cond.notify()
                     
-                    # 연락처 필터링
-                    if contactable_only and not details['contactable']:
-                        print(f"  ⊝ 연락처 없음 - 제외")
-                        no_contact_count += 1
+                    channel_id = channel['channel_id']
+                    
+                    # 중복 체크
+                    if channel_id in existing_data or channel_id in accepted_ids:
+                        print(f"\n[검색 {search_count}회-{i}/{len(channels)}] {channel['title']}")
+                        print(f"  ⊝ 이미 존재하는 채널 - 건너뜀")
+                        reject_counts['duplicate'] += 1
+                        continue
+                    if rejections.get(channel_id) == 'indexed':
+                        print(f"\n[검색 {search_count}회-{i}/{len(channels)}] {channel['title']}")
+                        print(f"  ⊝ 다른 키워드에서 이미 조회한 채널 - 건너뜀")
+                        reject_counts['indexed'] += 1
                         continue
                     
-                    new_channels.append(details)
+                    print(f"\n[검색 {search_count}회-{i}/{len(channels)}] {channel['title']} 정보 수집 중...")
                     
-                    # 연락처 정보 출력
-                    contact_methods = []
-                    if details['email'] != 'N/A':
-                        contact_methods.append(f"이메일: {details['email']}")
-                    if details['phone'] != 'N/A':
-                        contact_methods.append(f"전화: {details['phone']}")
-                    if details['kakao'] != 'N/A':
-                        contact_methods.append(f"카톡: {details['kakao']}")
-                    if details['other_links'] != 'N/A':
-                        contact_methods.append(f"링크: {details['other_links'][:50]}...")
+                    details = page_details.get(channel_id)
+                    if details:
+                        reason = rejections.get(channel_id)
+                        if reason:
+                            message = REJECT_MESSAGES[reason].format(
+                                channel_age_months=channel_age_months,
+                                last_upload_months=last_upload_months
+                            )
+                            print(f"  ⊝ {message} - 제외")
+                            reject_counts[reason] += 1
+                            if self.index is not None:
+                                self.index.record_fetched(channel_id, accepted=False, reject_reason=reason)
+                            
+                            # 최근 업로드일 조회 전에 걸러진 채널 (할당량 절약)
+                            if last_upload_cutoff and reason in BASIC_FILTER_REASONS:
+                                skipped_upload_lookups += 1
+                            continue
+                        
+                        new_channels.append(details)
+                        accepted_ids.add(channel_id)
+                        
+                        # 바로 파일에 기록 (중간에 종료되어도 남도록)
+                        if store is not None:
+                            store.append(details)
+                        if self.index is not None:
+                            self.index.record_fetched(channel_id, accepted=True)
+                        save_progress()
+                        
+                        # 연락처 정보 출력
+                        contact_methods = []
+                        if details.email is not None:
+                            contact_methods.append(f"이메일: {details.email}")
+                        if details.phone is not None:
+                            contact_methods.append(f"전화: {details.phone}")
+                        if details.kakao is not None:
+                            contact_methods.append(f"카톡: {details.kakao}")
+                        if details.other_links is not None:
+                            contact_methods.append(f"링크: {details.other_links[:50]}...")
+                        
+                        print(f"  ✓ 구독자: {details['subscriber_count']}, 동영상: {details['video_count']}")
+                        print(f"  ✓ 진행: {len(new_channels)}/{max_results}개 수집 완료")
+                        if contact_methods:
+                            print(f"  📧 연락처: {', '.join(contact_methods)}")
+                        else:
+                            print(f"  ⚠️  연락처 정보 없음")
                     
-                    print(f"  ✓ 구독자: {details['subscriber_count']}, 동영상: {details['video_count']}")
-                    print(f"  ✓ 진행: {len(new_channels)}/{max_results}개 수집 완료")
-                    if contact_methods:
-                        print(f"  📧 연락처: {', '.join(contact_methods)}")
-                    else:
-                        print(f"  ⚠️  연락처 정보 없음")
-            
-            # 다음 페이지가 없으면 중단
-            if not page_token:
-                print("\n⚠️  더 이상 검색 결과가 없습니다.")
-                break
+                # 통과 비율에 반영 (최근 업로드일 조회 수 = 활동 필터로 제외된 채널 + 수집한 채널)
+                page_accepted = len(new_channels) - accepted_before
+                inactive = sum(1 for channel in channels[:examined]
+                               if rejections.get(channel['channel_id']) in ('no_uploads', 'inactive'))
+                planner.record_outcome(stream, examined, page_accepted, next_token,
+                                       looked_up=inactive + page_accepted,
+                                       complete=len(new_channels) < max_results)
+                
+                if len(new_channels) >= max_results:
+                    break
+                
+                # 페이지를 모두 처리했으면 다음 페이지부터 이어서 진행하도록 기록
+                progress.update(planner=planner.state(), search_count=planner.search_count,
+                                reject_counts=dict(reject_counts))
+                save_progress(force=True)
+        except QuotaExhausted as e:
+            self.quota_stopped.add(query)
+            print(f"\n⛔ {e}")
+            print("   지금까지 수집한 채널만 저장합니다.")
+        finally:
+            save_progress(force=True)
+            if store is not None:
+                store.close()
+            if self.index is not None:
+                self.index.release(query)
+            results, accepted = planner.observed()
+            self.search_yield.observe(results - resumed_results, accepted - resumed_accepted)
+            self.metrics.record_keyword(
+                query,
+                accepted=len(new_channels) - resumed_count,
+                reject_counts={
+                    reason: count - resumed_reject_counts.get(reason, 0)
+                    for reason, count in reject_counts.items()
+                },
+                elapsed=time.perf_counter() - started,
+                search_count=planner.search_count,
+                search_streams=planner.summary()
+            )
         
         # 최종 결과
         print(f"\n{'='*60}")
-        if duplicate_count > 0:
-            print(f"ℹ️  중복 채널 제외: {duplicate_count}개")
-        if korean_only and filtered_count > 0:
-            print(f"ℹ️  한국 채널 아님으로 제외: {filtered_count}개")
-        if channel_age_months and old_channel_count > 0:
-            print(f"ℹ️  채널 개설 오래됨으로 제외: {old_channel_count}개")
-        if last_upload_months and inactive_channel_count > 0:
-            print(f"ℹ️  최근 활동 없음으로 제외: {inactive_channel_count}개")
-        if contactable_only and no_contact_count > 0:
-            print(f"ℹ️  연락처 없음으로 제외: {no_contact_count}개")
-        
-        # 기존 데이터와 새 데이터 병합
-        all_channels = list(existing_data.values()) + new_channels
-        
-        print(f"✓ 새로 추가된 채널: {len(new_channels)}개")
+        accepted_count = len(new_channels) - resumed_count
+        keyword_units = self.metrics.keyword_units(query)
+        if accepted_count > 0:
+            print(f"💰 할당량: {keyword_units} units, 수집 채널당 {units_per_accepted(keyword_units, accepted_count)} units")
+        for summary in planner.summary():
+            print(f"🔎 검색 {summary['stream']}: {summary['searches']}회, 결과 {summary['results']}개 → "
+                  f"수집 {summary['accepted']}개")
+        if reject_counts['duplicate'] > 0:
+            print(f"ℹ️  중복 채널 제외: {reject_counts['duplicate']}개")
+        if reject_counts['indexed'] > 0:
+            print(f"💰 다른 키워드에서 조회한 채널 제외: {reject_counts['indexed']}개 (상세 정보 재요청 생략)")
+        if reject_counts['not_korean'] > 0:
+            print(f"ℹ️  한국 채널 아님으로 제외: {reject_counts['not_korean']}개")
+        if reject_counts['too_old'] > 0:
+            print(f"ℹ️  채널 개설 오래됨으로 제외: {reject_counts['too_old']}개")
+        if reject_counts['no_contact'] > 0:
+            print(f"ℹ️  연락처 없음으로 제외: {reject_counts['no_contact']}개")
+        inactive_count = reject_counts['no_uploads'] + reject_counts['inactive']
+        if inactive_count > 0:
+            print(f"ℹ️  최근 활동 없음으로 제외: {inactive_count}개")
+        if skipped_upload_lookups > 0:
+            print(f"💰 최근 업로드일 조회 생략: {skipped_upload_lookups}회 (할당량 {skipped_upload_lookups} units 절약)")
+        
+        # 기존 데이터와 새 데이터 병합 (jsonl은 이미 파일에 기록되었으므로 새 채널만)
+        if store is not None:
+            all_channels = new_channels
+            total_count = len(existing_data) + len(new_channels)
+        else:
+            # 병합 결과가 필요할 때만 기존 채널 전체를 읽음
+            existing_records = load_channel_file(data_file) if existing_data else {}
+            all_channels = list(existing_records.values()) + new_channels
+            total_count = len(all_channels)
+        
+        if resumed_count:
+            print(f"✓ 새로 추가된 채널: {accepted_count}개 (이전 실행 {resumed_count}개 포함 {len(new_channels)}개)")
+        else:
+            print(f"✓ 새로 추가된 채널: {accepted_count}개")
         if len(new_channels) < max_results:
             print(f"⚠️  목표({max_results}개)에 미달했습니다. (부족: {max_results - len(new_channels)}개)")
-        print(f"✓ 전체 채널: {len(all_channels)}개")
+        print(f"✓ 전체 채널: {total_count}개")
         
         # 연락 가능 채널 통계 (모두 연락 가능하므로 100%)
-        contactable_count = sum(1 for ch in all_channels if ch['contactable'])
+        contactable_count = sum(1 for ch in all_channels if ch.contactable)
+        scope = '(새로 추가)' if store is not None else ''
         if contactable_only:
-            print(f"📧 연락 가능 채널: {contactable_count}/{len(all_channels)}개 (100%)")
+            print(f"📧 연락 가능 채널{scope}: {contactable_count}/{len(all_channels)}개 (100%)")
         else:
-            print(f"📧 연락 가능 채널: {contactable_count}/{len(all_channels)}개")
+            print(f"📧 연락 가능 채널{scope}: {contactable_count}/{len(all_channels)}개")
         print(f"{'='*60}\n")
         
-        return all_channels, data_file
+        return all_channels, data_file, accepted_count
     
     def save_to_json(self, channels, filename='youtube_channels.json'):
         """
         채널 정보를 JSON 파일로 저장
         
         Args:
-            channels (list): 채널 정보 리스트
+            channels (list): 채널 정보 리스트 (ChannelRecord 또는 dict)
             filename (str): 파일명
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(channels, f, ensure_ascii=False, indent=2)
+            write_json_array(f, channels)
         print(f"✓ JSON 파일 저장: {filename}")
 
 
-def main():
+def compact_files(files=None):
+    """
+    JSON Lines 채널 파일의 중복 기록 정리
+    
+    Args:
+        files (list): 정리할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.jsonl)
+    """
+    if not files:
+        _, files = find_channel_files()
+    
+    if not files:
+        print("ℹ️  정리할 .jsonl 파일이 없습니다")
+        return
+    
+    for path in files:
+        before, after = JsonlChannelStore(path).compact()
+        print(f"✓ {path}: {before}줄 → {after}개 채널")
+
+
+def import_json_files(files=None):
+    """
+    기존 JSON 배열 채널 파일을 JSON Lines 파일로 옮기기 (한 번만 실행하면 됨)
+    
+    Args:
+        files (list): 옮길 JSON 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json)
+    """
+    if not files:
+        files, _ = find_channel_files()
+    
+    if not files:
+        print("ℹ️  옮길 .json 파일이 없습니다")
+        return
+    
+    for path in files:
+        target = jsonl_path_for(path)
+        try:
+            imported = JsonlChannelStore(target).import_json(path)
+        except Exception as e:
+            print(f"⚠️  {path} 옮기기 실패: {e}")
+            continue
+        print(f"✓ {path} → {target}: {imported}개 채널 추가")
+
+
+def reprocess_files(files=None, processes=None, dry_run=False):
+    """
+    저장된 채널 설명에 현재 연락처 추출/한국어 판별 규칙을 다시 적용 (API 호출 없음)
+    
+    Args:
+        files (list): 재처리할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+        processes (int): 작업자 프로세스 수 (None이면 CPU 코어 수)
+        dry_run (bool): True면 바뀔 내용만 출력하고 파일은 그대로 둠
+    """
+    reprocessor = ChannelReprocessor(processes=processes)
+    summary = reprocessor.reprocess(files, dry_run=dry_run)
+    
+    print(f"\n{'='*60}")
+    print(f"{'🔍 재처리 미리보기' if dry_run else '✓ 재처리 완료'} (프로세스 {reprocessor.processes}개)")
+    print(f"   채널: {summary['records']}개 중 {summary['changed_records']}개 변경 "
+          f"(파일 {summary['changed_files']}개)")
+    for field in REPROCESS_FIELDS:
+        if summary['fields'][field]:
+            print(f"   {field:12s} {summary['fields'][field]}개 변경")
+    print(f"{'='*60}")
+
+
+def refresh_files(crawler, files=None, refresh_hours=24, history_file='channel_history.jsonl'):
+    """
+    저장된 채널 파일의 통계 갱신 (검색 없이 channels.list 50개씩 묶음 조회)
+    
+    Args:
+        crawler (YouTubeChannelCrawler): API 호출에 사용할 크롤러
+        files (list): 갱신할 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+        refresh_hours (float): 이 시간 안에 갱신한 채널은 건너뜀
+        history_file (str): 갱신 이력 파일
+    """
+    refresher = ChannelRefresher(crawler, refresh_hours=refresh_hours, history_path=history_file)
+    stats = refresher.refresh(files)
+    
+    crawler.quota.save()
+    crawler.key_pool.save()
+    if crawler.cache is not None:
+        crawler.cache.close()
+    
+    print(f"\n{'='*60}")
+    print(f"✓ 갱신: {stats['updated']}개 채널")
+    if stats['not_modified']:
+        print(f"ℹ️  변경 없음(304): {stats['not_modified']}개 채널")
+    if stats['missing']:
+        print(f"⚠️  조회되지 않음(삭제/비공개): {stats['missing']}개 채널")
+    print(f"🎬 최근 업로드일 조회: {stats['upload_lookups']}회 (동영상 수가 바뀐 채널만)")
+    print(f"💰 할당량 사용: {crawler.quota.used}/{crawler.quota.daily_budget} units")
+    print(f"📜 이력 파일: {history_file}")
+    print(f"{'='*60}")
+
+
+def export_channel_files(files=None, output_dir='exports', fmt='auto', merged=True, only_changed=False):
+    """
+    채널 파일을 분석용 열 형식 파일(Parquet 또는 CSV)로 내보내기
+    
+    Args:
+        files (list): 내보낼 파일 리스트 (None이면 현재 폴더의 모든 *_youtube_channels_*.json(l))
+        output_dir (str): 내보낸 파일을 저장할 폴더
+        fmt (str): 'parquet', 'csv', 'auto'(pyarrow가 있으면 parquet)
+        merged (bool): 전체 키워드 병합본도 만들지 여부
+        only_changed (bool): 지난 내보내기 이후 바뀐 파일만 다시 내보낼지 여부
+    """
+    if fmt == 'parquet' and not parquet_available():
+        print("⚠️  Parquet으로 내보내려면 pyarrow가 필요합니다: pip install pyarrow")
+        return
+    if fmt == 'auto' and not parquet_available():
+        print("ℹ️  pyarrow가 설치되어 있지 않아 CSV로 내보냅니다 (Parquet: pip install pyarrow)")
+    
+    try:
+        written = export_files(files, output_dir=output_dir, fmt=fmt, merged=merged, only_changed=only_changed)
+    except Exception as e:
+        print(f"⚠️  내보내기 실패: {e}")
+        return
+    
+    if not written:
+        if only_changed:
+            print("ℹ️  지난 내보내기 이후 바뀐 채널 파일이 없습니다")
+        else:
+            print("ℹ️  내보낼 채널 파일이 없습니다")
+        return
+    for path in written:
+        print(f"✓ 내보내기: {path}")
+
+
+def query_channels(args, db_file='channels.sqlite3'):
+    """
+    수집한 모든 채널에서 조건에 맞는 채널 검색 (검색 전에 새로 수집된 채널을 DB에 반영)
+    
+    Args:
+        args (argparse.Namespace): query 명령의 인자
+        db_file (str): 채널 검색 DB 파일
+    """
+    database = ChannelDatabase(db_file)
+    try:
+        stats = database.ingest_files(args.files)
+        if stats['records']:
+            print(f"✓ 검색 DB 반영: 파일 {stats['files']}개에서 {stats['records']}개 기록")
+        
+        if args.list_keywords:
+            for keyword, count in database.keywords():
+                print(f"   {keyword:20s} {count}개 채널")
+            return
+        
+        filters = {
+            'korean': True if args.korean else None,
+            'contactable': True if args.contactable else None,
+            'country': args.country,
+            'keyword': args.keyword,
+            'min_subscribers': args.min_subscribers,
+            'max_subscribers': args.max_subscribers,
+            'min_views': args.min_views,
+            'uploaded_within_days': args.uploaded_within_days,
+            'published_within_days': args.published_within_days,
+            'has_email': args.has_email,
+            'text': args.text,
+        }
+        started = time.perf_counter()
+        total = database.count(**filters)
+        channels = database.query(
+            sort=args.sort, descending=not args.asc,
+            limit=args.limit, offset=(args.page - 1) * args.limit, **filters
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        database.close()
+    
+    if args.json:
+        print(json.dumps(channels, ensure_ascii=False, indent=2))
+        return
+    
+    first = (args.page - 1) * args.limit
+    print(f"🔍 {total}개 채널 중 {first + 1 if channels else 0}-{first + len(channels)}번째 "
+          f"(전체 {stats['channels']}개, {elapsed:.1f} ms)")
+    print("-" * 60)
+    for i, channel in enumerate(channels, first + 1):
+        subscribers = channel['subscriber_count']
+        last_upload = (channel['last_upload_date'] or '-')[:10]
+        print(f"{i:4d}. {channel['title']}")
+        print(f"      구독자 {subscribers if subscribers is not None else '-':>9} | 최근 업로드 {last_upload}"
+              f" | {channel['email'] or channel['phone'] or channel['kakao'] or '연락처 없음'}")
+        print(f"      {channel['custom_channel_url'] or channel['channel_url']}")
+    if first + len(channels) < total:
+        print(f"\n➡️  다음 페이지: --page {args.page + 1}")
+
+
+def parse_args(argv=None):
+    """
+    명령행 인자 해석
+    
+    Args:
+        argv (list): 인자 리스트 (None이면 sys.argv 사용)
+    
+    Returns:
+        argparse.Namespace: 해석된 인자
+    """
+    parser = argparse.ArgumentParser(description='YouTube 채널 자동 수집기')
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='동시에 수집할 키워드 수 (기본값: 1 = 순서대로 하나씩)'
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='중단된 이전 실행을 마지막 저장 위치부터 이어서 진행'
+    )
+    parser.add_argument(
+        '--debug-fields', action='store_true',
+        help='엔드포인트별 응답 크기와 필드 선택으로 줄어든 크기 출력 (엔드포인트마다 비교 요청 1회 추가, 할당량 사용)'
+    )
+    parser.add_argument(
+        '-y', '--yes', action='store_true',
+        help='시작 전에 확인(Enter)을 기다리지 않음 (cron 등 터미널이 아닌 환경에서는 자동으로 적용)'
+    )
+    
+    # 명령을 지정하지 않으면 keywords.txt 기반 수집 실행
+    subparsers = parser.add_subparsers(dest='command')
+    compact_parser = subparsers.add_parser('compact', help='.jsonl 채널 파일의 중복 기록 정리')
+    compact_parser.add_argument('files', nargs='*', help='정리할 파일 (기본값: 모든 *_youtube_channels_*.jsonl)')
+    import_parser = subparsers.add_parser('import-json', help='기존 .json 채널 파일을 .jsonl로 옮기기')
+    import_parser.add_argument('files', nargs='*', help='옮길 파일 (기본값: 모든 *_youtube_channels_*.json)')
+    reprocess_parser = subparsers.add_parser('reprocess', help='저장된 채널의 연락처/한국어 필드를 현재 규칙으로 다시 계산')
+    reprocess_parser.add_argument('files', nargs='*', help='재처리할 파일 (기본값: 모든 *_youtube_channels_*.json(l))')
+    reprocess_parser.add_argument('--processes', type=int, default=None, help='작업자 프로세스 수 (기본값: CPU 코어 수)')
+    reprocess_parser.add_argument('--dry-run', action='store_true', help='바뀔 내용만 출력하고 파일은 그대로 둠')
+    refresh_parser = subparsers.add_parser('refresh', help='저장된 채널의 구독자 수, 동영상 수 등 통계 갱신')
+    refresh_parser.add_argument('files', nargs='*', help='갱신할 파일 (기본값: 모든 *_youtube_channels_*.json(l))')
+    refresh_parser.add_argument(
+        '--within-hours', type=float, default=None,
+        help='이 시간 안에 갱신한 채널은 건너뜀 (기본값: 24)'
+    )
+    export_parser = subparsers.add_parser('export', help='채널 파일을 분석용 Parquet/CSV 파일로 내보내기')
+    export_parser.add_argument('files', nargs='*', help='내보낼 파일 (기본값: 모든 *_youtube_channels_*.json(l))')
+    export_parser.add_argument(
+        '--format', dest='fmt', choices=('auto', 'parquet', 'csv'), default='auto',
+        help='저장 형식 (기본값: auto = pyarrow가 있으면 parquet, 없으면 csv)'
+    )
+    export_parser.add_argument('--output-dir', default='exports', help='저장할 폴더 (기본값: exports)')
+    export_parser.add_argument('--no-merged', action='store_true', help='전체 키워드 병합본(all_channels)은 만들지 않음')
+    query_parser = subparsers.add_parser('query', help='수집한 모든 채널에서 조건에 맞는 채널 검색')
+    query_parser.add_argument('files', nargs='*', help='검색 DB에 반영할 파일 (기본값: 모든 *_youtube_channels_*.json(l))')
+    query_parser.add_argument('--korean', action='store_true', help='한국 채널만')
+    query_parser.add_argument('--contactable', action='store_true', help='연락처가 있는 채널만')
+    query_parser.add_argument('--has-email', action='store_true', help='이메일이 있는 채널만')
+    query_parser.add_argument('--country', help='국가 코드 (예: KR)')
+    query_parser.add_argument('--keyword', help='이 키워드로 수집한 채널만')
+    query_parser.add_argument('--text', help='제목이나 설명에 포함된 문구')
+    query_parser.add_argument('--min-subscribers', type=int, help='최소 구독자 수')
+    query_parser.add_argument('--max-subscribers', type=int, help='최대 구독자 수')
+    query_parser.add_argument('--min-views', type=int, help='최소 조회수')
+    query_parser.add_argument('--uploaded-within-days', type=float, help='최근 N일 이내 업로드한 채널만')
+    query_parser.add_argument('--published-within-days', type=float, help='최근 N일 이내 개설한 채널만')
+    query_parser.add_argument(
+        '--sort', choices=tuple(SORT_COLUMNS), default='subscribers', help='정렬 기준 (기본값: subscribers)'
+    )
+    query_parser.add_argument('--asc', action='store_true', help='오름차순 정렬 (기본값: 내림차순)')
+    query_parser.add_argument('--limit', type=int, default=20, help='한 페이지 결과 수 (기본값: 20)')
+    query_parser.add_argument('--page', type=int, default=1, help='페이지 번호 (기본값: 1)')
+    query_parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    query_parser.add_argument('--list-keywords', action='store_true', help='키워드별 채널 수만 출력')
+    
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers는 1 이상이어야 합니다')
+    if args.command == 'query' and (args.limit < 1 or args.page < 1):
+        parser.error('--limit과 --page는 1 이상이어야 합니다')
+    return args
+
+
+def main(argv=None):
     """
     키워드 파일 기반 자동 수집
+    
+    Args:
+        argv (list): 명령행 인자 (None이면 sys.argv 사용)
     """
+    args = parse_args(argv)
+    
+    # API 키가 필요 없는 명령
+    if args.command == 'compact':
+        compact_files(args.files)
+        return
+    if args.command == 'import-json':
+        import_json_files(args.files)
+        return
+    if args.command == 'reprocess':
+        reprocess_files(args.files, processes=args.processes, dry_run=args.dry_run)
+        return
+    if args.command == 'export':
+        export_channel_files(args.files, output_dir=args.output_dir, fmt=args.fmt, merged=not args.no_merged)
+        return
+    if args.command == 'query':
+        query_channels(args)
+        return
+    
     # .env 파일에서 환경 변수 로드
     load_dotenv()
     
-    # 환경 변수에서 API 키 가져오기
-    API_KEY = os.getenv('YOUTUBE_API_KEY')
+    # 환경 변수에서 API 키 가져오기 (여러 개면 YOUTUBE_API_KEYS=키1,키2,...)
+    API_KEYS = load_api_keys_from_env()
     
-    if not API_KEY or API_KEY == 'YOUR_ACTUAL_API_KEY_HERE':
+    if not API_KEYS:
         print("⚠️  오류: API 키가 설정되지 않았습니다!")
         print("📝 .env 파일을 생성하고 다음 내용을 입력하세요:")
         print("   YOUTUBE_API_KEY=your_actual_api_key_here")
+        print("   (키가 여러 개면 YOUTUBE_API_KEYS=key1,key2,key3)")
         print("\n💡 API 키 발급 방법은 README.md를 참고하세요.")
         return
     
+    # 설정
+    MAX_RESULTS_PER_KEYWORD = 50  # 키워드당 50개
+    KOREAN_ONLY = True
+    ORDER = 'relevance'  # 관련성순
+    CONTACTABLE_ONLY = True  # 연락처 있는 것만
+    CHANNEL_AGE_MONTHS = 12  # 채널 개설 기간 제한 (None = 제한 없음, 예: 12 = 1년 이내)
+    LAST_UPLOAD_MONTHS = 6  # 최근 업로드 기간 제한 (None = 제한 없음, 6 = 6개월 이내)
+    MAX_WORKERS = 8  # 최근 업로드일 동시 조회 스레드 수
+    REQUESTS_PER_SECOND = 10  # 초당 최대 API 요청 수
+    CACHE_FILE = 'youtube_api_cache.sqlite3'  # API 응답 캐시 파일 (None = 캐시 사용 안 함)
+    CACHE_MAX_ENTRIES = 50000  # 캐시 최대 저장 개수
+    PER_KEY_DAILY_QUOTA = 10000  # API 키 하나의 하루 할당량 (units)
+    DAILY_QUOTA_BUDGET = PER_KEY_DAILY_QUOTA * len(API_KEYS)  # 하루 사용할 최대 할당량 (units)
+    MAX_SEARCH_ATTEMPTS = 5  # 키워드당 최대 검색 횟수 (남은 예산에 따라 자동으로 줄어듦)
+    MAX_RETRIES = 5  # 일시적인 API 오류 재시도 횟수
+    STORAGE = 'jsonl'  # 저장 방식 ('jsonl' = 수집 즉시 한 줄씩 추가, 'json' = 키워드마다 전체 다시 쓰기)
+    QUOTA_STATE_FILE = 'quota_state.json'  # 오늘 사용한 할당량 기록
+    KEY_USAGE_FILE = 'api_key_usage.json'  # API 키별 오늘 사용량 기록
+    CRAWL_STATE_FILE = 'crawl_state.json'  # 진행 상황 저장 파일 (--resume으로 이어서 진행)
+    INDEX_FILE = 'channel_index.sqlite3'  # 전체 키워드 공통 채널 색인 (None = 사용 안 함)
+    RECHECK_DAYS = 30  # 필터에서 제외된 채널을 다시 조회하기까지의 기간 (일)
+    REFRESH_HOURS = 24  # refresh 명령에서 이 시간 안에 갱신한 채널은 건너뜀
+    HISTORY_FILE = 'channel_history.jsonl'  # refresh 명령의 통계 갱신 이력
+    EXPORT_FORMAT = 'auto'  # 수집 후 분석용 파일 내보내기 ('auto', 'parquet', 'csv', None = 내보내지 않음)
+    EXPORT_DIR = 'exports'  # 내보낸 파일 저장 폴더
+    QUERY_DB_FILE = 'channels.sqlite3'  # query 명령용 채널 검색 DB (수집 후 새 채널 반영, None = 사용 안 함)
+    RUN_REPORT_FILE = 'crawl_report.json'  # 실행 보고서: 엔드포인트/키워드별 호출 수, 응답 시간, 할당량, 제외 개수 (None = 저장 안 함)
+    PROMETHEUS_FILE = None  # 같은 내용을 Prometheus 텍스트 형식으로도 저장 (예: 'crawl_metrics.prom')
+    
+    def create_crawler(index=None):
+        """설정값으로 크롤러 생성 (캐시, 할당량, API 키 풀 포함)"""
+        return YouTubeChannelCrawler(
+            None,
+            max_workers=MAX_WORKERS,
+            requests_per_second=REQUESTS_PER_SECOND,
+            cache=ResponseCache(CACHE_FILE, max_entries=CACHE_MAX_ENTRIES) if CACHE_FILE else None,
+            quota=QuotaTracker(DAILY_QUOTA_BUDGET, state_file=QUOTA_STATE_FILE),
+            max_retries=MAX_RETRIES,
+            key_pool=ApiKeyPool(
+                API_KEYS,
+                client_factory=build_youtube_client,
+                per_key_budget=PER_KEY_DAILY_QUOTA,
+                state_file=KEY_USAGE_FILE
+            ),
+            index=index,
+            payload_stats=PayloadStats() if args.debug_fields else None
+        )
+    
+    if args.command == 'refresh':
+        refresh_hours = REFRESH_HOURS if args.within_hours is None else args.within_hours
+        refresh_files(create_crawler(), args.files, refresh_hours=refresh_hours, history_file=HISTORY_FILE)
+        return
+    
     # 키워드 파일 경로
     KEYWORDS_FILE = 'keywords.txt'
     
@@ -646,16 +1618,31 @@ def main():
         print(f"⚠️  파일 읽기 오류: {e}")
         return
     
-    # 크롤러 초기화
-    crawler = YouTubeChannelCrawler(API_KEY)
+    # 중단된 이전 실행은 --resume일 때만 이어서 진행 (끝난 키워드는 건너뛰고, 진행 중이던 키워드는 저장된 검색 위치부터)
+    checkpoint = CrawlCheckpoint(CRAWL_STATE_FILE)
+    if args.resume:
+        if checkpoint.load():
+            keywords = checkpoint.pending_keywords()
+            print(f"♻️  이전 실행에서 끝나지 않은 키워드 {len(keywords)}개를 이어서 진행합니다")
+        else:
+            print("ℹ️  이어서 진행할 기록이 없습니다 - 처음부터 시작합니다")
+    elif checkpoint.exists():
+        print(f"ℹ️  중단된 이전 실행 기록({CRAWL_STATE_FILE})이 있습니다. 이어서 진행하려면 --resume을 사용하세요")
+        print("   (지금은 처음부터 시작하며 기록을 새로 씁니다)")
     
-    # 설정
-    MAX_RESULTS_PER_KEYWORD = 50  # 키워드당 50개
-    KOREAN_ONLY = True
-    ORDER = 'relevance'  # 관련성순
-    CONTACTABLE_ONLY = True  # 연락처 있는 것만
-    CHANNEL_AGE_MONTHS = 12  # 채널 개설 기간 제한 (None = 제한 없음, 예: 12 = 1년 이내)
-    LAST_UPLOAD_MONTHS = 6  # 최근 업로드 기간 제한 (None = 제한 없음, 6 = 6개월 이내)
+    # 크롤러 초기화
+    index = None
+    if INDEX_FILE:
+        index = ChannelIndex(INDEX_FILE, recheck_days=RECHECK_DAYS)
+        if len(index) == 0:
+            # 처음 만드는 색인은 지금까지 저장된 채널 파일로 채움
+            seeded = index.seed_from_files()
+            if seeded:
+                print(f"✓ 채널 색인 생성: 저장된 파일에서 {seeded}개 채널 등록")
+    crawler = create_crawler(index)
+    cache = crawler.cache
+    quota = crawler.quota
+    key_pool = crawler.key_pool
     
     print("="*60)
     print("🎯 YouTube 채널 자동 수집 시작")
@@ -670,28 +1657,61 @@ def main():
     if LAST_UPLOAD_MONTHS:
         print(f"🎬 최근 활동: {LAST_UPLOAD_MONTHS}개월 이내")
     print(f"📊 정렬: 관련성순")
+    if args.workers > 1:
+        print(f"👷 동시 수집: 키워드 {args.workers}개씩")
+    print(f"🔑 API 키: {len(key_pool)}개 (사용 가능 {key_pool.available_count}개)")
+    print(f"💰 할당량: 오늘 {quota.used}/{quota.daily_budget} units 사용 (남은 예산 {quota.remaining} units)")
     print("="*60)
     print("\n키워드 목록:")
     for i, keyword in enumerate(keywords, 1):
         print(f"  {i}. {keyword}")
     print("\n" + "="*60)
     
-    input("\n계속하려면 Enter를 누르세요... (Ctrl+C로 취소)")
+    # 터미널에서 실행했을 때만 확인을 기다림 (cron, 작업자 프로세스 등은 바로 시작)
+    if not args.yes and sys.stdin.isatty():
+        input("\n계속하려면 Enter를 누르세요... (Ctrl+C로 취소)")
+    
+    checkpoint.start(keywords)
     
     # 전체 수집 통계
     total_collected = 0
     total_failed = 0
     results_summary = []
+    pending_keywords = []  # 할당량 소진으로 처리하지 못한 키워드
     
-    # 각 키워드별로 수집
-    for idx, keyword in enumerate(keywords, 1):
+    # 시작한 키워드 수 (남은 예산을 나눌 때 사용)
+    progress = {'started': 0}
+    progress_lock = threading.Lock()
+    
+    def crawl_keyword(idx, keyword):
+        """
+        키워드 하나 수집 (작업자 스레드에서 실행)
+        
+        Returns:
+            tuple: (결과 dict 또는 None(시작하지 못함), 다음 실행으로 넘길지 여부)
+        """
+        with progress_lock:
+            if quota.exhausted:
+                return None, True
+            
+            # 남은 예산을 아직 시작하지 않은 키워드에 나눠서 이번 키워드의 검색 횟수 결정
+            search_attempts = quota.search_attempts_for_keyword(
+                len(keywords) - progress['started'],
+                max_attempts=MAX_SEARCH_ATTEMPTS
+            )
+            if search_attempts == 0:
+                print(f"\n⛔ 남은 할당량({quota.remaining} units)으로는 '{keyword}'를 검색할 수 없습니다.")
+                return None, True
+            progress['started'] += 1
+        
         print(f"\n\n{'#'*60}")
         print(f"# 진행: {idx}/{len(keywords)} - '{keyword}'")
+        print(f"# 검색 횟수 한도: {search_attempts}회 (남은 할당량 {quota.remaining} units)")
         print(f"{'#'*60}\n")
         
         try:
             # 채널 정보 크롤링
-            channels, data_file = crawler.crawl(
+            channels, data_file, new_count = crawler.crawl(
                 keyword,
                 max_results=MAX_RESULTS_PER_KEYWORD,
                 korean_only=KOREAN_ONLY,
@@ -700,56 +1720,87 @@ def main():
                 update_mode=True,
                 contactable_only=CONTACTABLE_ONLY,
                 channel_age_months=CHANNEL_AGE_MONTHS,
-                last_upload_months=LAST_UPLOAD_MONTHS
+                last_upload_months=LAST_UPLOAD_MONTHS,
+                max_search_attempts=search_attempts,
+                storage=STORAGE,
+                checkpoint=checkpoint
             )
             
-            # JSON 파일로 저장
-            crawler.save_to_json(channels, data_file)
-            
-            # 새로 추가된 채널 수 계산 (전체에서 기존 데이터 제외)
-            new_count = len([ch for ch in channels if ch.get('channel_id')])
+            if STORAGE == 'jsonl':
+                # 수집하면서 이미 기록됨 (channels는 새로 추가된 채널)
+                total_count = len(JsonlChannelStore(data_file).load_ids())
+            else:
+                # JSON 파일로 저장
+                crawler.save_to_json(channels, data_file)
+                total_count = len(channels)
             
             # 통계 저장
             result = {
                 'keyword': keyword,
                 'file': data_file,
-                'total': len(channels),
+                'total': total_count,
                 'new': new_count,
-                'contactable': sum(1 for ch in channels if ch.get('contactable'))
+                'contactable': sum(1 for ch in channels if ch.contactable)
             }
-            results_summary.append(result)
-            total_collected += new_count
             
             print(f"\n✅ '{keyword}' 완료!")
             print(f"   파일: {data_file}")
-            print(f"   수집: {len(channels)}개 (전체)")
+            print(f"   수집: {total_count}개 (전체)")
             
         except Exception as e:
             print(f"\n❌ '{keyword}' 실패: {e}")
-            total_failed += 1
-            results_summary.append({
+            result = {
                 'keyword': keyword,
                 'file': None,
                 'total': 0,
                 'new': 0,
                 'contactable': 0,
                 'error': str(e)
-            })
+            }
         
-        # 마지막 키워드가 아니면 잠시 대기
-        if idx < len(keywords):
-            print(f"\n⏳ 다음 키워드로 이동... (잠시 대기)")
-            import time
-            time.sleep(2)
+        # 할당량이 모자라 멈췄거나 실패했으면 이 키워드는 다음 --resume에서 이어서 진행
+        stopped = quota.exhausted or keyword in crawler.quota_stopped
+        if 'error' not in result and not stopped:
+            checkpoint.complete_keyword(keyword)
+        return result, stopped
+    
+    # 각 키워드별로 수집 (작업자가 여러 명이면 키워드를 동시에 처리, 결과는 키워드 순서대로 정리)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        outcomes = list(executor.map(crawl_keyword, range(1, len(keywords) + 1), keywords))
+    
+    for keyword, (result, pending) in zip(keywords, outcomes):
+        if result is not None:
+            results_summary.append(result)
+            if 'error' in result:
+                total_failed += 1
+            else:
+                total_collected += result['new']
+        if pending:
+            pending_keywords.append(keyword)
+    
+    # 진행 상황 저장 (다음 --resume에서 이어서 진행) 또는 모두 끝났으면 정리
+    quota.save()
+    key_pool.save()
+    if checkpoint.pending_keywords():
+        checkpoint.save()
+    else:
+        checkpoint.clear()
     
     # 최종 결과 요약
     print("\n\n" + "="*60)
-    print("🎉 전체 수집 완료!")
+    if pending_keywords:
+        print("⛔ 할당량 소진으로 수집 중단")
+    else:
+        print("🎉 전체 수집 완료!")
     print("="*60)
     print(f"\n📊 최종 통계:")
-    print(f"   처리한 키워드: {len(keywords)}개")
-    print(f"   성공: {len(keywords) - total_failed}개")
+    print(f"   처리한 키워드: {len(results_summary)}개")
+    print(f"   성공: {len(results_summary) - total_failed}개")
     print(f"   실패: {total_failed}개")
+    if pending_keywords:
+        print(f"   남은 키워드: {len(pending_keywords)}개 → 할당량 초기화 후 --resume으로 실행하면 이어서 진행합니다 ({CRAWL_STATE_FILE})")
+    if total_failed:
+        print(f"   실패한 키워드는 --resume으로 실행하면 다시 시도합니다 ({CRAWL_STATE_FILE})")
     
     print(f"\n📋 키워드별 결과:")
     print("-" * 60)
@@ -767,6 +1818,90 @@ def main():
         if result['file']:
             print(f"   • {result['file']}")
     
+    if EXPORT_FORMAT:
+        # 이번에 바뀐 키워드 파일만 분석용 형식으로 다시 내보내고,
+        # 전체 키워드 병합본은 이미 내보낸 키워드별 파일을 합쳐서 갱신
+        print("\n" + "="*60)
+        print(f"📦 분석용 내보내기 ({EXPORT_DIR}/):")
+        print("-" * 60)
+        export_channel_files(output_dir=EXPORT_DIR, fmt=EXPORT_FORMAT, only_changed=True)
+    
+    if QUERY_DB_FILE:
+        # 검색 DB에 이번에 추가된 채널 반영 (바뀐 파일, 추가된 줄만 읽음)
+        database = ChannelDatabase(QUERY_DB_FILE)
+        stats = database.ingest_files()
+        database.close()
+        print(f"\n🔍 검색 DB: {stats['channels']}개 채널 ({QUERY_DB_FILE}, 이번에 {stats['records']}개 기록 반영)")
+    
+    if cache is not None:
+        print("\n" + "="*60)
+        print("🗄️  API 응답 캐시:")
+        print("-" * 60)
+        for endpoint, counts in cache.stats().items():
+            print(f"   {endpoint:15s} 적중 {counts['hits']}회 / 요청 {counts['misses']}회")
+        cache.close()
+    
+    if index is not None:
+        print(f"\n🗂️  채널 색인: {len(index)}개 채널 ({INDEX_FILE})")
+        index.close()
+    
+    crawler.metrics.record_startup('import', IMPORT_SECONDS)
+    if crawler.metrics.first_request_at is not None:
+        crawler.metrics.record_startup('first_request', crawler.metrics.first_request_at - IMPORT_STARTED)
+    
+    report = crawler.metrics.report()
+    print("\n" + "="*60)
+    print("⏱️  API 응답 시간 (실제 요청, 캐시 제외):")
+    print("-" * 60)
+    for endpoint, summary in report['endpoints'].items():
+        latency = summary['latency_ms']
+        errors = ', '.join(f"{code}: {count}회" for code, count in summary['errors'].items())
+        print(f"   {endpoint:15s} {summary['calls']:5d}회 | p50 {latency['p50']} ms, p95 {latency['p95']} ms, "
+              f"p99 {latency['p99']} ms" + (f" | 오류 {errors}" if errors else ""))
+    startup = report['startup']
+    print(f"   ⚡ 시작: 모듈 로드 {startup['import'] * 1000:.0f} ms"
+          + (f", 첫 API 요청까지 {startup['first_request'] * 1000:.0f} ms" if 'first_request' in startup else ""))
+    if report['totals']['accepted']:
+        print(f"   💰 수집 채널당 할당량: {report['totals']['units_per_accepted']} units "
+              f"({report['totals']['units']} units / {report['totals']['accepted']}개)")
+    if RUN_REPORT_FILE:
+        crawler.metrics.write_report(RUN_REPORT_FILE)
+        print(f"   📄 실행 보고서: {RUN_REPORT_FILE} (키워드별 할당량, 필터별 제외 개수 포함)")
+    if PROMETHEUS_FILE:
+        crawler.metrics.write_prometheus(PROMETHEUS_FILE)
+        print(f"   📈 Prometheus 메트릭: {PROMETHEUS_FILE}")
+    
+    print("\n" + "="*60)
+    print(f"💰 할당량 사용: {quota.used}/{quota.daily_budget} units (기준일 {quota.day})")
+    print("-" * 60)
+    for endpoint, units in quota.used_by_endpoint.items():
+        print(f"   {endpoint:15s} {units} units")
+    
+    print(f"\n🔑 API 키별 사용량:")
+    print("-" * 60)
+    for usage in key_pool.usage():
+        status = '소진' if usage['exhausted'] else '사용 가능'
+        print(f"   {usage['label']:10s} {usage['used']:6d}/{usage['daily_budget']} units ({status})")
+    
+    limiter = crawler.rate_limiter
+    print(f"\n⏱️  요청 속도: 현재 초당 {limiter.requests_per_second or '무제한'}회 "
+          f"(성공 {limiter.successes}회, 재시도한 오류 {limiter.errors}회)")
+    
+    if crawler.payload_stats is not None:
+        print("\n📦 응답 크기 (필드 선택 전 크기는 엔드포인트마다 한 번 비교 요청으로 추정):")
+        print("-" * 60)
+        for endpoint, sizes in crawler.payload_stats.summary().items():
+            line = f"   {endpoint:15s} {sizes['requests']:5d}회 | {sizes['bytes'] / 1024:9.1f} KB"
+            if sizes['full_bytes'] is not None:
+                line += (f" (선택 전 약 {sizes['full_bytes'] / 1024:.1f} KB, "
+                         f"{sizes['saved_bytes'] / 1024:.1f} KB 절약 {sizes['saved_ratio']:.0%})")
+            print(line)
+    
+    connections = crawler.transport.stats()
+    print(f"🔌 HTTP 연결: 새 연결 {connections['created']}개, 재사용 {connections['reused']}회 "
+          f"(연결 오류로 교체 {connections['discarded']}회)")
+    crawler.transport.close()
+    
     print("\n✨ 모든 작업이 완료되었습니다!")
     print("="*60)
 